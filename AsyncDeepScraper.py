@@ -0,0 +1,118 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+from HTTPBrowser import HTTPBrowser, HTMLDocument
+from Metrics import metrics
+
+
+class AsyncDeepScraper:
+    """
+    Deep scrapes events concurrently, fetching their web pages over plain HTTP on a pool of worker threads
+
+    The fetches themselves are blocking urllib3 requests, run on a thread pool of `concurrency` threads. An asyncio
+    event loop (one for the whole scrape) only schedules them: it holds each event page back until fewer than
+    `concurrency` event pages are in flight, and fewer than `per_host_concurrency` of them are requested from the
+    same host, so a busy host does not tie up the worker threads. Event pages are not rendered, so no JavaScript is
+    run on them.
+
+    Attributes
+    ----------
+    parse_page : function
+        function(page, evt) that scrapes the data of an event from its (parsed) web page
+    concurrency : int
+        maximum number of event pages being fetched at once
+    per_host_concurrency : int
+        maximum number of event pages being fetched at once from the same host
+    browser : HTTPBrowser
+        the HTTP browser whose pooled connections are used to fetch event pages
+    cache : PageCache
+        the page cache event pages are read through (None if pages are not cached)
+    rate_limiter : RateLimiter
+        rate limiter that every event page request waits for (None if requests are not rate limited)
+
+    Methods
+    -------
+    deep_scrape_events(events)
+        `deep scrape` a list of events concurrently
+    close()
+        closes the event loop, the pooled connections, and the worker threads
+    """
+
+    def __init__(self, parse_page, concurrency=8, per_host_concurrency=None, timeout=10, cache=None,
+                 rate_limiter=None):
+        """
+        Parameters
+        ----------
+        parse_page : function
+            function(page, evt) that scrapes the data of an event from its (parsed) web page
+        concurrency : int
+            maximum number of event pages being fetched at once (default 8)
+        per_host_concurrency : int
+            maximum number of event pages being fetched at once from the same host (default `concurrency`)
+        timeout : int
+            number of seconds to wait for an event page to load before timing out (default 10 seconds)
+        cache : PageCache
+            the page cache event pages are read through (default None)
+        rate_limiter : RateLimiter
+            rate limiter that every event page request waits for, which may lower the number of event pages in
+            flight below `concurrency` (default None)
+        """
+
+        self.parse_page = parse_page
+        self.concurrency = concurrency
+        self.per_host_concurrency = per_host_concurrency or concurrency
+        self.browser = HTTPBrowser(timeout=timeout, max_connections=self.per_host_concurrency,
+                                   rate_limiter=rate_limiter)
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self._executor = ThreadPoolExecutor(max_workers=concurrency)
+        # The event loop and its limits are kept across list pages (the limits are created on the loop's first run)
+        self._loop = asyncio.new_event_loop()
+        self._in_flight = None
+        self._host_limits = {}
+
+    def _fetch_and_parse(self, evt):
+        # Download and parse the event's web page, then scrape its data (runs on a worker thread)
+        with metrics.timer('deep_scrape_seconds'):
+            page = HTMLDocument(self.browser.fetch(evt.link, cache=self.cache), evt.link)
+            self.parse_page(page, evt)
+        metrics.increment('events_deep_scraped')
+
+    async def _deep_scrape(self, evt):
+        host = urlsplit(evt.link).netloc
+        if host not in self._host_limits:
+            self._host_limits[host] = asyncio.Semaphore(self.per_host_concurrency)
+        # Wait for both a free global slot and a free slot for this event's host, then fetch on a worker thread
+        async with self._in_flight, self._host_limits[host]:
+            await self._loop.run_in_executor(self._executor, self._fetch_and_parse, evt)
+
+    async def _deep_scrape_all(self, events):
+        if self._in_flight is None:
+            self._in_flight = asyncio.Semaphore(self.concurrency)
+        await asyncio.gather(*(self._deep_scrape(evt) for evt in events))
+
+    def deep_scrape_events(self, events):
+        """`Deep scrape` a list of events concurrently.
+
+        Parameters
+        ----------
+        events : list
+            The events that will have their data scraped
+
+        Raises
+        ------
+        HTTPStatusError
+            If an event page is answered with an HTTP error status code.
+        MaxRetryError
+            If a connection to the server cannot be established.
+        """
+
+        if events:
+            self._loop.run_until_complete(self._deep_scrape_all(events))
+
+    def close(self):
+        """Closes the event loop, the pooled connections, and the worker threads."""
+
+        self._loop.close()
+        self._executor.shutdown(wait=False)
+        self.browser.quit()
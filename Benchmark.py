@@ -0,0 +1,340 @@
+import io
+import os
+import sys
+import json
+import random
+import tempfile
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+from Event import Event
+from EventIndex import EventIndex
+from EventParser import clear_caches
+from EventWriter import yaml, pa
+from Utility import (extract_date_time, extract_contact_info, print_event, export_json, export_ndjson, export_xml,
+                     export_yaml, export_parquet, export_arrow, get_arg_value, InvalidArgumentsError)
+
+
+# Usage message that represents the correct command line usage.
+USAGE_STR = '''usage: python Benchmark.py (--events <n>) (--repeat <n>) (--seed <n>) (--baseline <baseline_path>)
+       (--threshold <percent>) (--save-baseline)'''
+
+# Set of allowed command line arguments.
+ALLOWED_FLAGS = {'--events', '--repeat', '--seed', '--baseline', '--threshold', '--save-baseline'}
+
+# Default file path of the stored baseline results.
+DEFAULT_BASELINE_PATH = 'benchmark_baseline.json'
+
+# Pieces that synthetic events are made of.
+TITLES = ['Career Fair', 'Graduate Seminar: Machine Learning', 'Jazz Ensemble & Friends', 'Yoga in the Union',
+          'Thesis Defense', 'Blood Drive', 'Study Abroad Info Session', 'Hackathon Kickoff']
+LOCATIONS = ['Student Union 145', 'Davis Hall 101', 'Slee Hall, Lippes Concert Hall', 'Online', 'Alumni Arena',
+             'Capen Hall 10 (Silverman Library)']
+NAMES = ['Jane Doe', 'Smith, Bob', 'Mary-Ann O Neil', 'Office of Student Life', 'Career Design Center']
+DOMAINS = ['buffalo.edu', 'mail.buffalo.edu', 'gmail.com']
+ADDITIONAL_INFO = [{}, {'Cost': 'Free'}, {'Cost': '$5 students', 'Website': 'https://www.buffalo.edu/'},
+                   {'Audience': 'Graduate Students, Faculty', 'Type': 'Lecture', 'Cost': 'Free'}]
+
+
+def _random_time(rng):
+    # A time in the formats the calendar uses, with and without a leading zero
+    hour, minute = rng.randint(1, 12), rng.choice([0, 15, 30, 45])
+    return '{}:{:02d} {}'.format('{:02d}'.format(hour) if rng.random() < 0.3 else hour, minute, rng.choice('AP') + 'M')
+
+
+def _random_date(rng):
+    # A date in the formats the calendar uses, with and without leading zeros
+    month, day, year = rng.randint(1, 12), rng.randint(1, 28), rng.choice([2025, 2026, 2027])
+    if rng.random() < 0.3:
+        return '{:02d}/{:02d}/{}'.format(month, day, year)
+    return '{}/{}/{}'.format(month, day, year)
+
+
+def generate_raw_date_time(rng):
+    """Generate a raw date & time string like the ones on the calendar's list pages.
+
+    Parameters
+    ----------
+    rng : Random
+        The random number generator to draw from
+
+    Returns
+    -------
+    str
+        A single day event (with or without an end time), a multi-day event, or an `All Day` event
+    """
+
+    kind = rng.random()
+    if kind < 0.4:
+        return '{} {} - {}'.format(_random_date(rng), _random_time(rng), _random_time(rng))
+    if kind < 0.55:
+        return '{} {}'.format(_random_date(rng), _random_time(rng))
+    if kind < 0.8:
+        return 'Starts: {} {}\nEnds: {} {}'.format(_random_date(rng), _random_time(rng), _random_date(rng),
+                                                   _random_time(rng))
+    return '{} All Day'.format(_random_date(rng))
+
+
+def generate_raw_contact(rng):
+    """Generate a messy raw contact information string like the ones on the calendar's event pages.
+
+    Parameters
+    ----------
+    rng : Random
+        The random number generator to draw from
+
+    Returns
+    -------
+    str
+        Contact information with a varying number of names, phone numbers (in varying formats), and emails
+    """
+
+    name = rng.choice(NAMES)
+    lines = [name] * rng.randint(0, 2)
+    for _ in range(rng.randint(0, 2)):
+        lines.append(rng.choice(['{}-{}-{}', '({}) {} {}', '{}{}{}']).format(
+            rng.choice([716, 585, 212]), rng.randint(100, 999), rng.randint(1000, 9999)))
+    for _ in range(rng.randint(0, 2)):
+        lines.append('{}@{}'.format(name.split()[0].lower().strip(','), rng.choice(DOMAINS)))
+    if rng.random() < 0.3:
+        lines.append('Room {}, {}'.format(rng.randint(1, 400), rng.choice(LOCATIONS)))
+    rng.shuffle(lines)
+    return rng.choice(['\n', '\n\n', ' \n']).join(lines)
+
+
+def generate_corpus(size, seed=0):
+    """Generate a synthetic corpus of raw event strings and scraped events.
+
+    Parameters
+    ----------
+    size : int
+        The number of events in the corpus
+    seed : int
+        The seed of the random number generator, so that runs are comparable (default 0)
+
+    Returns
+    -------
+    tuple (list, list, list)
+        The raw date & time strings, the raw contact information strings, and the (deep scraped) events
+    """
+
+    rng = random.Random(seed)
+    raw_date_times = [generate_raw_date_time(rng) for _ in range(size)]
+    raw_contacts = [generate_raw_contact(rng) for _ in range(size)]
+    events = []
+    for i, (raw_date_time, raw_contact) in enumerate(zip(raw_date_times, raw_contacts)):
+        start, end = extract_date_time(raw_date_time, 'US/Eastern')
+        evt = Event(rng.choice(TITLES), 'https://calendar.buffalo.edu/event/{}'.format(i), start, end)
+        evt.description = ' '.join(rng.choice(TITLES) for _ in range(rng.randint(5, 40)))
+        evt.location = rng.choice(LOCATIONS)
+        evt.contact = extract_contact_info(raw_contact)
+        evt.additional_info = dict(rng.choice(ADDITIONAL_INFO))
+        events.append(evt)
+    return raw_date_times, raw_contacts, events
+
+
+def measure(func, ops, repeat, setup=None):
+    """Measure the throughput and memory use of a benchmark.
+
+    Parameters
+    ----------
+    func : function
+        function() that runs `ops` operations of the benchmark
+    ops : int
+        The number of operations that one call of `func` runs
+    repeat : int
+        The number of times to time `func` (the fastest time is kept)
+    setup : function
+        function() that is run (untimed) before every call of `func` (default None)
+
+    Returns
+    -------
+    dict
+        The operations per second of the fastest run, and the peak traced memory (in bytes) of one run
+    """
+
+    # Time the benchmark with tracing turned off, since tracing slows down every allocation
+    best = float('inf')
+    for _ in range(repeat):
+        if setup:
+            setup()
+        begin = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - begin)
+
+    # Run the benchmark once more to trace its memory allocations
+    if setup:
+        setup()
+    tracemalloc.start()
+    func()
+    peak_bytes = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {'ops_per_sec': ops / best, 'peak_bytes': peak_bytes}
+
+
+def run_benchmarks(size, repeat, seed=0):
+    """Run every benchmark over a synthetic corpus.
+
+    Parameters
+    ----------
+    size : int
+        The number of events in the corpus
+    repeat : int
+        The number of times each benchmark is timed
+    seed : int
+        The seed of the corpus' random number generator (default 0)
+
+    Returns
+    -------
+    dict
+        The results of each benchmark, keyed by name
+    """
+
+    raw_date_times, raw_contacts, events = generate_corpus(size, seed)
+    evt_dicts = [evt.to_dict() for evt in events]
+
+    # One week long queries spread over the corpus, every other one also searching for a word
+    rng = random.Random(seed)
+    index = EventIndex(events)
+    queries = [(evt.start_ts, evt.start_ts + 7 * 86400, rng.choice(TITLES).split()[0] if i % 2 else None)
+               for i, evt in enumerate(rng.sample(events, len(events)))]
+
+    def print_all():
+        with redirect_stdout(io.StringIO()):
+            for evt in events:
+                print_event(evt)
+
+    benchmarks = {
+        'extract_date_time': lambda: [extract_date_time(raw, 'US/Eastern') for raw in raw_date_times],
+        'extract_contact_info': lambda: [extract_contact_info(raw) for raw in raw_contacts],
+        'print_event': print_all,
+        'event_index_build': lambda: EventIndex(events),
+        'event_index_query': lambda: [index.query(start, end, keyword) for start, end, keyword in queries],
+    }
+
+    results = {}
+    with tempfile.TemporaryDirectory() as export_dir:
+        exporters = [('export_json', export_json, 'json'), ('export_ndjson', export_ndjson, 'ndjson'),
+                     ('export_xml', export_xml, 'xml')]
+        # Only benchmark the exporters whose optional dependencies are installed
+        if yaml is not None:
+            exporters.append(('export_yaml', export_yaml, 'yaml'))
+        if pa is not None:
+            exporters += [('export_parquet', export_parquet, 'parquet'), ('export_arrow', export_arrow, 'arrow')]
+        for name, export, extension in exporters:
+            export_path = os.path.join(export_dir, 'events.' + extension)
+            benchmarks[name] = lambda export=export, export_path=export_path: export(evt_dicts, export_path)
+
+        # Time the parsers from scratch, rather than from the memoized results of generating the corpus (or of the
+        # previous run)
+        for name, func in benchmarks.items():
+            setup = clear_caches if name.startswith('extract_') else None
+            results[name] = measure(func, size, repeat, setup)
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Compare benchmark results against baseline results.
+
+    Parameters
+    ----------
+    results : dict
+        The results of each benchmark, keyed by name
+    baseline : dict
+        The baseline results of each benchmark, keyed by name
+    threshold : float
+        The fraction (e.g. 0.2 for 20%) that a benchmark may be slower, or use more memory, than its baseline
+
+    Returns
+    -------
+    list
+        A description of each regression (empty if no benchmark regressed)
+    """
+
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        expected = baseline[name]
+        if result['ops_per_sec'] < expected['ops_per_sec'] * (1 - threshold):
+            regressions.append('{}: {:,.0f} ops/sec, baseline {:,.0f} ops/sec'
+                               .format(name, result['ops_per_sec'], expected['ops_per_sec']))
+        if result['peak_bytes'] > expected['peak_bytes'] * (1 + threshold):
+            regressions.append('{}: {:,} peak bytes, baseline {:,} peak bytes'
+                               .format(name, result['peak_bytes'], expected['peak_bytes']))
+    return regressions
+
+
+def print_results(results, baseline):
+    """Print out a table of benchmark results (and their change from the baseline) to the command line.
+
+    Parameters
+    ----------
+    results : dict
+        The results of each benchmark, keyed by name
+    baseline : dict
+        The baseline results of each benchmark, keyed by name
+    """
+
+    print('{:<24} {:>14} {:>10} {:>14} {:>10}'.format('benchmark', 'ops/sec', 'change', 'peak KiB', 'change'))
+    for name, result in results.items():
+        expected = baseline.get(name)
+        speed_change = '{:+.1%}'.format(result['ops_per_sec'] / expected['ops_per_sec'] - 1) if expected else '-'
+        memory_change = '{:+.1%}'.format(result['peak_bytes'] / expected['peak_bytes'] - 1) if expected else '-'
+        print('{:<24} {:>14,.0f} {:>10} {:>14,.1f} {:>10}'.format(name, result['ops_per_sec'], speed_change,
+                                                                 result['peak_bytes'] / 1024, memory_change))
+
+
+def main():
+    """Main method to benchmark the parsers and exporters, and check them for regressions against a baseline."""
+
+    # Check if the user used an invalid argument. If so, terminate the program with exit code 1.
+    invalid_args = set(filter(lambda x: x.startswith('--'), sys.argv)) - ALLOWED_FLAGS
+    if invalid_args:
+        print('`{}` is not a valid argument.'.format(next(iter(invalid_args))))
+        print(USAGE_STR)
+        sys.exit(1)
+
+    try:
+        size = get_arg_value(sys.argv, '--events', int, 2000)
+        repeat = get_arg_value(sys.argv, '--repeat', int, 5)
+        seed = get_arg_value(sys.argv, '--seed', int, 0)
+        baseline_path = get_arg_value(sys.argv, '--baseline', str, DEFAULT_BASELINE_PATH)
+        threshold = get_arg_value(sys.argv, '--threshold', float, 20) / 100
+    except InvalidArgumentsError as e:
+        print('{}: {}'.format(e.__class__.__name__, str(e)))
+        print(USAGE_STR)
+        sys.exit(1)
+
+    # Without a baseline there is nothing to check for regressions, so fail unless the baseline is being saved
+    baseline = {}
+    if os.path.isfile(baseline_path):
+        with open(baseline_path) as f:
+            baseline = json.load(f)
+    elif '--save-baseline' not in sys.argv:
+        print('No baseline found at `{}`. Run with `--save-baseline` to store one first.'.format(baseline_path))
+        sys.exit(1)
+
+    results = run_benchmarks(size, repeat, seed)
+    print_results(results, baseline)
+
+    # Store the results as the new baseline
+    if '--save-baseline' in sys.argv:
+        with open(baseline_path, 'w') as f:
+            json.dump(results, f, indent=4)
+        print('Saved baseline to `{}`.'.format(baseline_path))
+        sys.exit(0)
+
+    # Terminate the program with exit code 1 if any benchmark regressed past the threshold
+    regressions = compare(results, baseline, threshold)
+    if regressions:
+        print('Regressions past the {:.0%} threshold:'.format(threshold))
+        for regression in regressions:
+            print('  ' + regression)
+        sys.exit(1)
+    sys.exit(0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,263 @@
+import os
+import sys
+import json
+import time
+import signal
+import subprocess
+from selenium import webdriver
+from selenium.webdriver.chrome.remote_connection import ChromeRemoteConnection
+from selenium.webdriver.common import utils
+from selenium.webdriver.remote.webdriver import WebDriver as RemoteWebDriver
+from selenium.common.exceptions import WebDriverException
+from urllib3.exceptions import HTTPError
+
+
+# Usage message that represents the correct command line usage.
+USAGE_STR = 'usage: python BrowserSession.py --quit <session_path>'
+
+# Number of seconds a newly launched ChromeDriver has to start listening before it is given up on.
+DRIVER_START_TIMEOUT = 30
+
+
+class RemoteChrome(webdriver.Chrome):
+    """
+    Chrome WebDriver that talks to an already running ChromeDriver, instead of starting (and owning) its own
+
+    Given a session id, the WebDriver attaches to that existing session. Otherwise, it starts a new session on the
+    ChromeDriver. Either way, quitting the WebDriver ends the session but leaves the ChromeDriver running.
+
+    Attributes
+    ----------
+    executor_url : str
+        the url of the ChromeDriver the session runs on
+    """
+
+    def __init__(self, executor_url, session_id=None, w3c=True, options=None, desired_capabilities=None):
+        """
+        Parameters
+        ----------
+        executor_url : str
+            The url of the running ChromeDriver
+        session_id : str
+            The id of the session to attach to (default None -- start a new session)
+        w3c : bool
+            Whether or not the attached session speaks the W3C WebDriver protocol (default True)
+        options : ChromeOptions
+            Options of the Chrome session started if no session id is given (default None)
+        desired_capabilities : dict
+            Capabilities of the Chrome session started if no session id is given (default None)
+        """
+
+        self.service = None
+        self.executor_url = executor_url
+        self._attach_to = (session_id, w3c)
+        capabilities = dict(desired_capabilities or webdriver.DesiredCapabilities.CHROME)
+        if options:
+            capabilities.update(options.to_capabilities())
+        RemoteWebDriver.__init__(self, command_executor=ChromeRemoteConnection(remote_server_addr=executor_url,
+                                                                               keep_alive=True),
+                                 desired_capabilities=capabilities)
+
+    def start_session(self, capabilities, browser_profile=None):
+        session_id, w3c = self._attach_to
+        if session_id is None:
+            RemoteWebDriver.start_session(self, capabilities, browser_profile)
+            return
+        # Attach to the existing session instead of asking the ChromeDriver for a new one
+        self.session_id = session_id
+        self.w3c = w3c
+        self.command_executor.w3c = w3c
+        self.capabilities = {}
+
+    def quit(self):
+        RemoteWebDriver.quit(self)
+
+
+def is_alive(browser):
+    """Sees whether or not a WebDriver's session still responds.
+
+    Parameters
+    ----------
+    browser : WebDriver
+        The WebDriver to check
+
+    Returns
+    -------
+    bool
+        True if the session responds, False otherwise
+    """
+
+    try:
+        browser.window_handles
+        return True
+    except (WebDriverException, HTTPError, OSError):
+        return False
+
+
+def attach_to_chrome(driver_path, debugger_address, desired_capabilities):
+    """Attaches a new ChromeDriver to a Google Chrome that is already running with remote debugging enabled.
+
+    Chrome has to have been started with `--remote-debugging-port`, and keeps running (and keeps its cache) when
+    the WebDriver quits. Command line switches (e.g. headless) and preferences do not apply to a running Chrome.
+
+    Parameters
+    ----------
+    driver_path : str
+        Path to the ChromeDriver executable
+    debugger_address : str
+        The `host:port` that Chrome's remote debugging listens on
+    desired_capabilities : dict
+        Capabilities of the Chrome session
+
+    Returns
+    -------
+    WebDriver
+        The attached WebDriver, or None if no Chrome is listening at `debugger_address`
+    """
+
+    options = webdriver.ChromeOptions()
+    options.debugger_address = debugger_address
+    try:
+        return webdriver.Chrome(driver_path, chrome_options=options, desired_capabilities=desired_capabilities)
+    except WebDriverException:
+        return None
+
+
+def _start_driver(driver_path):
+    # Start a ChromeDriver in its own process group, so that it outlives this program, and wait for it to listen
+    port = utils.free_port()
+    process = subprocess.Popen([driver_path, '--port={}'.format(port)], stdin=subprocess.DEVNULL,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True)
+    deadline = time.monotonic() + DRIVER_START_TIMEOUT
+    while not utils.is_connectable(port):
+        if process.poll() is not None or time.monotonic() > deadline:
+            process.kill()
+            raise WebDriverException('ChromeDriver at `{}` did not start'.format(driver_path))
+        time.sleep(0.1)
+    return 'http://127.0.0.1:{}'.format(port), process.pid
+
+
+def load_session(session_path):
+    """Loads a persisted WebDriver session.
+
+    Parameters
+    ----------
+    session_path : str
+        The file path of the persisted session
+
+    Returns
+    -------
+    dict
+        The url, process id, and session id of the session's ChromeDriver, or None if no session was persisted
+    """
+
+    try:
+        with open(session_path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_session(session_path, browser, driver_pid):
+    """Persists a WebDriver session so that later runs can attach to it.
+
+    Parameters
+    ----------
+    session_path : str
+        The file path of the persisted session
+    browser : RemoteChrome
+        The WebDriver of the session
+    driver_pid : int
+        The process id of the session's ChromeDriver
+    """
+
+    # Write the session to a temporary file first, so that an interrupted write never leaves a broken session file
+    temp_path = session_path + '.tmp'
+    with open(temp_path, 'w') as f:
+        json.dump({'executor_url': browser.executor_url, 'driver_pid': driver_pid, 'session_id': browser.session_id,
+                   'w3c': browser.w3c}, f)
+    os.replace(temp_path, session_path)
+
+
+def open_persistent_session(driver_path, session_path, options, desired_capabilities):
+    """Opens the persisted WebDriver session, or a new one that is persisted in its place.
+
+    The persisted session is attached to if it still responds. If it does not, a new session is started on the
+    persisted ChromeDriver if that is still running, or else on a newly launched ChromeDriver. The ChromeDriver and
+    its Google Chrome keep running after this program exits, so that the next run starts warm.
+
+    Parameters
+    ----------
+    driver_path : str
+        Path to the ChromeDriver executable
+    session_path : str
+        The file path of the persisted session
+    options : ChromeOptions
+        Options of a newly started Chrome session
+    desired_capabilities : dict
+        Capabilities of a newly started Chrome session
+
+    Returns
+    -------
+    RemoteChrome
+        The WebDriver of the session
+    """
+
+    session = load_session(session_path)
+    if session:
+        # Attach to the persisted session if it still responds
+        browser = RemoteChrome(session['executor_url'], session['session_id'], session['w3c'])
+        if is_alive(browser):
+            return browser
+
+        # Else, start a new session on the persisted ChromeDriver if it is still running
+        try:
+            browser = RemoteChrome(session['executor_url'], options=options,
+                                   desired_capabilities=desired_capabilities)
+            save_session(session_path, browser, session['driver_pid'])
+            return browser
+        except (WebDriverException, HTTPError, OSError):
+            pass
+
+    # Else, launch a new ChromeDriver and start a new session on it
+    executor_url, driver_pid = _start_driver(driver_path)
+    browser = RemoteChrome(executor_url, options=options, desired_capabilities=desired_capabilities)
+    save_session(session_path, browser, driver_pid)
+    return browser
+
+
+def quit_persistent_session(session_path):
+    """Quits the persisted WebDriver session, stops its ChromeDriver, and removes the session file.
+
+    Parameters
+    ----------
+    session_path : str
+        The file path of the persisted session
+    """
+
+    session = load_session(session_path)
+    if not session:
+        return
+    browser = RemoteChrome(session['executor_url'], session['session_id'], session['w3c'])
+    try:
+        browser.quit()
+    except (WebDriverException, HTTPError, OSError):
+        pass
+    try:
+        os.kill(session['driver_pid'], signal.SIGTERM)
+    except OSError:
+        pass
+    os.remove(session_path)
+
+
+def main():
+    """Main method to shut down a persisted WebDriver session."""
+
+    if len(sys.argv) != 3 or sys.argv[1] != '--quit':
+        print(USAGE_STR)
+        sys.exit(1)
+    quit_persistent_session(sys.argv[2])
+
+
+if __name__ == '__main__':
+    main()
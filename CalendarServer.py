@@ -0,0 +1,253 @@
+import re
+import sys
+import time
+import random
+import threading
+from html import escape
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from Benchmark import TITLES, LOCATIONS, ADDITIONAL_INFO, generate_raw_date_time, generate_raw_contact
+from Utility import get_arg_value, InvalidArgumentsError
+
+
+# Usage message that represents the correct command line usage.
+USAGE_STR = 'usage: python CalendarServer.py (--pages <n>) (--events <n>) (--latency <milliseconds>) (--port <port>)'
+
+# Set of allowed command line arguments.
+ALLOWED_FLAGS = {'--pages', '--events', '--latency', '--port'}
+
+# Markup of a list page (the list of events and the next page button).
+LIST_PAGE_HTML = '''<!DOCTYPE html>
+<html><head><title>Events Calendar - Page {page}</title></head><body>
+<div class="list-event">
+{previews}
+</div>
+{next_page}
+</body></html>'''
+# Markup of one event on a list page.
+PREVIEW_HTML = '<div class="list-event-preview"><h3><a href="/event/{id}">{title}</a></h3><p>{date_time}</p></div>'
+# Markup of the next page button.
+NEXT_PAGE_HTML = '<ul class="pagination"><li><a href="/page/{page}"><i class="icon-angle-right"></i></a></li></ul>'
+# Markup of an event's web page.
+EVENT_PAGE_HTML = '''<!DOCTYPE html>
+<html><head><title>{title}</title></head><body>
+<h1>{title}</h1>
+<a class="accordion-header-link" href="#details">Event Details</a>
+<div itemprop="description"><p>{description}</p></div>
+<section itemprop="location"><p>{location}</p></section>
+<section class="event-detail-contact-person"><p>{contact}</p></section>
+{additional_info}
+</body></html>'''
+# Markup of one piece of additional information on an event's web page.
+CUSTOM_FIELD_HTML = '<div class="custom-field-label">{}:</div><div class="custom-field-value">{}</div>'
+
+
+def _to_html(text):
+    # Escape text for an HTML page, keeping its line breaks
+    return escape(text).replace('\n', '<br>')
+
+
+class CalendarServer:
+    """
+    Local, synthetic stand-in for the University at Buffalo Events Calendar, used to benchmark the web scraper offline
+
+    The calendar has `pages` list pages of `events_per_page` events each, with the same markup (list event previews,
+    next page button, and event pages) as the real calendar. The content of the events is generated from a fixed
+    seed, so every run serves the same calendar, and every response can be delayed by `latency` seconds.
+
+    Attributes
+    ----------
+    pages : int
+        number of list pages
+    events_per_page : int
+        number of events on each list page
+    latency : float
+        number of seconds every response is delayed by
+    url : str
+        the url of the calendar's first list page
+    requests : int
+        number of requests served so far
+
+    Methods
+    -------
+    serve_forever()
+        serves the calendar until the server is stopped
+    start()
+        starts serving the calendar on a background thread
+    stop()
+        stops serving the calendar
+    """
+
+    def __init__(self, pages=10, events_per_page=20, latency=0, port=0, seed=0):
+        """
+        Parameters
+        ----------
+        pages : int
+            Number of list pages (default 10)
+        events_per_page : int
+            Number of events on each list page (default 20)
+        latency : float
+            Number of seconds every response is delayed by (default 0)
+        port : int
+            The local port to serve the calendar on (default 0, any free port)
+        seed : int
+            The seed of the random number generator the events are generated from (default 0)
+        """
+
+        self.pages = pages
+        self.events_per_page = events_per_page
+        self.latency = latency
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._events = self._generate_events(pages * events_per_page, seed)
+        self._server = ThreadingHTTPServer(('127.0.0.1', port), self._create_handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    @property
+    def url(self):
+        return 'http://127.0.0.1:{}/'.format(self._server.server_address[1])
+
+    @staticmethod
+    def _generate_events(count, seed):
+        rng = random.Random(seed)
+        return [{'title': '{} #{}'.format(rng.choice(TITLES), i), 'date_time': generate_raw_date_time(rng),
+                 'description': ' '.join(rng.choice(TITLES) for _ in range(rng.randint(5, 40))),
+                 'location': rng.choice(LOCATIONS), 'contact': generate_raw_contact(rng),
+                 'additional_info': rng.choice(ADDITIONAL_INFO)} for i in range(count)]
+
+    def render_list_page(self, page):
+        """Renders a list page of the calendar.
+
+        Parameters
+        ----------
+        page : int
+            The list page (0 is the first page)
+
+        Returns
+        -------
+        str
+            The list page's HTML, or None if the calendar has no such page
+        """
+
+        if not 0 <= page < self.pages:
+            return None
+        first = page * self.events_per_page
+        previews = '\n'.join(PREVIEW_HTML.format(id=i, title=escape(evt['title']), date_time=_to_html(evt['date_time']))
+                             for i, evt in enumerate(self._events[first:first + self.events_per_page], first))
+        next_page = NEXT_PAGE_HTML.format(page=page + 1) if page + 1 < self.pages else ''
+        return LIST_PAGE_HTML.format(page=page + 1, previews=previews, next_page=next_page)
+
+    def render_event_page(self, event_id):
+        """Renders the web page of an event.
+
+        Parameters
+        ----------
+        event_id : int
+            The id of the event (its position in the calendar)
+
+        Returns
+        -------
+        str
+            The event page's HTML, or None if the calendar has no such event
+        """
+
+        if not 0 <= event_id < len(self._events):
+            return None
+        evt = self._events[event_id]
+        additional_info = '\n'.join(CUSTOM_FIELD_HTML.format(escape(label), escape(value))
+                                    for label, value in evt['additional_info'].items())
+        return EVENT_PAGE_HTML.format(title=escape(evt['title']), description=_to_html(evt['description']),
+                                      location=escape(evt['location']), contact=_to_html(evt['contact']),
+                                      additional_info=additional_info)
+
+    def _create_handler(self):
+        server = self
+
+        class CalendarRequestHandler(BaseHTTPRequestHandler):
+
+            def do_GET(self):
+                with server._lock:
+                    server.requests += 1
+                if server.latency:
+                    time.sleep(server.latency)
+
+                # Route the request to a list page (`/` or `/page/<n>`) or an event page (`/event/<id>`)
+                path = self.path.split('?', 1)[0]
+                body = None
+                if path in ('/', '/index.html'):
+                    body = server.render_list_page(0)
+                elif re.fullmatch(r'/page/\d+', path):
+                    body = server.render_list_page(int(path.rsplit('/', 1)[1]))
+                elif re.fullmatch(r'/event/\d+', path):
+                    body = server.render_event_page(int(path.rsplit('/', 1)[1]))
+
+                status = 200 if body is not None else 404
+                body = body.encode('utf-8') if body is not None else b'Not Found'
+                self.send_response(status)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return CalendarRequestHandler
+
+    def serve_forever(self):
+        """Serves the calendar until the server is stopped."""
+
+        self._server.serve_forever()
+
+    def start(self):
+        """Starts serving the calendar on a background thread."""
+
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stops serving the calendar."""
+
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread:
+            self._thread.join()
+
+
+def main():
+    """Main method to serve a synthetic events calendar until interrupted."""
+
+    # Check if the user used an invalid argument. If so, terminate the program with exit code 1.
+    invalid_args = set(filter(lambda x: x.startswith('--'), sys.argv)) - ALLOWED_FLAGS
+    if invalid_args:
+        print('`{}` is not a valid argument.'.format(next(iter(invalid_args))))
+        print(USAGE_STR)
+        sys.exit(1)
+
+    try:
+        pages = get_arg_value(sys.argv, '--pages', int, 10)
+        events_per_page = get_arg_value(sys.argv, '--events', int, 20)
+        latency = get_arg_value(sys.argv, '--latency', float, 0) / 1000
+        port = get_arg_value(sys.argv, '--port', int, 8000)
+    except InvalidArgumentsError as e:
+        print('{}: {}'.format(e.__class__.__name__, str(e)))
+        print(USAGE_STR)
+        sys.exit(1)
+
+    server = CalendarServer(pages, events_per_page, latency, port)
+    print('Serving {} pages of {} events at {}'.format(pages, events_per_page, server.url))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
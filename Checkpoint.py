@@ -0,0 +1,143 @@
+import os
+import json
+from Event import Event
+
+
+class Checkpoint:
+    """
+    On-disk checkpoint of a crawl's progress, so that an interrupted crawl can be resumed instead of started over
+
+    A checkpoint is made up of an event log and a snapshot. The listings of each fully scraped page are appended to
+    the event log (one JSON object per line), so checkpointing a page only writes that page's listings. The snapshot
+    holds the next list page to scrape and the size of the event log as of that page, and is written atomically:
+    the new snapshot is written and synced to a temporary file, which then replaces the previous snapshot, so a
+    crash mid-write leaves the previous snapshot intact. Listings appended after the last snapshot are discarded
+    when the crawl is resumed, since their pages are scraped again.
+
+    Attributes
+    ----------
+    path : str
+        file path of the snapshot
+    log_path : str
+        file path of the event log
+    log_size : int
+        the number of bytes of the event log that hold the listings scraped so far
+
+    Methods
+    -------
+    append(events)
+        appends the listings of a fully scraped page to the event log
+    save(page, base_url)
+        syncs the event log and atomically replaces the snapshot
+    load(base_url)
+        loads the checkpoint of a crawl of a calendar
+    clear()
+        removes the checkpoint
+    """
+
+    def __init__(self, path):
+        """
+        Parameters
+        ----------
+        path : str
+            File path of the snapshot (the event log is kept next to it, with an `.events` suffix)
+        """
+
+        self.path = path
+        self.log_path = path + '.events'
+        self.log_size = 0
+
+    def append(self, events):
+        """Appends the listings of a fully scraped page to the event log.
+
+        Parameters
+        ----------
+        events : list
+            The listings of the page, in the page's order
+        """
+
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.log_path, 'ab') as f:
+            for evt in events:
+                # Log each listing on its own (repeats of an event are logged as listings of their own)
+                evt_dict = evt.to_dict()
+                evt_dict.pop('occurrences', None)
+                f.write((json.dumps(evt_dict) + '\n').encode('utf-8'))
+            self.log_size = f.tell()
+
+    def save(self, page, base_url):
+        """Syncs the event log and atomically replaces the snapshot.
+
+        Parameters
+        ----------
+        page : int
+            The next list page to scrape
+        base_url : str
+            The url of the calendar being crawled
+        """
+
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        if os.path.exists(self.log_path):
+            with open(self.log_path, 'ab') as f:
+                os.fsync(f.fileno())
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w') as f:
+            json.dump({'base_url': base_url, 'page': page, 'log_size': self.log_size}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+
+    def load(self, base_url):
+        """Loads the checkpoint of a crawl of a calendar, discarding the listings logged after its snapshot.
+
+        Parameters
+        ----------
+        base_url : str
+            The url of the calendar being crawled
+
+        Returns
+        -------
+        tuple (int, list)
+            The next list page to scrape and the listings scraped so far (in the order they were scraped), or None
+            if there is no checkpoint of a crawl of this calendar
+        """
+
+        try:
+            with open(self.path) as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return None
+        if state['base_url'] != base_url:
+            return None
+
+        # Read the event log as of the snapshot (a log cut short means the checkpoint cannot be trusted)
+        try:
+            with open(self.log_path, 'r+b') as f:
+                data = f.read(state['log_size'])
+                f.truncate(state['log_size'])
+        except FileNotFoundError:
+            data = b''
+        if len(data) < state['log_size']:
+            return None
+        self.log_size = state['log_size']
+
+        events = []
+        for line in data.decode('utf-8').splitlines():
+            evt_dict = json.loads(line)
+            evt = Event(evt_dict['title'], evt_dict['link'], evt_dict['start'], evt_dict['end'])
+            evt.description = evt_dict['description']
+            evt.location = evt_dict['location']
+            evt.contact = evt_dict['contact']
+            evt.additional_info = evt_dict['additional_info']
+            events.append(evt)
+        return state['page'], events
+
+    def clear(self):
+        """Removes the checkpoint."""
+
+        for path in (self.path, self.log_path):
+            if os.path.exists(path):
+                os.remove(path)
+        self.log_size = 0
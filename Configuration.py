@@ -26,10 +26,88 @@ class Configuration:
         the file type of the exported file
     print_events : bool
         whether or not scraped events will be printed to the command line
+    backend : str
+        the fetch backend used to load pages: `selenium` (Google Chrome) or `http` (plain HTTP, no JavaScript)
+    concurrency : int
+        maximum number of event pages deep scraped at once (1 deep scrapes events one at a time)
+    per_host_concurrency : int
+        maximum number of event pages deep scraped at once from the same host (None for no separate limit)
+    workers : int
+        number of WebDriver sessions that deep scrape events in parallel (1 deep scrapes in the main session)
+    worker_timeout : int
+        number of seconds a worker may spend deep scraping a single event before it is torn down
+    health_check_interval : int
+        minimum number of seconds between health checks of a worker's WebDriver session (0 disables them)
+    shards : int
+        number of worker processes that each scrape their own range of pages (1 scrapes in this process)
+    shard_pages : int
+        number of pages handed to a worker process at a time when scraping all pages
+    cache_path : str
+        the file path of the on-disk cache that event pages are read through (None disables caching)
+    cache_size : int
+        the maximum size of the on-disk cache in megabytes
+    cache_ttl : int
+        the number of seconds a cached event page is used without being revalidated
+    store_path : str
+        the file path of the event store used to scrape incrementally (None scrapes every event)
+    base_url : str
+        the url of the events calendar's first list page
+    metrics_path : str
+        the file path of the JSON run report of timing metrics (None disables the report)
+    prometheus_path : str
+        the file path of the timing metrics in Prometheus text format (None disables them)
+    readiness : str
+        how page readiness is waited for: `observer` (a MutationObserver in the page) or `poll` (WebDriverWait)
+    poll_interval : float
+        the number of seconds between checks when polling for page readiness
+    page_load_strategy : str
+        when Chrome considers a page loaded: `normal` (the load event), `eager` (DOMContentLoaded), or `none`
+    blocked_resources : list
+        resource types Chrome is blocked from downloading (`image`, `font`, `stylesheet`, `media`)
+    blocked_urls : list
+        URL patterns (with `*` wildcards) of other requests Chrome is blocked from making
+    reuse_tabs : bool
+        whether or not event pages are deep scraped in one long-lived tab instead of a new tab per event
+    debugger_address : str
+        the `host:port` of an already running Google Chrome (with remote debugging) to attach to
+    session_path : str
+        the file path of a persisted WebDriver session that is reused across runs (None launches a new browser)
+    serve_port : int
+        the local port that the events are served on by a long-running service (None scrapes once and exits)
+    refresh_interval : int
+        the number of seconds between re-scrapes of the calendar when running as a service
+    duplicates : str
+        how repeated listings of the same event page are handled: `keep` (separate events sharing one deep scrape)
+        or `collapse` (one event with multiple occurrences)
+    checkpoint_path : str
+        the file path of the checkpoint of the crawl's progress (None disables checkpointing)
+    checkpoint_interval : int
+        the number of list pages scraped between checkpoints
+    resume : bool
+        whether or not the crawl resumes from its checkpoint instead of starting over
+    rate_limit : float
+        the number of page loads started per second (None does not pace page loads)
+    rate_burst : int
+        the maximum number of page loads started at once after an idle period
+    adaptive : bool
+        whether or not the rate and concurrency of page loads are raised while the site stays healthy, and backed
+        off on timeouts and HTTP 429/5xx responses
+    max_rate : float
+        the maximum number of page loads per second that an adaptive rate is raised to (None for no maximum)
+    latency_target : float
+        the number of seconds past which a page load is considered slow (and backed off from, if adaptive)
     """
 
     def __init__(self, path, headless, deep_scrape, start_page, end_page, all_pages,
-                 export, overwrite, export_path, export_extension, print_events):
+                 export, overwrite, export_path, export_extension, print_events, backend='selenium',
+                 concurrency=1, per_host_concurrency=None, workers=1, worker_timeout=60,
+                 health_check_interval=30, shards=1, shard_pages=5, cache_path=None, cache_size=100,
+                 cache_ttl=3600, store_path=None, base_url='https://calendar.buffalo.edu/',
+                 metrics_path=None, prometheus_path=None, readiness='observer', poll_interval=0.05,
+                 page_load_strategy='normal', blocked_resources=(), blocked_urls=(), reuse_tabs=False,
+                 debugger_address=None, session_path=None, serve_port=None, refresh_interval=3600,
+                 duplicates='keep', checkpoint_path=None, checkpoint_interval=1, resume=False, rate_limit=None,
+                 rate_burst=1, adaptive=False, max_rate=None, latency_target=2.0):
         """
         Parameters
         ----------
@@ -55,6 +133,76 @@ class Configuration:
             The file type of the exported file
         print_events : bool
             Whether or not scraped events will be printed to the command line
+        backend : str
+            The fetch backend used to load pages: `selenium` or `http` (default `selenium`)
+        concurrency : int
+            Maximum number of event pages deep scraped at once (default 1)
+        per_host_concurrency : int
+            Maximum number of event pages deep scraped at once from the same host (default None)
+        workers : int
+            Number of WebDriver sessions that deep scrape events in parallel (default 1)
+        worker_timeout : int
+            Number of seconds a worker may spend deep scraping a single event (default 60 seconds)
+        health_check_interval : int
+            Minimum number of seconds between health checks of a worker's WebDriver session (default 30 seconds)
+        shards : int
+            Number of worker processes that each scrape their own range of pages (default 1)
+        shard_pages : int
+            Number of pages handed to a worker process at a time when scraping all pages (default 5)
+        cache_path : str
+            The file path of the on-disk cache that event pages are read through (default None)
+        cache_size : int
+            The maximum size of the on-disk cache in megabytes (default 100)
+        cache_ttl : int
+            The number of seconds a cached event page is used without being revalidated (default 3600 seconds)
+        store_path : str
+            The file path of the event store used to scrape incrementally (default None)
+        base_url : str
+            The url of the events calendar's first list page (default https://calendar.buffalo.edu/)
+        metrics_path : str
+            The file path of the JSON run report of timing metrics (default None)
+        prometheus_path : str
+            The file path of the timing metrics in Prometheus text format (default None)
+        readiness : str
+            How page readiness is waited for: `observer` or `poll` (default `observer`)
+        poll_interval : float
+            The number of seconds between checks when polling for page readiness (default 0.05 seconds)
+        page_load_strategy : str
+            When Chrome considers a page loaded: `normal`, `eager`, or `none` (default `normal`)
+        blocked_resources : iterable
+            Resource types Chrome is blocked from downloading (default none)
+        blocked_urls : iterable
+            URL patterns (with `*` wildcards) of other requests Chrome is blocked from making (default none)
+        reuse_tabs : bool
+            Whether or not event pages are deep scraped in one long-lived tab instead of a new tab per event
+            (default False)
+        debugger_address : str
+            The `host:port` of an already running Google Chrome (with remote debugging) to attach to (default None)
+        session_path : str
+            The file path of a persisted WebDriver session that is reused across runs (default None)
+        serve_port : int
+            The local port that the events are served on by a long-running service (default None)
+        refresh_interval : int
+            The number of seconds between re-scrapes of the calendar when running as a service (default 3600 seconds)
+        duplicates : str
+            How repeated listings of the same event page are handled: `keep` or `collapse` (default `keep`)
+        checkpoint_path : str
+            The file path of the checkpoint of the crawl's progress (default None)
+        checkpoint_interval : int
+            The number of list pages scraped between checkpoints (default 1)
+        resume : bool
+            Whether or not the crawl resumes from its checkpoint instead of starting over (default False)
+        rate_limit : float
+            The number of page loads started per second (default None)
+        rate_burst : int
+            The maximum number of page loads started at once after an idle period (default 1)
+        adaptive : bool
+            Whether or not the rate and concurrency of page loads adapt to the site's latency and errors
+            (default False)
+        max_rate : float
+            The maximum number of page loads per second that an adaptive rate is raised to (default None)
+        latency_target : float
+            The number of seconds past which a page load is considered slow (default 2 seconds)
         """
 
         self.chromedriver_path = path
@@ -68,3 +216,37 @@ class Configuration:
         self.export_path = export_path
         self.export_extension = export_extension
         self.print_events = print_events
+        self.backend = backend
+        self.concurrency = concurrency
+        self.per_host_concurrency = per_host_concurrency
+        self.workers = workers
+        self.worker_timeout = worker_timeout
+        self.health_check_interval = health_check_interval
+        self.shards = shards
+        self.shard_pages = shard_pages
+        self.cache_path = cache_path
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self.store_path = store_path
+        self.base_url = base_url
+        self.metrics_path = metrics_path
+        self.prometheus_path = prometheus_path
+        self.readiness = readiness
+        self.poll_interval = poll_interval
+        self.page_load_strategy = page_load_strategy
+        self.blocked_resources = list(blocked_resources)
+        self.blocked_urls = list(blocked_urls)
+        self.reuse_tabs = reuse_tabs
+        self.debugger_address = debugger_address
+        self.session_path = session_path
+        self.serve_port = serve_port
+        self.refresh_interval = refresh_interval
+        self.duplicates = duplicates
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_interval = checkpoint_interval
+        self.resume = resume
+        self.rate_limit = rate_limit
+        self.rate_burst = rate_burst
+        self.adaptive = adaptive
+        self.max_rate = max_rate
+        self.latency_target = latency_target
@@ -1,18 +1,60 @@
 import sys
-from Utility import (read_config_file, read_args,
+from Utility import (read_config_file, read_args, InvalidArgumentsError,
                      InvalidConfigFileTypeError, InvalidConfigFileValueError,
-                     OverwriteExistingFileError, print_events, export_events)
+                     OverwriteExistingFileError, print_events, open_event_writer)
 from UBEventsCalendarScraper import UBEventsCalendarScraper
+from ShardedScraper import scrape_sharded
+from Metrics import metrics
+from EventService import EventService
 from selenium.common.exceptions import WebDriverException, TimeoutException
-from urllib3.exceptions import MaxRetryError
+from urllib3.exceptions import MaxRetryError, HTTPError
 
 
 # Usage message that represents the correct command line usage.
 USAGE_STR = '''usage: python Driver.py --config <path>
-usage: python Driver.py --path <driver_path> (--head) (--deep) (--print) ([<last_page> | <first_page> <last_page> | --all]) (--export <export_path>) (--overwrite)'''
+usage: python Driver.py --path <driver_path> (--head) (--deep) (--print) ([<last_page> | <first_page> <last_page> | --all]) (--export <export_path>) (--overwrite)
+       (--backend <selenium | http>) (--concurrency <n>) (--per-host <n>)
+       (--workers <n>) (--worker-timeout <seconds>) (--health-check <seconds>) (--shards <n>) (--shard-pages <n>)
+       (--cache <cache_path>) (--cache-size <megabytes>) (--cache-ttl <seconds>)
+       (--incremental <store_path>) (--base-url <url>)
+       (--metrics <report_path>) (--prometheus <metrics_path>)
+       (--readiness <observer | poll>) (--poll-interval <seconds>)
+       (--page-load <normal | eager | none>) (--block <image,font,stylesheet,media>) (--block-urls <pattern,...>)
+       (--reuse-tabs) (--debugger-address <host:port> | --session <session_path>)
+       (--serve <port>) (--refresh <seconds>) (--duplicates <keep | collapse>)
+       (--checkpoint <checkpoint_path>) (--checkpoint-every <pages>) (--resume)
+       (--rate <pages/second>) (--burst <n>) (--adaptive) (--max-rate <pages/second>) (--latency-target <seconds>)'''
 
 # Set of allowed command line arguments.
-ALLOWED_FLAGS = {'--config', '--path', '--head', '--deep', '--print', '--all', '--export', '--overwrite'}
+ALLOWED_FLAGS = {'--config', '--path', '--head', '--deep', '--print', '--all', '--export', '--overwrite',
+                 '--backend', '--concurrency', '--per-host',
+                 '--workers', '--worker-timeout', '--health-check',
+                 '--shards', '--shard-pages',
+                 '--cache', '--cache-size', '--cache-ttl', '--incremental', '--base-url',
+                 '--metrics', '--prometheus', '--readiness', '--poll-interval',
+                 '--page-load', '--block', '--block-urls', '--reuse-tabs',
+                 '--debugger-address', '--session', '--serve', '--refresh',
+                 '--duplicates', '--checkpoint', '--checkpoint-every', '--resume',
+                 '--rate', '--burst', '--adaptive', '--max-rate', '--latency-target'}
+
+
+def serve_events(config):
+    """Serve the events of the University at Buffalo Events Calendar over a local HTTP API until interrupted.
+
+    Parameters
+    ----------
+    config : Configuration
+        Configuration settings of the web scraper and the service
+    """
+
+    service = EventService(config, config.refresh_interval, port=config.serve_port)
+    print('Serving events at {} (refreshing every {} seconds).'.format(service.url, config.refresh_interval))
+    try:
+        service.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.stop()
 
 
 def main():
@@ -32,6 +74,10 @@ def main():
         sys.exit(1)
 
     exit_code = 0
+    config = None
+    scraper = None
+    writer = None
+    limiter_summaries = []
     try:
         # If the second command line argument is `--config`, create configurations from a config file.
         if sys.argv[1] == '--config':
@@ -40,34 +86,84 @@ def main():
         elif sys.argv[1] == '--path':
             config = read_args(sys.argv)
 
-        scraper = UBEventsCalendarScraper(config)  # Initialize a web scraper for the UB Events Calendar.
-        events = scraper.scrape_events()           # Scrape events from the UB Events Calendar.
-
-        # Export the scraped events if the config allows exporting.
-        if config.export:
-            export_events(events, config)
-
-        # Print out the scraped events if the config allows printing.
-        if config.print_events:
-            print_events(events)
+        # If the config enables the long-running service, serve the events (re-scraping them on schedule) until the
+        # program is interrupted instead of scraping them once.
+        if config.serve_port is not None:
+            serve_events(config)
+        else:
+            # Open the export file before scraping begins if the config allows exporting.
+            if config.export:
+                writer = open_event_writer(config)
+
+            # If the config allows more than one shard, scrape ranges of pages in a pool of worker processes.
+            if config.shards > 1:
+                events = scrape_sharded(config, limiter_summaries)
+            else:
+                # Initialize a web scraper for the UB Events Calendar, and stream events from it as they are scraped
+                # (or, when collapsing repeated events, once every occurrence of every event has been scraped).
+                scraper = UBEventsCalendarScraper(config)
+                events = scraper.scrape_events() if config.duplicates == 'collapse' else scraper.iter_events()
+
+            # Print out and export each scraped event as soon as it arrives if the config allows printing/exporting.
+            for evt in events:
+                if config.print_events:
+                    print_events([evt])
+                if writer:
+                    writer.write(evt)
+
+            # Print out how effective the page cache was if the config enabled it.
+            if scraper and scraper.page_cache:
+                print(scraper.page_cache)
+
+            # Print out the achieved throughput and the final limits of the rate limiter (or of each worker's rate
+            # limiter) if the config enabled it.
+            if scraper and scraper.rate_limiter:
+                print(scraper.rate_limiter)
+            for shard_number, summary in enumerate(limiter_summaries, 1):
+                print('Shard {}: {}'.format(shard_number, summary))
+
+    # Handle exceptions that deal with issues with the command line arguments.
+    except InvalidArgumentsError as e:
+        print('{}: {}'.format(e.__class__.__name__, str(e)))
+        print(USAGE_STR)
+        exit_code = 1
 
     # Handle exceptions that deal with issues with the configuration file or overwriting an existing file.
     except (InvalidConfigFileTypeError, InvalidConfigFileValueError, OverwriteExistingFileError) as e:
         print('{}: {}'.format(e.__class__.__name__, str(e)))
         exit_code = 1
 
-    # Handle exceptions that deal with issues with the web scraper.
+    # Handle exceptions that deal with issues with the web scraper, checkpointing the crawl so that it can be resumed.
     except (WebDriverException, TimeoutException) as e:
-        scraper.quit()
+        if scraper:
+            scraper.save_checkpoint()
         print('{}: {}'.format(e.__class__.__name__, str(e)))
         exit_code = 1
 
-    # Handle exceptions that deal with network issues.
+    # Handle exceptions that deal with network issues, checkpointing the crawl so that it can be resumed.
     except MaxRetryError:
-        scraper.quit()
-        print('Failed to establish a new connection with https://calendar.buffalo.edu/. Check network connection.')
+        if scraper:
+            scraper.save_checkpoint()
+        print('Failed to establish a new connection with {}. Check network connection.'.format(config.base_url))
         exit_code = 2
 
+    # Finish the export file, even if scraping stopped early, so that it holds every event scraped so far, and quit the
+    # web scraper (its browser, worker pool, and connections) however the run ended.
+    finally:
+        if writer:
+            writer.close()
+        if scraper:
+            try:
+                scraper.quit()
+            except (WebDriverException, HTTPError, OSError):
+                pass
+
+        # Write out where the run's time went if the config enabled a run report or Prometheus metrics.
+        if config and config.metrics_path:
+            metrics.write_json(config.metrics_path)
+        if config and config.prometheus_path:
+            metrics.write_prometheus(config.prometheus_path)
+
     # Terminate program with `exit_code`.
     sys.exit(exit_code)
 
@@ -1,7 +1,71 @@
+import sys
+from datetime import datetime, timedelta
+
+
+# Format of an event's start/end time, without the timezone (MM/DD/YYYY HH:MM AM/PM).
+DATE_TIME_FORMAT = '%m/%d/%Y %I:%M %p'
+# The epoch that timestamps are counted from.
+EPOCH = datetime(1970, 1, 1)
+# Cache of UTC offsets (in seconds) of timezone strings (e.g. `EDT-0400` -> -14400).
+_ZONE_OFFSETS = {}
+
+
+def _zone_offset(zone):
+    # Parse the trailing +HHMM/-HHMM UTC offset of a timezone string (e.g. `EDT-0400`), caching the result
+    offset = _ZONE_OFFSETS.get(zone)
+    if offset is None:
+        sign = -1 if zone[-5] == '-' else 1
+        offset = _ZONE_OFFSETS[zone] = sign * (int(zone[-4:-2]) * 3600 + int(zone[-2:]) * 60)
+    return offset
+
+
+def parse_timestamp(date_time):
+    """Parse a formatted date & time string into an epoch timestamp and its timezone.
+
+    Parameters
+    ----------
+    date_time : str
+        A formatted string (MM/DD/YYYY HH:MM AM/PM UTC-OFFSET)
+
+    Returns
+    -------
+    tuple (int, str)
+        The number of seconds since the epoch, and the (interned) timezone string (e.g. `EDT-0400`)
+    """
+
+    naive, zone = date_time.rsplit(' ', 1)
+    zone = sys.intern(zone)
+    timestamp = int((datetime.strptime(naive, DATE_TIME_FORMAT) - EPOCH).total_seconds()) - _zone_offset(zone)
+    return timestamp, zone
+
+
+def format_timestamp(timestamp, zone):
+    """Format an epoch timestamp in a timezone as a date & time string.
+
+    Parameters
+    ----------
+    timestamp : int
+        The number of seconds since the epoch
+    zone : str
+        The timezone string (e.g. `EDT-0400`) returned by parse_timestamp
+
+    Returns
+    -------
+    str
+        A formatted string (MM/DD/YYYY HH:MM AM/PM UTC-OFFSET)
+    """
+
+    local_time = EPOCH + timedelta(seconds=timestamp + _zone_offset(zone))
+    return '{} {}'.format(local_time.strftime(DATE_TIME_FORMAT), zone)
+
+
 class Event:
     """
     A class used to represent an event from the University at Buffalo Events Calendar
 
+    Events use `__slots__` instead of a per-instance `__dict__`, store their start/end times as epoch timestamps,
+    and intern repeated strings (timezones, locations, and contact information).
+
     Attributes
     ----------
     title : str
@@ -12,6 +76,14 @@ class Event:
         a formatted string (MM/DD/YYYY HH:MM AM/PM UTC-OFFSET) representing the start time of the event
     end : str
         a formatted string (MM/DD/YYYY HH:MM AM/PM UTC-OFFSET) representing the end time of the event
+    start_ts : int
+        the start time of the event, in seconds since the epoch
+    end_ts : int
+        the end time of the event, in seconds since the epoch
+    start_zone : str
+        the timezone of the start time of the event (e.g. `EDT-0400`)
+    end_zone : str
+        the timezone of the end time of the event (e.g. `EDT-0400`)
     description : str
         description of the event
     location : str
@@ -20,8 +92,22 @@ class Event:
         contact information for the event (name of host, phone number, email)
     additional_info : dict
         additional information for the event
+    occurrences : list
+        (start, end) of every time the event occurs, if it was listed more than once (None otherwise)
+
+    Methods
+    -------
+    copy_details(evt)
+        copies the deep scraped details of another event
+    add_occurrence(evt)
+        records another listing of the same event as one of its occurrences
+    to_dict()
+        converts the event into a dictionary
     """
 
+    __slots__ = ('title', 'link', 'start_ts', 'end_ts', 'start_zone', 'end_zone', 'description', '_location',
+                 '_contact', 'additional_info', 'occurrences')
+
     def __init__(self, title, link, start, end):
         """
         Parameters
@@ -44,6 +130,83 @@ class Event:
         self.location = None
         self.contact = None
         self.additional_info = None
+        self.occurrences = None
+
+    @property
+    def start(self):
+        return format_timestamp(self.start_ts, self.start_zone) if self.start_ts is not None else None
+
+    @start.setter
+    def start(self, value):
+        self.start_ts, self.start_zone = parse_timestamp(value) if value is not None else (None, None)
+
+    @property
+    def end(self):
+        return format_timestamp(self.end_ts, self.end_zone) if self.end_ts is not None else None
+
+    @end.setter
+    def end(self, value):
+        self.end_ts, self.end_zone = parse_timestamp(value) if value is not None else (None, None)
+
+    @property
+    def location(self):
+        return self._location
+
+    @location.setter
+    def location(self, value):
+        self._location = sys.intern(value) if value is not None else None
+
+    @property
+    def contact(self):
+        return self._contact
+
+    @contact.setter
+    def contact(self, value):
+        self._contact = {key: sys.intern(info) for key, info in value.items()} if value is not None else None
+
+    def copy_details(self, evt):
+        """Copies the deep scraped details (description, location, contact, and additional info) of another event.
+
+        Parameters
+        ----------
+        evt : Event
+            The event to copy the details of (e.g. another listing of the same event page)
+        """
+
+        self.description = evt.description
+        self._location = evt.location
+        self._contact = evt.contact
+        self.additional_info = evt.additional_info
+
+    def add_occurrence(self, evt):
+        """Records another listing of the same event (e.g. one day of a recurring event) as one of its occurrences.
+
+        Parameters
+        ----------
+        evt : Event
+            The other listing of the event
+        """
+
+        if self.occurrences is None:
+            self.occurrences = [(self.start, self.end)]
+        self.occurrences.append((evt.start, evt.end))
+
+    def to_dict(self):
+        """Converts the event into a dictionary.
+
+        Returns
+        -------
+        dict
+            The event's title, link, start, end, description, location, contact, and additional info, and its
+            occurrences if it was listed more than once
+        """
+
+        evt_dict = {'title': self.title, 'link': self.link, 'start': self.start, 'end': self.end,
+                    'description': self.description, 'location': self.location, 'contact': self.contact,
+                    'additional_info': self.additional_info}
+        if self.occurrences:
+            evt_dict['occurrences'] = [{'start': start, 'end': end} for start, end in self.occurrences]
+        return evt_dict
 
     def __str__(self):
         return 'Title: {}\nLink:  {}\nStart: {}\nEnd:   {}\n\n'.format(self.title, self.link, self.start, self.end)
@@ -0,0 +1,186 @@
+from array import array
+from Event import Event, format_timestamp
+
+
+class EventBatch:
+    """
+    Columnar batch of events, used to hold a large number of events with less memory than a list of Event objects
+
+    Each field of the events is stored in its own column. Start/end times are stored in arrays of epoch timestamps,
+    and timezones, locations, and contact information are dictionary encoded (each distinct value is stored once,
+    and every event holds a small integer code of its value).
+
+    Indexing the batch (`batch[i]`) materializes an event, and slicing it (`batch[i:j]`) gets a new batch of the
+    events in the slice.
+
+    Attributes
+    ----------
+    titles : list
+        the titles of the events
+    links : list
+        the links of the events
+    start_ts : array
+        the start times of the events, in seconds since the epoch
+    end_ts : array
+        the end times of the events, in seconds since the epoch
+    descriptions : list
+        the descriptions of the events
+    additional_info : list
+        the additional information of the events
+    occurrences : list
+        the (start, end) times of every listing of each event (None for an event that was listed once)
+
+    Methods
+    -------
+    append(evt)
+        adds an event to the end of the batch
+    extend(events)
+        adds events to the end of the batch
+    column(name)
+        gets the (decoded) values of one field of every event in the batch
+    """
+
+    def __init__(self, events=()):
+        """
+        Parameters
+        ----------
+        events : iterable
+            Events to add to the batch (default empty)
+        """
+
+        self.titles = []
+        self.links = []
+        # Events without a start/end time have a code of -1 and a timestamp of 0
+        self.start_ts = array('q')
+        self.end_ts = array('q')
+        self.descriptions = []
+        self.additional_info = []
+        self.occurrences = []
+        self._start_zones = array('i')
+        self._end_zones = array('i')
+        self._locations = array('i')
+        self._contacts = array('i')
+        # The distinct values of the dictionary encoded columns, and the codes of those values
+        self._values = {'zone': [], 'location': [], 'contact': []}
+        self._codes = {'zone': {}, 'location': {}, 'contact': {}}
+        self.extend(events)
+
+    def _encode(self, kind, value):
+        # Get the code of a value of a dictionary encoded column, adding the value if it has not been seen yet
+        if value is None:
+            return -1
+        key = tuple(value.items()) if isinstance(value, dict) else value
+        code = self._codes[kind].get(key)
+        if code is None:
+            code = self._codes[kind][key] = len(self._values[kind])
+            self._values[kind].append(value)
+        return code
+
+    def _decode(self, kind, code):
+        return self._values[kind][code] if code >= 0 else None
+
+    def append(self, evt):
+        """Adds an event to the end of the batch.
+
+        Parameters
+        ----------
+        evt : Event
+            The event to add
+        """
+
+        self.titles.append(evt.title)
+        self.links.append(evt.link)
+        self.start_ts.append(evt.start_ts if evt.start_ts is not None else 0)
+        self.end_ts.append(evt.end_ts if evt.end_ts is not None else 0)
+        self._start_zones.append(self._encode('zone', evt.start_zone))
+        self._end_zones.append(self._encode('zone', evt.end_zone))
+        self.descriptions.append(evt.description)
+        self._locations.append(self._encode('location', evt.location))
+        self._contacts.append(self._encode('contact', evt.contact))
+        self.additional_info.append(evt.additional_info)
+        self.occurrences.append(list(evt.occurrences) if evt.occurrences else None)
+
+    def extend(self, events):
+        """Adds events to the end of the batch.
+
+        Parameters
+        ----------
+        events : iterable
+            The events to add
+        """
+
+        for evt in events:
+            self.append(evt)
+
+    def column(self, name):
+        """Gets the (decoded) values of one field of every event in the batch.
+
+        Parameters
+        ----------
+        name : str
+            The name of the field (title, link, start, end, description, location, contact, additional_info, or
+            occurrences)
+
+        Returns
+        -------
+        list
+            The values of the field, in the order the events were added
+
+        Raises
+        ------
+        KeyError
+            If there is no field with this name.
+        """
+
+        if name == 'title':
+            return list(self.titles)
+        if name == 'link':
+            return list(self.links)
+        if name == 'description':
+            return list(self.descriptions)
+        if name == 'additional_info':
+            return list(self.additional_info)
+        if name == 'occurrences':
+            return [list(occurrences) if occurrences else None for occurrences in self.occurrences]
+        if name == 'start' or name == 'end':
+            timestamps = self.start_ts if name == 'start' else self.end_ts
+            zones = self._start_zones if name == 'start' else self._end_zones
+            return [format_timestamp(timestamp, self._decode('zone', zone)) if zone >= 0 else None
+                    for timestamp, zone in zip(timestamps, zones)]
+        if name == 'location':
+            return [self._decode('location', code) for code in self._locations]
+        if name == 'contact':
+            return [dict(self._decode('contact', code)) if code >= 0 else None for code in self._contacts]
+        raise KeyError(name)
+
+    def __len__(self):
+        return len(self.links)
+
+    def __getitem__(self, index):
+        # Slicing the batch gets a new batch of the events in the slice
+        if isinstance(index, slice):
+            return EventBatch(self[i] for i in range(*index.indices(len(self))))
+
+        # Materialize the event at this position of the batch
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('event batch index out of range')
+        evt = Event(self.titles[index], self.links[index], None, None)
+        if self._start_zones[index] >= 0:
+            evt.start_ts, evt.start_zone = self.start_ts[index], self._decode('zone', self._start_zones[index])
+        if self._end_zones[index] >= 0:
+            evt.end_ts, evt.end_zone = self.end_ts[index], self._decode('zone', self._end_zones[index])
+        evt.description = self.descriptions[index]
+        evt.location = self._decode('location', self._locations[index])
+        contact = self._decode('contact', self._contacts[index])
+        evt.contact = dict(contact) if contact is not None else None
+        additional_info = self.additional_info[index]
+        evt.additional_info = dict(additional_info) if additional_info is not None else None
+        if self.occurrences[index]:
+            evt.occurrences = list(self.occurrences[index])
+        return evt
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
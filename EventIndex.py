@@ -0,0 +1,294 @@
+import re
+import threading
+from bisect import bisect_left, insort
+from heapq import merge
+from Event import parse_timestamp
+
+
+# Pattern of the words that event text is indexed and searched by.
+TOKEN_PATTERN = re.compile(r'\w+')
+
+
+def tokenize(text):
+    """Split text into its lowercase words.
+
+    Parameters
+    ----------
+    text : str
+        The text to split
+
+    Returns
+    -------
+    set
+        The distinct lowercase words of the text
+    """
+
+    return set(TOKEN_PATTERN.findall(text.lower())) if text else set()
+
+
+class EventIndex:
+    """
+    In-memory query index over scraped events: a time index over their start/end times and an inverted text index
+
+    Every listing of an event page is indexed on its own, so the repeated listings of a recurring event (or the
+    occurrences of an event whose repeated listings were collapsed) are each found by their own time.
+
+    The time index keeps the listings sorted by start time, so the listings happening in a time range are found with
+    a binary search instead of a scan. Listings up to `long_duration` seconds long are kept in one sorted array,
+    which only needs to be searched from `long_duration` seconds before the range starts. The few longer (multi-day)
+    listings are kept in a second sorted array that is searched from its beginning.
+
+    The text index maps every word of an event's title, description, location, and additional info values to the
+    events containing it, and keeps its words sorted so that a search word matches every word it is a prefix of.
+
+    Events are added, replaced (by link and start time), and removed incrementally, and every method is thread safe.
+
+    Attributes
+    ----------
+    long_duration : int
+        number of seconds past which a listing is kept with the long (multi-day) listings
+
+    Methods
+    -------
+    add(evt, replace=False)
+        adds an event
+    add_events(events, replace=False)
+        adds events
+    remove(link)
+        removes every listing of an event page
+    query(start=None, end=None, keyword=None)
+        gets the events in a time range that contain a keyword
+    """
+
+    def __init__(self, events=(), long_duration=86400):
+        """
+        Parameters
+        ----------
+        events : iterable
+            The events to start the index with (default none)
+        long_duration : int
+            Number of seconds past which a listing is kept with the long (multi-day) listings (default 1 day)
+        """
+
+        self.long_duration = long_duration
+        self._lock = threading.Lock()
+        self._events = {}
+        self._ids = {}
+        self._listing_ids = {}
+        self._entries = {}
+        self._times = {}
+        self._next_id = 0
+        self._short = []
+        self._long = []
+        self._postings = {}
+        self._words = []
+        self.add_events(events)
+
+    def __len__(self):
+        return len(self._events)
+
+    def __iter__(self):
+        with self._lock:
+            events = list(self._events.values())
+        return iter(events)
+
+    @staticmethod
+    def _listings_of(evt):
+        # Get the (start, end) timestamps of every listing of the event. An event without an end time is treated as
+        # an instant at its start time.
+        if evt.occurrences:
+            times = [(parse_timestamp(start)[0] if start else None, parse_timestamp(end)[0] if end else None)
+                     for start, end in evt.occurrences]
+        else:
+            times = [(evt.start_ts, evt.end_ts)]
+        return [(start, end if end is not None else start) for start, end in times]
+
+    @staticmethod
+    def _text_of(evt):
+        return [evt.title, evt.description, evt.location] + list((evt.additional_info or {}).values())
+
+    def _time_array(self, start, end):
+        return self._long if end - start > self.long_duration else self._short
+
+    def _add(self, evt, replace):
+        listings = self._listings_of(evt)
+        # If replacing, remove the events listed with the same link at the same times first
+        if replace:
+            for start, _ in listings:
+                evt_id = self._listing_ids.get((evt.link, start))
+                if evt_id is not None:
+                    self._remove_id(evt_id)
+
+        evt_id = self._next_id
+        self._next_id += 1
+        self._events[evt_id] = evt
+        self._ids.setdefault(evt.link, set()).add(evt_id)
+        self._times[evt_id] = listings
+
+        # Listings without a start time cannot be placed in time, so they are only found by keyword searches without
+        # a time range
+        arrays = []
+        for start, end in listings:
+            self._listing_ids[(evt.link, start)] = evt_id
+            if start is not None:
+                array = self._time_array(start, end)
+                insort(array, (start, evt_id))
+                arrays.append((array, start))
+
+        words = set().union(*map(tokenize, self._text_of(evt)))
+        for word in words:
+            ids = self._postings.get(word)
+            if ids is None:
+                ids = self._postings[word] = set()
+                insort(self._words, word)
+            ids.add(evt_id)
+
+        # Remember where the event was indexed, so that it can be removed even if it has changed since
+        self._entries[evt_id] = (evt.link, arrays, words)
+
+    def _remove_id(self, evt_id):
+        del self._events[evt_id]
+        link, arrays, words = self._entries.pop(evt_id)
+        ids = self._ids[link]
+        ids.discard(evt_id)
+        if not ids:
+            del self._ids[link]
+        for start, _ in self._times.pop(evt_id):
+            if self._listing_ids.get((link, start)) == evt_id:
+                del self._listing_ids[(link, start)]
+
+        for array, start in arrays:
+            del array[bisect_left(array, (start, evt_id))]
+
+        for word in words:
+            ids = self._postings[word]
+            ids.discard(evt_id)
+            # Forget words that no event contains anymore
+            if not ids:
+                del self._postings[word]
+                del self._words[bisect_left(self._words, word)]
+
+    def add(self, evt, replace=False):
+        """Adds an event.
+
+        Parameters
+        ----------
+        evt : Event
+            The event to add
+        replace : bool
+            Whether or not the event replaces the events listed with the same link at the same times (e.g. when
+            adding new and changed events scraped incrementally) instead of being added alongside them (default
+            False)
+        """
+
+        with self._lock:
+            self._add(evt, replace)
+
+    def add_events(self, events, replace=False):
+        """Adds events.
+
+        Parameters
+        ----------
+        events : iterable
+            The events to add
+        replace : bool
+            Whether or not the events replace the events listed with the same links at the same times (default
+            False)
+        """
+
+        with self._lock:
+            for evt in events:
+                self._add(evt, replace)
+
+    def remove(self, link):
+        """Removes every listing of an event page.
+
+        Parameters
+        ----------
+        link : str
+            The link of the event page (nothing is removed if no event has this link)
+        """
+
+        with self._lock:
+            for evt_id in list(self._ids.get(link, ())):
+                self._remove_id(evt_id)
+
+    def _matching_ids(self, keyword):
+        # Get the ids of the events that contain every word of the keyword, each as a prefix of one of their words
+        matches = None
+        for search_word in tokenize(keyword):
+            ids = set()
+            i = bisect_left(self._words, search_word)
+            while i < len(self._words) and self._words[i].startswith(search_word):
+                ids |= self._postings[self._words[i]]
+                i += 1
+            matches = ids if matches is None else matches & ids
+            if not matches:
+                return set()
+        return matches
+
+    def _time_ids(self, start, end):
+        # Get the ids of the events with a listing overlapping the time range, in order of (the first such listing's)
+        # start time
+        stop = (end, -1) if end is not None else None
+        short_begin = bisect_left(self._short, (start - self.long_duration, -1)) if start is not None else 0
+        short_end = bisect_left(self._short, stop) if stop else len(self._short)
+        long_end = bisect_left(self._long, stop) if stop else len(self._long)
+        seen = set()
+        for listing_start, evt_id in merge(self._short[short_begin:short_end], self._long[:long_end]):
+            if evt_id in seen:
+                continue
+            if start is None or any(listing_end >= start for s, listing_end in self._times[evt_id]
+                                    if s == listing_start):
+                seen.add(evt_id)
+                yield evt_id
+
+    def _first_listing(self, evt_id, start, end):
+        # Get the start time of the event's first listing overlapping the time range (None if none overlaps)
+        starts = [listing_start for listing_start, listing_end in self._times[evt_id]
+                  if listing_start is not None and (end is None or listing_start < end)
+                  and (start is None or listing_end >= start)]
+        return min(starts) if starts else None
+
+    def query(self, start=None, end=None, keyword=None):
+        """Gets the events in a time range that contain a keyword.
+
+        Parameters
+        ----------
+        start : int
+            The epoch timestamp the range starts at (default None -- no lower bound)
+        end : int
+            The epoch timestamp the range ends at, exclusive (default None -- no upper bound)
+        keyword : str
+            Words that the title, description, location, or additional info values must contain, ignoring case.
+            Each word also matches the words it begins (e.g. `career` matches `careers`) (default None -- every
+            event)
+
+        Returns
+        -------
+        list
+            The events with a listing (or occurrence) that overlaps the time range and that contain the keyword,
+            ordered by the start time of their first such listing (events without a start time are only included in
+            searches without a time range, last)
+        """
+
+        with self._lock:
+            # If searching by keyword, look up the (usually few) events containing it and check their times
+            if keyword and tokenize(keyword):
+                matches = []
+                for evt_id in self._matching_ids(keyword):
+                    first = self._first_listing(evt_id, start, end)
+                    if first is not None:
+                        matches.append((first, evt_id))
+                    elif start is None and end is None:
+                        matches.append((float('inf'), evt_id))
+                matches.sort()
+                return [self._events[evt_id] for _, evt_id in matches]
+
+            # Else, look up the events in the time range (followed by the events without a start time, if the range
+            # is unbounded)
+            events = [self._events[evt_id] for evt_id in self._time_ids(start, end)]
+            if start is None and end is None:
+                events += [evt for evt_id, evt in self._events.items()
+                           if all(listing_start is None for listing_start, _ in self._times[evt_id])]
+            return events
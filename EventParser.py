@@ -0,0 +1,232 @@
+import re
+from datetime import datetime, timedelta
+from functools import lru_cache
+from pytz import timezone
+
+
+# Regex for seeing if a string contains `Start` or `End`
+START_END_REGEX = r'(Starts|Ends):'
+# Regex for seeing if a string contains `All Day`
+ALL_DAY_REGEX = r'All\sDay'
+# Regex for retrieving the date from a string
+DATE_REGEX = r'(0?\d|1[0-2])/(0?\d|[12]\d|3[01])/([12]\d{3})'
+# Regex for retrieving the time from a string
+TIME_REGEX = r'(0?[0-9]|1[0-2]):([0-5][0-9])(:[0-5][0-9])?\s?[AP]\.?M\.?'
+# Regex for retrieving the contact name from a contact info string
+CONTACT_NAME_REGEX = r'^[a-zA-Z ,-]+$'
+# Regex for retrieving the phone number from a contact info string
+PHONE_NUMBER_REGEX = r'\(?\d{3}\)?(\s|-)?\d{3}(\s|-)?\d{4}'
+# Regex for retrieving the email from a contact info string
+EMAIL_REGEX = r'[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9.-]+'
+
+# Precompiled versions of the regexes above
+START_END_PATTERN = re.compile(START_END_REGEX)
+ALL_DAY_PATTERN = re.compile(ALL_DAY_REGEX)
+DATE_PATTERN = re.compile(DATE_REGEX)
+TIME_PATTERN = re.compile(TIME_REGEX)
+CONTACT_NAME_PATTERN = re.compile(CONTACT_NAME_REGEX, flags=re.MULTILINE)
+PHONE_NUMBER_PATTERN = re.compile(PHONE_NUMBER_REGEX)
+EMAIL_PATTERN = re.compile(EMAIL_REGEX)
+
+# Format of the start/end datetimes returned by the parser (MM/DD/YYYY HH:MM AM/PM UTC-OFFSET)
+OUTPUT_FORMAT = '%m/%d/%Y %I:%M %p %Z%z'
+
+
+# The dates, times, and timezones found on event pages repeat constantly, so each distinct string is parsed once.
+# strptime raises the same ValueError for an invalid string every time, and errors are never cached.
+@lru_cache(maxsize=4096)
+def _parse_date(date):
+    return datetime.strptime(date, '%m/%d/%Y')
+
+
+@lru_cache(maxsize=1024)
+def _parse_time(time):
+    return datetime.strptime(time, '%I:%M %p')
+
+
+@lru_cache(maxsize=64)
+def _get_timezone(tz):
+    return timezone(tz)
+
+
+@lru_cache(maxsize=16384)
+def _format_local(naive, tz):
+    # Localize a naive datetime to a timezone and format it as: MM/DD/YYYY HH:MM AM/PM UTC-OFFSET
+    return _get_timezone(tz).localize(naive).strftime(OUTPUT_FORMAT)
+
+
+def clear_caches():
+    """Forgets every memoized date, time, timezone, and formatted datetime (e.g. so that parsing can be timed from
+    scratch)."""
+
+    for cached in (_parse_date, _parse_time, _get_timezone, _format_local):
+        cached.cache_clear()
+
+
+# Start time of `All Day` events
+ALL_DAY_START = _parse_time('12:00 AM')
+# End time of `All Day` events
+ALL_DAY_END = _parse_time('11:59 PM')
+
+
+class EventParser:
+    """
+    Parses the raw date & time strings and contact information strings of events
+
+    Regexes are compiled once, and parsed dates, times, timezones, and formatted datetimes are memoized across
+    calls, so parsing a large number of events (e.g. re-parsing archived pages) avoids repeating the same work. The
+    results are identical to parsing each string from scratch.
+
+    Attributes
+    ----------
+    tz : str
+        the timezone of the events
+
+    Methods
+    -------
+    extract_date_time(raw_date_time)
+        extracts the start and end datetimes from a raw string
+    extract_date_times(raw_date_times)
+        extracts the start and end datetimes from each raw string of a page
+    extract_contact_info(raw_contact)
+        extracts the contact information from a raw string of contact info
+    extract_contact_infos(raw_contacts)
+        extracts the contact information from each raw string of contact info of a page
+    """
+
+    def __init__(self, tz='US/Eastern'):
+        """
+        Parameters
+        ----------
+        tz : str
+            The timezone of the events (default US/Eastern)
+        """
+
+        self.tz = tz
+
+    def extract_date_time(self, raw_date_time):
+        """Extract the date & time from a raw string.
+
+        Parameters
+        ----------
+        raw_date_time : str
+            The raw string containing information about an event's date & time
+
+        Returns
+        -------
+        tuple (str, str)
+            The event start datetime and event end datetime, both formatted as: MM/DD/YYYY HH:MM AM/PM UTC-OFFSET
+        """
+
+        start_date, end_date, start_time, end_time = None, None, None, None
+
+        # If an event is `All Day`, set the start time to be 12:00 AM and end time to be 11:59 PM
+        if ALL_DAY_PATTERN.search(raw_date_time):
+            start_time = ALL_DAY_START
+            end_time = ALL_DAY_END
+
+        # Extract the start and end dates of an event
+        has_start_end = None
+        for match in DATE_PATTERN.finditer(raw_date_time):
+            date = _parse_date(match.group())
+            if has_start_end is None:
+                has_start_end = START_END_PATTERN.search(raw_date_time) is not None
+
+            # If the event has distinct start and end dates, extract them
+            if has_start_end:
+                if start_date:
+                    end_date = date
+                else:
+                    start_date = date
+            # Else, set the start and end dates to the same date
+            else:
+                start_date = date
+                end_date = date
+
+        # Extract the start and end times of an event
+        for match in TIME_PATTERN.finditer(raw_date_time):
+            if start_time:
+                end_time = _parse_time(match.group())
+            else:
+                start_time = _parse_time(match.group())
+
+        # If end_date is None, set it to start_date
+        if not end_date:
+            end_date = start_date
+
+        # If end_time is None, set it to two hours after start_time
+        if not end_time:
+            end_time = start_time + timedelta(hours=2)
+
+        # Combine the start/end dates & start/end times into datetime objects
+        start = datetime.combine(start_date.date(), start_time.time())
+        end = datetime.combine(end_date.date(), end_time.time())
+
+        # Add timezones to the datetime objects and format them
+        return _format_local(start, self.tz), _format_local(end, self.tz)
+
+    def extract_date_times(self, raw_date_times):
+        """Extract the dates & times from every raw string of a page.
+
+        Parameters
+        ----------
+        raw_date_times : iterable
+            The raw strings containing information about events' dates & times
+
+        Returns
+        -------
+        list
+            A (start, end) tuple for each raw string, in the same order
+        """
+
+        return [self.extract_date_time(raw_date_time) for raw_date_time in raw_date_times]
+
+    @staticmethod
+    def extract_contact_info(raw_contact):
+        """Extract the contact information from a raw string of contact info.
+
+        Parameters
+        ----------
+        raw_contact : str
+            The raw string containing information about the contact info for an event.
+
+        Returns
+        -------
+        dict
+            A dictionary containing contact information (name, phone number, email)
+        """
+
+        parsed_data = {}
+
+        # Extract the name of the contact
+        contact_names = CONTACT_NAME_PATTERN.findall(raw_contact)
+        if contact_names:
+            parsed_data['name'] = '\n'.join(contact_names)
+
+        # Extract the email of the contact (the last one, if there are several); an email cannot exist without an `@`
+        if '@' in raw_contact:
+            for match in EMAIL_PATTERN.finditer(raw_contact):
+                parsed_data['email'] = match.group()
+
+        # Extract the phone number of the contact (the last one, if there are several)
+        for match in PHONE_NUMBER_PATTERN.finditer(raw_contact):
+            parsed_data['phone_number'] = match.group()
+
+        # Return the extracted contact info dictionary
+        return parsed_data
+
+    def extract_contact_infos(self, raw_contacts):
+        """Extract the contact information from every raw string of contact info of a page.
+
+        Parameters
+        ----------
+        raw_contacts : iterable
+            The raw strings containing information about the contact info for events.
+
+        Returns
+        -------
+        list
+            A contact information dictionary for each raw string, in the same order
+        """
+
+        return [self.extract_contact_info(raw_contact) for raw_contact in raw_contacts]
@@ -0,0 +1,74 @@
+import os
+from Event import Event
+
+# Use PyArrow to read Parquet and Arrow IPC files if it is installed.
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+
+def _iter_batches(path, columns=None):
+    # Yield the record batches of a Parquet (.parquet) or Arrow IPC (.arrow) export, one row group at a time
+    if pa is None:
+        raise ImportError('PyArrow must be installed to read events from a Parquet or Arrow file.')
+    if os.path.splitext(path)[1].lower() == '.parquet':
+        yield from pq.ParquetFile(path).iter_batches(columns=columns)
+    else:
+        with pa.memory_map(path) as source:
+            reader = pa.ipc.open_file(source)
+            for i in range(reader.num_record_batches):
+                batch = reader.get_batch(i)
+                yield batch.select(columns) if columns else batch
+
+
+def read_event_table(path, columns=None):
+    """Read a Parquet or Arrow IPC export of events into a table of columns.
+
+    Parameters
+    ----------
+    path : str
+        The file path of the export (.parquet or .arrow).
+    columns : list
+        The names of the columns to read (default all columns).
+
+    Returns
+    -------
+    pyarrow.Table
+        The events of the export, with one column per field.
+    """
+
+    if pa is None:
+        raise ImportError('PyArrow must be installed to read events from a Parquet or Arrow file.')
+    if os.path.splitext(path)[1].lower() == '.parquet':
+        return pq.read_table(path, columns=columns)
+    with pa.memory_map(path) as source:
+        table = pa.ipc.open_file(source).read_all()
+    return table.select(columns) if columns else table
+
+
+def read_events(path):
+    """Read a Parquet or Arrow IPC export back into events, one row group at a time.
+
+    Parameters
+    ----------
+    path : str
+        The file path of the export (.parquet or .arrow).
+
+    Yields
+    ------
+    Event
+        The events of the export, in the order they were exported.
+    """
+
+    for batch in _iter_batches(path):
+        for row in batch.to_pylist():
+            evt = Event(row['title'], row['link'], row['start'], row['end'])
+            evt.description = row['description']
+            evt.location = row['location']
+            evt.contact = dict(row['contact']) if row['contact'] is not None else None
+            evt.additional_info = dict(row['additional_info']) if row['additional_info'] is not None else None
+            if row['occurrences']:
+                evt.occurrences = [(occurrence['start'], occurrence['end']) for occurrence in row['occurrences']]
+            yield evt
@@ -0,0 +1,286 @@
+import json
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+from pytz import timezone
+from EventIndex import EventIndex
+from UBEventsCalendarScraper import UBEventsCalendarScraper
+from ShardedScraper import scrape_sharded
+from Metrics import metrics
+
+
+# Number of samples kept per metrics histogram while the service runs, so that its metrics take bounded memory.
+METRICS_SAMPLES = 10000
+
+
+def parse_query_time(text, tz='US/Eastern', end=False):
+    """Parse a date or date & time given in a query into an epoch timestamp.
+
+    Parameters
+    ----------
+    text : str
+        An ISO 8601 date (YYYY-MM-DD) or date & time (YYYY-MM-DDTHH:MM, with an optional UTC offset)
+    tz : str
+        The timezone of a date & time without a UTC offset (default `US/Eastern`)
+    end : bool
+        Whether or not the time ends a range, so that a date alone covers the whole day (default False)
+
+    Returns
+    -------
+    int
+        The number of seconds since the epoch
+
+    Raises
+    ------
+    ValueError
+        If the text is not an ISO 8601 date or date & time
+    """
+
+    moment = datetime.fromisoformat(text)
+    if end and len(text) == 10:
+        moment += timedelta(days=1)
+    if moment.tzinfo is None:
+        moment = timezone(tz).localize(moment)
+    return int(moment.timestamp())
+
+
+class EventService:
+    """
+    Long-running service that keeps a web scraper resident, re-scrapes the calendar on a schedule, and serves the
+    current events over a local HTTP API
+
+    Every refresh scrapes the calendar (per the configuration settings) and swaps in an index of the scraped events
+    at once, so queries never see a half-finished refresh. If a refresh fails, the previous events keep being served
+    and the scraper is recreated for the next refresh. If the configuration scrapes incrementally, only new and
+    changed events are scraped, so they replace the events listed with the same links at the same times in the current
+    index (at first, of the stored events) instead.
+
+    Endpoints
+    ---------
+    GET /events?start=<date/time>&end=<date/time>&q=<keyword>
+        the events happening between `start` and `end` (ISO 8601, each optional) whose title, description,
+        location, or additional info contain the words of `q` (case insensitive, optional)
+    GET /status
+        the number of events, the time of the last refresh, and the error of the last refresh (if it failed)
+
+    Attributes
+    ----------
+    config : Configuration
+        configuration settings of the web scraper
+    refresh_interval : int
+        number of seconds between the start of one refresh and the next
+    url : str
+        the url of the service's HTTP API
+    index : EventIndex
+        the index of the events currently served
+    refreshed_at : float
+        when the last successful refresh finished (None until the first one)
+    last_error : str
+        the error of the last refresh, or None if it succeeded
+
+    Methods
+    -------
+    refresh()
+        scrapes the calendar and swaps in the scraped events
+    query(start=None, end=None, keyword=None)
+        gets the current events in a time range that contain a keyword
+    serve_forever()
+        refreshes on schedule and serves the HTTP API until the service is stopped
+    start()
+        refreshes and serves the HTTP API on background threads
+    stop()
+        stops the service and quits the web scraper
+    """
+
+    def __init__(self, config, refresh_interval=3600, host='127.0.0.1', port=8080):
+        """
+        Parameters
+        ----------
+        config : Configuration
+            Configuration settings of the web scraper
+        refresh_interval : int
+            Number of seconds between the start of one refresh and the next (default 3600 seconds)
+        host : str
+            The local address to serve the HTTP API on (default `127.0.0.1`)
+        port : int
+            The port to serve the HTTP API on (default 8080, 0 for any free port)
+        """
+
+        self.config = config
+        self.refresh_interval = refresh_interval
+        # Every query and refresh adds samples for as long as the service runs, so only keep a reservoir of them
+        metrics.max_samples = METRICS_SAMPLES
+        self.index = EventIndex()
+        self.refreshed_at = None
+        self.last_error = None
+        self._scraper = None
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._server = ThreadingHTTPServer((host, port), self._create_handler())
+        self._server.daemon_threads = True
+        self._threads = []
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return 'http://{}:{}/'.format(host, port)
+
+    def _scrape(self):
+        # Scrape the calendar in worker processes if the configuration allows more than one shard
+        if self.config.shards > 1:
+            return list(scrape_sharded(self.config))
+
+        # Else, scrape it with the resident scraper (created on the refresh thread, which is the only one using it),
+        # starting over from the calendar's first page
+        if self._scraper is None:
+            self._scraper = UBEventsCalendarScraper(self.config)
+        else:
+            self._scraper.restart()
+        return self._scraper.scrape_events()
+
+    def refresh(self):
+        """Scrapes the calendar and swaps in the scraped events.
+
+        Returns
+        -------
+        bool
+            True -- if the refresh succeeded
+            False -- otherwise (the previous events are kept)
+        """
+
+        try:
+            with metrics.timer('refresh_seconds'):
+                events = self._scrape()
+
+            # If scraping incrementally, only new and changed events were scraped, so replace their listings in the
+            # current index (at first, an index of the events already in the event store)
+            if self.config.store_path:
+                if self.refreshed_at is None and self._scraper and self._scraper.event_store:
+                    self.index = EventIndex(self._scraper.event_store.get_all())
+                self.index.add_events(events, replace=True)
+            # Else, index the scraped events and swap the index in
+            else:
+                self.index = EventIndex(events)
+
+        # Any error (a broken session, the network, or a page that cannot be parsed) only fails this refresh, so that
+        # the refreshes keep to their schedule
+        except Exception as e:
+            # Discard the scraper, since its session may be broken, so that the next refresh starts a new one
+            if self._scraper:
+                try:
+                    self._scraper.quit()
+                except Exception:
+                    pass
+                self._scraper = None
+            with self._lock:
+                self.last_error = '{}: {}'.format(e.__class__.__name__, str(e).strip())
+            metrics.increment('refresh_failures')
+            return False
+
+        with self._lock:
+            self.refreshed_at = time.time()
+            self.last_error = None
+        metrics.increment('refreshes')
+        return True
+
+    def query(self, start=None, end=None, keyword=None):
+        """Gets the current events in a time range that contain a keyword.
+
+        Parameters
+        ----------
+        start : int
+            The epoch timestamp the range starts at (default None -- no lower bound)
+        end : int
+            The epoch timestamp the range ends at, exclusive (default None -- no upper bound)
+        keyword : str
+            Words that the title, description, location, or additional info values must contain (or begin with),
+            ignoring case (default None -- every event)
+
+        Returns
+        -------
+        list
+            The events that overlap the time range and contain the keyword, ordered by start time
+        """
+
+        return self.index.query(start, end, keyword)
+
+    def _create_handler(self):
+        service = self
+
+        class EventRequestHandler(BaseHTTPRequestHandler):
+
+            def reply(self, status, value):
+                body = json.dumps(value).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                metrics.increment('api_requests')
+                url = urlsplit(self.path)
+                params = {name: values[-1] for name, values in parse_qs(url.query).items()}
+
+                if url.path == '/status':
+                    return self.reply(200, {'events': len(service.index), 'refreshed_at': service.refreshed_at,
+                                            'last_error': service.last_error})
+                if url.path != '/events':
+                    return self.reply(404, {'error': '`{}` not found'.format(url.path)})
+
+                # Filter the events by time range and keyword
+                try:
+                    start = parse_query_time(params['start']) if 'start' in params else None
+                    end = parse_query_time(params['end'], end=True) if 'end' in params else None
+                except ValueError as e:
+                    return self.reply(400, {'error': str(e)})
+                with metrics.timer('query_seconds'):
+                    events = service.query(start, end, params.get('q'))
+                self.reply(200, [evt.to_dict() for evt in events])
+
+            def log_message(self, format, *args):
+                pass
+
+        return EventRequestHandler
+
+    def _refresh_forever(self):
+        # Refresh on schedule until the service is stopped
+        while not self._stopped.is_set():
+            begin = time.monotonic()
+            self.refresh()
+            self._stopped.wait(max(0, self.refresh_interval - (time.monotonic() - begin)))
+
+    def serve_forever(self):
+        """Refreshes on schedule and serves the HTTP API until the service is stopped."""
+
+        self.start()
+        self._stopped.wait()
+
+    def start(self):
+        """Refreshes and serves the HTTP API on background threads."""
+
+        self._threads = [threading.Thread(target=self._refresh_forever, daemon=True),
+                         threading.Thread(target=self._server.serve_forever, daemon=True)]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self):
+        """Stops the service and quits the web scraper (once the refresh in progress, if any, has finished)."""
+
+        self._stopped.set()
+        self._server.shutdown()
+        self._server.server_close()
+        for thread in self._threads:
+            thread.join()
+        if self._scraper:
+            self._scraper.quit()
+            self._scraper = None
@@ -0,0 +1,164 @@
+import os
+import json
+import sqlite3
+import time
+import hashlib
+from Event import Event
+
+
+class EventStore:
+    """
+    Persistent SQLite store of previously scraped events, keyed by link and start time
+
+    Every listing of an event page (e.g. each day of a recurring event) is stored on its own, with a hash of the
+    content shown for it on the calendar's list pages (title, start, and end), so a listing can be recognized as new,
+    changed, or unchanged before it is deep scraped.
+
+    Attributes
+    ----------
+    path : str
+        file path of the store's SQLite database
+
+    Methods
+    -------
+    content_hash(evt)
+        hashes the list page content of an event
+    is_unchanged(evt)
+        sees whether or not an event is already stored with the same content
+    upsert(events)
+        inserts new events and updates changed events
+    get(link, start=None)
+        gets a stored event
+    get_all()
+        gets every stored event
+    close()
+        closes the store's database
+    """
+
+    def __init__(self, path):
+        """
+        Parameters
+        ----------
+        path : str
+            File path of the store's SQLite database
+        """
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self._db = sqlite3.connect(path, timeout=30)
+        # Listings without a start time are keyed by an empty start, since NULLs are never equal in a primary key.
+        # Listings are ordered by their epoch start timestamp, since the formatted start times do not sort as text.
+        self._db.execute('CREATE TABLE IF NOT EXISTS events (link TEXT NOT NULL, start_key TEXT NOT NULL, '
+                         'start_ts INTEGER, hash TEXT NOT NULL, title TEXT, start TEXT, end TEXT, description TEXT, '
+                         'location TEXT, contact TEXT, additional_info TEXT, last_seen REAL NOT NULL, '
+                         'PRIMARY KEY (link, start_key))')
+        self._db.commit()
+
+    @staticmethod
+    def content_hash(evt):
+        """Hashes the list page content (title, start, and end) of an event.
+
+        Parameters
+        ----------
+        evt : Event
+            The event to hash
+
+        Returns
+        -------
+        str
+            The hex digest of the event's list page content
+        """
+
+        content = '\x1f'.join(str(value) for value in (evt.title, evt.start, evt.end))
+        return hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+    def is_unchanged(self, evt):
+        """Sees whether or not an event is already stored with the same list page content (at the same start time).
+
+        Parameters
+        ----------
+        evt : Event
+            The event to look up
+
+        Returns
+        -------
+        bool
+            True -- if an event with the same link, start time, and content hash is stored
+            False -- otherwise
+        """
+
+        row = self._db.execute('SELECT hash FROM events WHERE link = ? AND start_key = ?',
+                               (evt.link, evt.start or '')).fetchone()
+        return row is not None and row[0] == self.content_hash(evt)
+
+    def upsert(self, events):
+        """Inserts new events and updates changed events (by link and start time).
+
+        Parameters
+        ----------
+        events : list
+            The events to insert or update, including every listing of a repeated event page
+        """
+
+        now = time.time()
+        self._db.executemany('INSERT OR REPLACE INTO events VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                             [(evt.link, evt.start or '', evt.start_ts, self.content_hash(evt), evt.title, evt.start,
+                               evt.end, evt.description, evt.location, json.dumps(evt.contact),
+                               json.dumps(evt.additional_info), now)
+                              for evt in events])
+        self._db.commit()
+
+    def get(self, link, start=None):
+        """Gets a stored event.
+
+        Parameters
+        ----------
+        link : str
+            The link of the event
+        start : str
+            The start time of the listing to get (default None -- the earliest stored listing of the event, or a
+            listing without a start time if none has one)
+
+        Returns
+        -------
+        Event
+            The stored event, or None if no event with this link (and start time) is stored
+        """
+
+        if start is None:
+            row = self._db.execute('SELECT link, title, start, end, description, location, contact, additional_info '
+                                   'FROM events WHERE link = ? ORDER BY start_ts IS NULL, start_ts LIMIT 1',
+                                   (link,)).fetchone()
+        else:
+            row = self._db.execute('SELECT link, title, start, end, description, location, contact, additional_info '
+                                   'FROM events WHERE link = ? AND start_key = ?', (link, start)).fetchone()
+        return self._to_event(row) if row is not None else None
+
+    @staticmethod
+    def _to_event(row):
+        link, title, start, end, description, location, contact, additional_info = row
+        evt = Event(title, link, start, end)
+        evt.description = description
+        evt.location = location
+        evt.contact = json.loads(contact)
+        evt.additional_info = json.loads(additional_info)
+        return evt
+
+    def get_all(self):
+        """Gets every stored event.
+
+        Returns
+        -------
+        list
+            The stored events, one per listing
+        """
+
+        rows = self._db.execute('SELECT link, title, start, end, description, location, contact, additional_info '
+                                'FROM events').fetchall()
+        return [self._to_event(row) for row in rows]
+
+    def close(self):
+        """Closes the store's database."""
+
+        self._db.close()
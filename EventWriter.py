@@ -0,0 +1,304 @@
+import json
+import xml.etree.ElementTree as ET
+from xml.dom import minidom
+
+# Use PyYAML to write YAML files if it is installed.
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+# Use PyArrow to write Parquet and Arrow IPC files if it is installed.
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+from Event import parse_timestamp
+from Metrics import metrics
+
+
+def convert_dict_to_xml(parent, dictionary):
+    """Convert a dictionary to a set of nested XML elements.
+
+    Parameters
+    ----------
+    parent : Element
+        The XML element that this XML element will be nested in.
+    dictionary : dict
+        The dictionary that will be converted to a set of nested XML elements.
+    """
+
+    # Loop through all key-value pairs in this dictionary
+    for key, value in dictionary.items():
+        # If this key has no value associated with it, continue to the next key
+        if not value:
+            continue
+        # Create a new XML element with this key and nest it within the parent element
+        element = ET.SubElement(parent, key)
+        # If the value is a dictionary, recursively call this method
+        # and have the converted dictionary be nested within element
+        if isinstance(value, dict):
+            convert_dict_to_xml(element, value)
+        # If the value is a list of dictionaries, nest each one within element as an element named after the
+        # singular of the key (e.g. <occurrences><occurrence>...</occurrence></occurrences>)
+        elif isinstance(value, list):
+            for item in value:
+                convert_dict_to_xml(ET.SubElement(element, key[:-1]), item)
+        # Otherwise, set value to be this element's text value
+        else:
+            element.text = value
+
+
+class EventWriter:
+    """
+    Base class for writers that export events to a file one at a time, as they are scraped
+
+    Only the event being written is held in memory, and the file is flushed every `flush_interval` events so that
+    a partial export is on disk while a crawl is still running.
+
+    Attributes
+    ----------
+    path : str
+        the destination file path of the export
+    flush_interval : int
+        number of events written between flushes of the file
+    count : int
+        number of events written so far
+
+    Methods
+    -------
+    write(evt)
+        writes an event to the file
+    write_dict(evt_dict)
+        writes an event (already converted to a dictionary) to the file
+    close()
+        finishes and closes the file
+    """
+
+    def __init__(self, path, flush_interval=100):
+        """
+        Parameters
+        ----------
+        path : str
+            The destination file path of the export
+        flush_interval : int
+            Number of events written between flushes of the file (default 100)
+        """
+
+        self.path = path
+        self.flush_interval = flush_interval
+        self.count = 0
+        self._file = open(path, 'w')
+        self._write_header()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _write_header(self):
+        pass
+
+    def _write_event(self, evt_dict):
+        raise NotImplementedError
+
+    def _write_footer(self):
+        pass
+
+    def write(self, evt):
+        """Writes an event to the file.
+
+        Parameters
+        ----------
+        evt : Event
+            The event to be written
+        """
+
+        self.write_dict(evt.to_dict())
+
+    def write_dict(self, evt_dict):
+        """Writes an event (already converted to a dictionary) to the file.
+
+        Parameters
+        ----------
+        evt_dict : dict
+            The event to be written
+        """
+
+        with metrics.timer('export_seconds'):
+            self._write_event(evt_dict)
+        self.count += 1
+        metrics.increment('events_exported')
+        if self.count % self.flush_interval == 0:
+            self._file.flush()
+
+    def close(self):
+        """Finishes and closes the file."""
+
+        if not self._file.closed:
+            self._write_footer()
+            self._file.close()
+
+
+class JSONEventWriter(EventWriter):
+    """Writes events to a JSON file ({"events": [...]}, indented by 4 spaces)."""
+
+    def _write_header(self):
+        self._file.write('{\n    "events": [')
+
+    def _write_event(self, evt_dict):
+        # Indent the event to sit within the `events` list
+        evt_json = json.dumps(evt_dict, indent=4).replace('\n', '\n        ')
+        self._file.write('{}\n        {}'.format(',' if self.count else '', evt_json))
+
+    def _write_footer(self):
+        self._file.write('\n    ]\n}' if self.count else ']\n}')
+
+
+class NDJSONEventWriter(EventWriter):
+    """Writes events to a newline-delimited JSON file (one JSON object per line)."""
+
+    def _write_event(self, evt_dict):
+        self._file.write(json.dumps(evt_dict))
+        self._file.write('\n')
+
+
+class XMLEventWriter(EventWriter):
+    """Writes events to an XML file (<events><event>...</event></events>, indented by 2 spaces)."""
+
+    def _write_header(self):
+        self._file.write('<?xml version="1.0" ?>\n')
+
+    def _write_event(self, evt_dict):
+        if self.count == 0:
+            self._file.write('<events>\n')
+        # Convert the event and its information within <event>, and `prettify` it to sit one level within <events>
+        evt_element = ET.Element('event')
+        convert_dict_to_xml(evt_element, evt_dict)
+        minidom.parseString(ET.tostring(evt_element)).documentElement.writexml(self._file, '  ', '  ', '\n')
+
+    def _write_footer(self):
+        self._file.write('</events>\n' if self.count else '<events/>\n')
+
+
+class YAMLEventWriter(EventWriter):
+    """Writes events to a YAML file (events: [...])."""
+
+    def __init__(self, path, flush_interval=100):
+        if yaml is None:
+            raise ImportError('PyYAML must be installed to export events to a YAML file.')
+        EventWriter.__init__(self, path, flush_interval)
+
+    def _write_event(self, evt_dict):
+        if self.count == 0:
+            self._file.write('events:\n')
+        self._file.write(yaml.dump([evt_dict], default_flow_style=False))
+
+    def _write_footer(self):
+        if self.count == 0:
+            self._file.write('events: []\n')
+
+
+class ColumnarEventWriter(EventWriter):
+    """
+    Base class for writers that export events to a columnar (Apache Arrow) file
+
+    Events are buffered and written as a row group/record batch every `flush_interval` events, so only the events
+    of one row group are held in memory. Besides the formatted start/end strings, the start/end times are written as
+    UTC timestamp columns, and locations are dictionary encoded.
+    """
+
+    def __init__(self, path, flush_interval=1000):
+        """
+        Parameters
+        ----------
+        path : str
+            The destination file path of the export
+        flush_interval : int
+            Number of events written per row group (default 1000)
+        """
+
+        if pa is None:
+            raise ImportError('PyArrow must be installed to export events to a Parquet or Arrow file.')
+        self.path = path
+        self.flush_interval = flush_interval
+        self.count = 0
+        self._rows = []
+        self._locations = {}
+        self._file = pa.OSFile(path, 'wb')
+        self._writer = self._open_writer()
+
+    def _open_writer(self):
+        raise NotImplementedError
+
+    def _write_event(self, evt_dict):
+        self._rows.append(evt_dict)
+        if len(self._rows) >= self.flush_interval:
+            self._write_rows()
+
+    def _write_rows(self):
+        # Convert the buffered events into columns and write them as one row group
+        columns = {name: [row.get(name) for row in self._rows] for name in EVENT_SCHEMA.names
+                   if not name.endswith('_ts')}
+        for name in ('start', 'end'):
+            columns[name + '_ts'] = [parse_timestamp(value)[0] if value else None for value in columns[name]]
+        # Encode locations against one dictionary that only grows, so that every row group's dictionary extends the
+        # previous one's (Arrow IPC files cannot replace a dictionary between record batches)
+        indices = [None if value is None else self._locations.setdefault(value, len(self._locations))
+                   for value in columns['location']]
+        columns['location'] = pa.DictionaryArray.from_arrays(pa.array(indices, pa.int32()),
+                                                             pa.array(list(self._locations), pa.string()))
+        self._writer.write_table(pa.Table.from_pydict(columns, schema=EVENT_SCHEMA))
+        self._rows = []
+
+    def _write_footer(self):
+        if self._rows:
+            self._write_rows()
+        self._writer.close()
+
+
+class ParquetEventWriter(ColumnarEventWriter):
+    """Writes events to a Parquet file (one row group every `flush_interval` events)."""
+
+    def _open_writer(self):
+        return pq.ParquetWriter(self._file, EVENT_SCHEMA)
+
+
+class ArrowEventWriter(ColumnarEventWriter):
+    """Writes events to an Arrow IPC file (one record batch every `flush_interval` events)."""
+
+    def _open_writer(self):
+        return pa.ipc.new_file(self._file, EVENT_SCHEMA,
+                               options=pa.ipc.IpcWriteOptions(emit_dictionary_deltas=True))
+
+
+# Schema of the events in Parquet and Arrow IPC exports.
+EVENT_SCHEMA = pa.schema([
+    ('title', pa.string()),
+    ('link', pa.string()),
+    ('start', pa.string()),
+    ('end', pa.string()),
+    ('description', pa.string()),
+    ('location', pa.dictionary(pa.int32(), pa.string())),
+    ('contact', pa.map_(pa.string(), pa.string())),
+    ('additional_info', pa.map_(pa.string(), pa.string())),
+    ('occurrences', pa.list_(pa.struct([('start', pa.string()), ('end', pa.string())]))),
+    ('start_ts', pa.timestamp('s', tz='UTC')),
+    ('end_ts', pa.timestamp('s', tz='UTC')),
+]) if pa is not None else None
+
+
+# Map of export file types to the writer that exports events to that file type.
+EVENT_WRITERS = {
+    'json': JSONEventWriter,
+    'ndjson': NDJSONEventWriter,
+    'jsonl': NDJSONEventWriter,
+    'xml': XMLEventWriter,
+    'yaml': YAMLEventWriter,
+    'yml': YAMLEventWriter,
+    'parquet': ParquetEventWriter,
+    'arrow': ArrowEventWriter,
+}
@@ -0,0 +1,547 @@
+import xml.etree.ElementTree as ET
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+import urllib3
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import NoSuchElementException, WebDriverException
+
+# Use lxml to parse pages if it is installed, otherwise fall back to the standard library's html.parser.
+try:
+    import lxml.html
+except ImportError:
+    lxml = None
+
+
+# Default User-Agent header sent with every request.
+USER_AGENT = 'Mozilla/5.0 (compatible; UB-Events-Calendar-Web-Scraper)'
+# Set of HTML elements that never have any content or an end tag.
+VOID_ELEMENTS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'param', 'source',
+                 'track', 'wbr'}
+# Set of HTML elements whose content is never rendered as text.
+HIDDEN_ELEMENTS = {'head', 'script', 'style', 'template', 'noscript'}
+# Set of HTML elements that are rendered on their own line(s).
+BLOCK_ELEMENTS = {'address', 'article', 'aside', 'blockquote', 'dd', 'div', 'dl', 'dt', 'fieldset', 'figure',
+                  'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'hr', 'li', 'main', 'nav', 'ol',
+                  'p', 'pre', 'section', 'table', 'tr', 'ul'}
+
+
+class HTTPStatusError(WebDriverException):
+    """An exception that indicates a page was answered with an HTTP error status code."""
+
+    def __init__(self, url, status):
+        """
+        Parameters
+        ----------
+        url : str
+            The url that was requested
+        status : int
+            The HTTP status code of the response
+        """
+
+        WebDriverException.__init__(self, 'Received HTTP {} from {}'.format(status, url))
+        self.url = url
+        self.status = status
+
+
+class _TreeBuilder(HTMLParser):
+    """Builds an ElementTree out of (possibly malformed) HTML using the standard library's html.parser."""
+
+    def __init__(self):
+        HTMLParser.__init__(self, convert_charrefs=True)
+        self.root = ET.Element('document')
+        self.stack = [self.root]
+
+    def handle_starttag(self, tag, attrs):
+        elem = ET.SubElement(self.stack[-1], tag, {name: value or '' for name, value in attrs})
+        # Void elements cannot contain anything, so they are never pushed on to the stack of open elements
+        if tag not in VOID_ELEMENTS:
+            self.stack.append(elem)
+
+    def handle_startendtag(self, tag, attrs):
+        ET.SubElement(self.stack[-1], tag, {name: value or '' for name, value in attrs})
+
+    def handle_endtag(self, tag):
+        # Close the most recently opened element with this tag (and any unclosed elements within it).
+        # End tags without a matching open element are ignored.
+        for idx in range(len(self.stack) - 1, 0, -1):
+            if self.stack[idx].tag == tag:
+                del self.stack[idx:]
+                break
+
+    def handle_data(self, data):
+        parent = self.stack[-1]
+        # Text that follows a child element is stored as that child's tail, otherwise as the parent's text
+        if len(parent):
+            parent[-1].tail = (parent[-1].tail or '') + data
+        else:
+            parent.text = (parent.text or '') + data
+
+
+def parse_html(html):
+    """Parse an HTML string into a tree of elements.
+
+    Parameters
+    ----------
+    html : str
+        The HTML source of a web page
+
+    Returns
+    -------
+    Element
+        The root element of the parsed page
+    """
+
+    if lxml is not None and html.strip():
+        return lxml.html.document_fromstring(html)
+    builder = _TreeBuilder()
+    builder.feed(html)
+    builder.close()
+    return builder.root
+
+
+def _collect_text(elem, parts):
+    """Append the rendered text of an element and all of its descendants to `parts`."""
+
+    # Skip comments/processing instructions (lxml) and elements that are never rendered
+    if not isinstance(elem.tag, str) or elem.tag in HIDDEN_ELEMENTS:
+        return
+    if elem.tag == 'br':
+        parts.append('\n')
+        return
+
+    block = elem.tag in BLOCK_ELEMENTS
+    if block:
+        parts.append('\n')
+    if elem.text:
+        parts.append(elem.text.replace('\n', ' '))
+    for child in elem:
+        _collect_text(child, parts)
+        if child.tail:
+            parts.append(child.tail.replace('\n', ' '))
+    if block:
+        parts.append('\n')
+
+
+def render_text(elem):
+    """Render the visible text of an element the way a browser would (like WebElement.text).
+
+    Parameters
+    ----------
+    elem : Element
+        The element whose text will be rendered
+
+    Returns
+    -------
+    str
+        The rendered text, with whitespace collapsed and one line per line break/block element
+    """
+
+    parts = []
+    _collect_text(elem, parts)
+    lines = (' '.join(line.split()) for line in ''.join(parts).split('\n'))
+    return '\n'.join(line for line in lines if line)
+
+
+class _SearchContext:
+    """
+    Mixin that implements the subset of the Selenium WebDriver element lookup API used by the scrapers
+
+    Subclasses must set `_root` (the element to search within) and `_document` (the HTMLDocument it belongs to).
+    """
+
+    def _find_all(self, by, value):
+        # Look up an element's parent (xpath `..`)
+        if by == By.XPATH and value == '..':
+            parent = self._document.get_parent(self._root)
+            return [] if parent is None else [parent]
+
+        # Look up all descendants with the class name `value`
+        if by == By.CLASS_NAME:
+            return [elem for elem in self._root.iter()
+                    if elem is not self._root and isinstance(elem.tag, str)
+                    and value in (elem.get('class') or '').split()]
+
+        # Look up all descendants matching the (ElementPath subset of) xpath `value`
+        if by == By.XPATH:
+            return self._root.findall(value)
+
+        # Look up all descendants with the tag name `value`
+        if by == By.TAG_NAME:
+            return [elem for elem in self._root.iter(value) if elem is not self._root]
+
+        raise WebDriverException('Unsupported locator strategy `{}`'.format(by))
+
+    def find_elements(self, by=By.XPATH, value=None):
+        return [HTMLElement(elem, self._document) for elem in self._find_all(by, value)]
+
+    def find_element(self, by=By.XPATH, value=None):
+        elems = self._find_all(by, value)
+        if not elems:
+            raise NoSuchElementException('Unable to locate element: {{"method":"{}","selector":"{}"}}'
+                                         .format(by, value))
+        return HTMLElement(elems[0], self._document)
+
+    def find_elements_by_xpath(self, xpath):
+        return self.find_elements(By.XPATH, xpath)
+
+    def find_element_by_xpath(self, xpath):
+        return self.find_element(By.XPATH, xpath)
+
+    def find_elements_by_class_name(self, name):
+        return self.find_elements(By.CLASS_NAME, name)
+
+    def find_element_by_class_name(self, name):
+        return self.find_element(By.CLASS_NAME, name)
+
+    def find_elements_by_tag_name(self, name):
+        return self.find_elements(By.TAG_NAME, name)
+
+    def find_element_by_tag_name(self, name):
+        return self.find_element(By.TAG_NAME, name)
+
+
+class HTMLElement(_SearchContext):
+    """
+    An element of a parsed web page that behaves like a Selenium WebElement
+
+    Attributes
+    ----------
+    tag_name : str
+        the tag name of the element
+    text : str
+        the visible text of the element
+
+    Methods
+    -------
+    get_attribute(name)
+        gets the value of one of the element's attributes
+    click()
+        follows the element's hyperlink
+    """
+
+    def __init__(self, elem, document):
+        """
+        Parameters
+        ----------
+        elem : Element
+            The underlying parsed element
+        document : HTMLDocument
+            The web page that the element belongs to
+        """
+
+        self._root = elem
+        self._document = document
+
+    @property
+    def tag_name(self):
+        return self._root.tag
+
+    @property
+    def text(self):
+        return render_text(self._root)
+
+    def get_attribute(self, name):
+        """Gets the value of one of the element's attributes.
+
+        Parameters
+        ----------
+        name : str
+            The name of the attribute
+
+        Returns
+        -------
+        str
+            The value of the attribute (hyperlinks are resolved into absolute urls), or None if it does not exist
+        """
+
+        value = self._root.get(name)
+        if value is not None and name in {'href', 'src', 'action'}:
+            value = urljoin(self._document.current_url, value)
+        return value
+
+    def click(self):
+        """Follows the element's hyperlink (or the hyperlink of the closest link it is nested within).
+
+        Raises
+        ------
+        WebDriverException
+            If the element is not within a hyperlink, or if it does not belong to a browser.
+        """
+
+        elem = self._root
+        while elem is not None and elem.get('href') is None:
+            elem = self._document.get_parent(elem)
+        if elem is None or self._document.browser is None:
+            raise WebDriverException('Element <{}> cannot be clicked'.format(self.tag_name))
+        self._document.browser.get(HTMLElement(elem, self._document).get_attribute('href'))
+
+
+class HTMLDocument(_SearchContext):
+    """
+    A parsed web page that can be searched like a Selenium WebDriver
+
+    Attributes
+    ----------
+    current_url : str
+        the url of the web page
+    page_source : str
+        the HTML source of the web page
+    browser : HTTPBrowser
+        the browser that loaded the web page (None if it was not loaded by a browser)
+
+    Methods
+    -------
+    get_parent(elem)
+        gets the parent of an element within this web page
+    """
+
+    def __init__(self, html, url, browser=None):
+        """
+        Parameters
+        ----------
+        html : str
+            The HTML source of the web page
+        url : str
+            The url of the web page
+        browser : HTTPBrowser
+            The browser that loaded the web page (default None)
+        """
+
+        self.current_url = url
+        self.page_source = html
+        self.browser = browser
+        self._root = parse_html(html)
+        self._document = self
+        self._parents = None
+
+    @property
+    def title(self):
+        titles = self._root.findall('.//title')
+        return render_text(titles[0]) if titles else ''
+
+    def get_parent(self, elem):
+        """Gets the parent of an element within this web page.
+
+        Parameters
+        ----------
+        elem : Element
+            The element whose parent will be returned
+
+        Returns
+        -------
+        Element
+            The parent of the element, or None if it is the root element
+        """
+
+        # lxml elements know their parent, ElementTree elements do not
+        if hasattr(elem, 'getparent'):
+            return elem.getparent()
+        if self._parents is None:
+            self._parents = {child: parent for parent in self._root.iter() for child in parent}
+        return self._parents.get(elem)
+
+
+class _SwitchTo:
+    """Implements `HTTPBrowser.switch_to.window(handle)`."""
+
+    def __init__(self, browser):
+        self._browser = browser
+
+    def window(self, handle):
+        self._browser.current_handle = handle
+
+
+class HTTPBrowser(_SearchContext):
+    """
+    Lightweight stand-in for a Selenium WebDriver that loads pages over plain HTTP (no JavaScript is run)
+
+    Connections are pooled and kept alive between requests, so consecutive page loads from the same host
+    reuse the same connection.
+
+    Attributes
+    ----------
+    http : PoolManager
+        pool of keep-alive HTTP connections
+    timeout : int
+        number of seconds to wait for a page to load before timing out
+    rate_limiter : RateLimiter
+        rate limiter that every request waits for (None if requests are not rate limited)
+    window_handles : list
+        handles of the tabs that are currently open
+    current_handle : str
+        handle of the tab that is currently active
+
+    Methods
+    -------
+    request(url, headers=None)
+        requests a url
+    fetch(url, cache=None)
+        downloads the HTML source of a url
+    get(url)
+        loads a url in the current tab
+    open_tab(url)
+        loads a url in a new tab and switches to it
+    close()
+        closes the current tab
+    quit()
+        closes every tab and every pooled connection
+    """
+
+    def __init__(self, timeout=10, max_connections=10, rate_limiter=None):
+        """
+        Parameters
+        ----------
+        timeout : int
+            number of seconds to wait for a page to load before timing out (default 10 seconds)
+        max_connections : int
+            maximum number of connections kept alive per host (default 10)
+        rate_limiter : RateLimiter
+            rate limiter that every request waits for (default None)
+        """
+
+        # Retry failed connections and reads, unless requests are rate limited (the rate limiter already retries them,
+        # backing off first, so retrying them here too would multiply the requests made for a single page)
+        if rate_limiter:
+            retries = urllib3.Retry(total=3, connect=0, read=0, other=0)
+        else:
+            retries = urllib3.Retry(total=3, backoff_factor=0.5)
+        self.http = urllib3.PoolManager(maxsize=max_connections, block=False,
+                                        timeout=urllib3.Timeout(total=timeout), retries=retries,
+                                        headers={'User-Agent': USER_AGENT, 'Accept-Encoding': 'gzip, deflate'})
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.switch_to = _SwitchTo(self)
+        self._tabs = {'tab-0': None}
+        self._next_handle = 1
+        self.current_handle = 'tab-0'
+
+    @property
+    def _document(self):
+        document = self._tabs[self.current_handle]
+        if document is None:
+            raise NoSuchElementException('No page has been loaded in the current tab')
+        return document
+
+    @property
+    def _root(self):
+        return self._document._root
+
+    @property
+    def window_handles(self):
+        return list(self._tabs)
+
+    @property
+    def current_window_handle(self):
+        return self.current_handle
+
+    @property
+    def current_url(self):
+        return self._document.current_url
+
+    @property
+    def page_source(self):
+        return self._document.page_source
+
+    @property
+    def title(self):
+        return self._document.title
+
+    def request(self, url, headers=None):
+        """Requests a url.
+
+        Parameters
+        ----------
+        url : str
+            The url to request
+        headers : dict
+            Extra request headers, such as conditional request headers (default None)
+
+        Returns
+        -------
+        tuple (int, str, dict)
+            The status code, the decoded body, and the headers of the response
+
+        Raises
+        ------
+        HTTPStatusError
+            If the server responds with an HTTP error status code.
+        MaxRetryError
+            If a connection to the server cannot be established.
+        """
+
+        def load():
+            response = self.http.request('GET', url, headers=dict(self.http.headers, **(headers or {})))
+            if response.status >= 400:
+                raise HTTPStatusError(url, response.status)
+            return response
+
+        # If requests are rate limited, wait for the rate limiter (which also learns from how the request goes),
+        # retrying the request if the server is overloaded
+        response = self.rate_limiter.run(load) if self.rate_limiter else load()
+        content_type = response.headers.get('Content-Type', '')
+        charset = content_type.split('charset=')[-1].split(';')[0].strip() if 'charset=' in content_type else 'utf-8'
+        return response.status, response.data.decode(charset, errors='replace'), response.headers
+
+    def fetch(self, url, cache=None):
+        """Downloads the HTML source of a url.
+
+        Parameters
+        ----------
+        url : str
+            The url to download
+        cache : PageCache
+            A page cache to read the url through (default None)
+
+        Returns
+        -------
+        str
+            The HTML source of the url
+
+        Raises
+        ------
+        HTTPStatusError
+            If the server responds with an HTTP error status code.
+        MaxRetryError
+            If a connection to the server cannot be established.
+        """
+
+        if cache is not None:
+            return cache.fetch(url, lambda headers: self.request(url, headers))
+        return self.request(url)[1]
+
+    def get(self, url):
+        """Loads a url in the current tab.
+
+        Parameters
+        ----------
+        url : str
+            The url to load
+        """
+
+        self._tabs[self.current_handle] = HTMLDocument(self.fetch(url), url, browser=self)
+
+    def open_tab(self, url):
+        """Loads a url in a new tab and switches to it.
+
+        Parameters
+        ----------
+        url : str
+            The url to load
+        """
+
+        handle = 'tab-{}'.format(self._next_handle)
+        self._next_handle += 1
+        self._tabs[handle] = None
+        self.current_handle = handle
+        self.get(url)
+
+    def close(self):
+        """Closes the current tab."""
+
+        del self._tabs[self.current_handle]
+
+    def quit(self):
+        """Closes every tab and every pooled connection."""
+
+        self._tabs.clear()
+        self.http.clear()
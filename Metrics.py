@@ -0,0 +1,268 @@
+import json
+import math
+import random
+import threading
+import time
+from contextlib import contextmanager
+
+
+# Prefix of the metric names written in Prometheus text format.
+PROMETHEUS_PREFIX = 'ubcal_'
+# Quantiles reported for every histogram.
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+def percentile(sorted_samples, quantile):
+    """Get a percentile of a sorted list of samples (nearest-rank method).
+
+    Parameters
+    ----------
+    sorted_samples : list
+        The samples, in ascending order
+    quantile : float
+        The quantile to get (e.g. 0.95 for the 95th percentile)
+
+    Returns
+    -------
+    float
+        The sample at the quantile, or None if there are no samples
+    """
+
+    if not sorted_samples:
+        return None
+    rank = max(1, math.ceil(quantile * len(sorted_samples)))
+    return sorted_samples[rank - 1]
+
+
+class Metrics:
+    """
+    Thread-safe registry of the counters and histograms recorded during a run
+
+    Histograms keep every sample, so their percentiles are exact, unless `max_samples` is set (e.g. by a long-running
+    service). Then each histogram keeps a uniform random sample (a reservoir) of at most `max_samples` of its samples,
+    so its percentiles are estimated in bounded memory, while its count, sum, min, and max stay exact. The scraping
+    phases are timed into histograms named `<phase>_seconds`.
+
+    Attributes
+    ----------
+    counters : dict
+        the value of each counter, keyed by name
+    histograms : dict
+        the (kept) samples of each histogram, keyed by name
+    max_samples : int
+        the maximum number of samples kept per histogram (None keeps every sample)
+
+    Methods
+    -------
+    increment(name, amount=1)
+        adds to a counter
+    observe(name, value)
+        adds a sample to a histogram
+    timer(name)
+        context manager that adds the number of seconds its block took to a histogram
+    reset()
+        clears every counter and histogram
+    snapshot()
+        copies every counter and histogram
+    merge(snapshot)
+        adds the counters and histograms of a snapshot (e.g. one taken in a worker process)
+    report()
+        summarizes every counter and histogram
+    write_json(path)
+        writes the summary as a JSON run report
+    write_prometheus(path)
+        writes the summary in Prometheus text format
+    """
+
+    def __init__(self, max_samples=None):
+        """
+        Parameters
+        ----------
+        max_samples : int
+            The maximum number of samples kept per histogram (default None -- every sample is kept)
+        """
+
+        self.counters = {}
+        self.histograms = {}
+        self.max_samples = max_samples
+        self._stats = {}
+        self._lock = threading.Lock()
+        self._started_at = time.time()
+
+    def _add_sample(self, name, value):
+        # Update the histogram's exact count/sum/min/max, and keep the sample in its reservoir (if it has room, or
+        # else in place of a random kept sample, so that every sample so far is equally likely to be kept)
+        stats = self._stats.get(name)
+        if stats is None:
+            stats = self._stats[name] = [0, 0, value, value]
+        stats[0] += 1
+        stats[1] += value
+        stats[2] = min(stats[2], value)
+        stats[3] = max(stats[3], value)
+        samples = self.histograms.setdefault(name, [])
+        if self.max_samples is None or len(samples) < self.max_samples:
+            samples.append(value)
+        else:
+            i = random.randrange(stats[0])
+            if i < self.max_samples:
+                samples[i] = value
+
+    def increment(self, name, amount=1):
+        """Adds to a counter.
+
+        Parameters
+        ----------
+        name : str
+            The name of the counter
+        amount : int
+            The amount to add (default 1)
+        """
+
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def observe(self, name, value):
+        """Adds a sample to a histogram.
+
+        Parameters
+        ----------
+        name : str
+            The name of the histogram
+        value : float
+            The sample
+        """
+
+        with self._lock:
+            self._add_sample(name, value)
+
+    @contextmanager
+    def timer(self, name):
+        """Context manager that adds the number of seconds its block took to a histogram (even if the block raises).
+
+        Parameters
+        ----------
+        name : str
+            The name of the histogram
+        """
+
+        begin = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - begin)
+
+    def reset(self):
+        """Clears every counter and histogram."""
+
+        with self._lock:
+            self.counters = {}
+            self.histograms = {}
+            self._stats = {}
+            self._started_at = time.time()
+
+    def snapshot(self):
+        """Copies every counter and histogram.
+
+        Returns
+        -------
+        dict
+            The counters, the histograms' (kept) samples, and the histograms' exact count, sum, min, and max
+        """
+
+        with self._lock:
+            return {'counters': dict(self.counters),
+                    'histograms': {name: list(samples) for name, samples in self.histograms.items()},
+                    'histogram_stats': {name: list(stats) for name, stats in self._stats.items()}}
+
+    def merge(self, snapshot):
+        """Adds the counters and histograms of a snapshot (e.g. one taken in a worker process).
+
+        Parameters
+        ----------
+        snapshot : dict
+            The snapshot returned by `snapshot()`
+        """
+
+        with self._lock:
+            for name, value in snapshot['counters'].items():
+                self.counters[name] = self.counters.get(name, 0) + value
+            for name, samples in snapshot['histograms'].items():
+                if not samples:
+                    continue
+                count, total, low, high = snapshot['histogram_stats'][name]
+                stats = self._stats.setdefault(name, [0, 0, low, high])
+                stats[0] += count
+                stats[1] += total
+                stats[2] = min(stats[2], low)
+                stats[3] = max(stats[3], high)
+                kept = self.histograms.setdefault(name, [])
+                kept.extend(samples)
+                # Keep the reservoir within its size (an approximation if the merged samples were sampled too)
+                if self.max_samples is not None and len(kept) > self.max_samples:
+                    kept[:] = random.sample(kept, self.max_samples)
+
+    def report(self):
+        """Summarizes every counter and histogram.
+
+        Returns
+        -------
+        dict
+            The run's duration, the counters, and the count, sum, min, max, p50, p95, and p99 of each histogram
+        """
+
+        snapshot = self.snapshot()
+        histograms = {}
+        for name, samples in snapshot['histograms'].items():
+            samples.sort()
+            count, total, low, high = snapshot['histogram_stats'][name]
+            summary = {'count': count, 'sum': total, 'min': low, 'max': high}
+            for quantile in QUANTILES:
+                summary['p{:g}'.format(quantile * 100)] = percentile(samples, quantile)
+            histograms[name] = summary
+        return {'started_at': self._started_at, 'duration_seconds': time.time() - self._started_at,
+                'counters': snapshot['counters'], 'histograms': histograms}
+
+    def write_json(self, path):
+        """Writes the summary of every counter and histogram as a JSON run report.
+
+        Parameters
+        ----------
+        path : str
+            The destination file path of the report
+        """
+
+        with open(path, 'w') as f:
+            json.dump(self.report(), f, indent=4)
+
+    def write_prometheus(self, path):
+        """Writes the summary of every counter and histogram in Prometheus text format.
+
+        Counters are written as `<name>_total` counters and histograms as summaries with 0.5/0.95/0.99 quantiles.
+
+        Parameters
+        ----------
+        path : str
+            The destination file path of the metrics
+        """
+
+        report = self.report()
+        lines = []
+        for name, value in sorted(report['counters'].items()):
+            metric = PROMETHEUS_PREFIX + name + '_total'
+            lines += ['# TYPE {} counter'.format(metric), '{} {}'.format(metric, value)]
+        for name, summary in sorted(report['histograms'].items()):
+            metric = PROMETHEUS_PREFIX + name
+            lines.append('# TYPE {} summary'.format(metric))
+            for quantile in QUANTILES:
+                lines.append('{}{{quantile="{:g}"}} {}'.format(metric, quantile,
+                                                               summary['p{:g}'.format(quantile * 100)]))
+            lines += ['{}_sum {}'.format(metric, summary['sum']), '{}_count {}'.format(metric, summary['count'])]
+        metric = PROMETHEUS_PREFIX + 'run_duration_seconds'
+        lines += ['# TYPE {} gauge'.format(metric), '{} {}'.format(metric, report['duration_seconds'])]
+
+        with open(path, 'w') as f:
+            f.write('\n'.join(lines) + '\n')
+
+
+# Metrics of the current run, shared by every part of the web scraper.
+metrics = Metrics()
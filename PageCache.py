@@ -0,0 +1,228 @@
+import os
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+
+
+# A cached web page and the validators the server sent with it.
+CachedPage = namedtuple('CachedPage', ['body', 'etag', 'last_modified', 'fetched_at'])
+
+
+class PageCache:
+    """
+    Persistent, size-bounded on-disk cache of web pages, keyed by url
+
+    Pages younger than `ttl` seconds are served straight from the cache. Older pages are revalidated with the
+    server using their ETag/Last-Modified validators (when the server sent any) and refetched only if they changed.
+    When the cache grows past `max_size` bytes, the least recently used pages are evicted.
+
+    Attributes
+    ----------
+    path : str
+        file path of the cache's SQLite database
+    max_size : int
+        maximum total size (in bytes) of the cached pages
+    ttl : int
+        number of seconds a cached page is served without being revalidated
+    hits : int
+        number of pages served from the cache without contacting the server
+    revalidations : int
+        number of pages served from the cache after the server confirmed they had not changed
+    misses : int
+        number of pages that had to be downloaded
+
+    Methods
+    -------
+    get(url)
+        gets a cached page
+    get_fresh(url)
+        gets the body of a cached page if it does not need to be revalidated
+    put(url, body, etag=None, last_modified=None)
+        adds (or replaces) a page in the cache
+    fetch(url, download)
+        gets a page through the cache, downloading or revalidating it if needed
+    close()
+        closes the cache's database
+    """
+
+    def __init__(self, path, max_size=100 * 1024 * 1024, ttl=3600):
+        """
+        Parameters
+        ----------
+        path : str
+            File path of the cache's SQLite database
+        max_size : int
+            Maximum total size (in bytes) of the cached pages (default 100 MB)
+        ttl : int
+            Number of seconds a cached page is served without being revalidated (default 1 hour)
+        """
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.revalidations = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._db.execute('CREATE TABLE IF NOT EXISTS pages (url TEXT PRIMARY KEY, body TEXT NOT NULL, etag TEXT, '
+                         'last_modified TEXT, fetched_at REAL NOT NULL, last_access REAL NOT NULL, '
+                         'size INTEGER NOT NULL)')
+        self._db.execute('CREATE INDEX IF NOT EXISTS pages_last_access ON pages (last_access)')
+        self._db.commit()
+
+    def __str__(self):
+        return 'Page cache: {} hits, {} revalidated, {} misses'.format(self.hits, self.revalidations, self.misses)
+
+    def _count(self, counter):
+        # Increment one of the hit/revalidation/miss counters (the cache may be shared between threads)
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def get(self, url):
+        """Gets a cached page (and marks it as recently used).
+
+        Parameters
+        ----------
+        url : str
+            The url of the page
+
+        Returns
+        -------
+        CachedPage
+            The cached page, or None if the page is not in the cache
+        """
+
+        with self._lock:
+            row = self._db.execute('SELECT body, etag, last_modified, fetched_at FROM pages WHERE url = ?',
+                                   (url,)).fetchone()
+            if row is None:
+                return None
+            self._db.execute('UPDATE pages SET last_access = ? WHERE url = ?', (time.time(), url))
+            self._db.commit()
+        return CachedPage(*row)
+
+    def is_fresh(self, page):
+        """Sees whether or not a cached page can be served without being revalidated.
+
+        Parameters
+        ----------
+        page : CachedPage
+            The cached page
+
+        Returns
+        -------
+        bool
+            True -- if the page is younger than `ttl` seconds
+            False -- otherwise
+        """
+
+        return time.time() - page.fetched_at < self.ttl
+
+    def get_fresh(self, url):
+        """Gets the body of a cached page if it does not need to be revalidated (counting a hit or a miss).
+
+        Parameters
+        ----------
+        url : str
+            The url of the page
+
+        Returns
+        -------
+        str
+            The body of the cached page, or None if the page is not cached or is too old
+        """
+
+        page = self.get(url)
+        if page is not None and self.is_fresh(page):
+            self._count('hits')
+            return page.body
+        self._count('misses')
+        return None
+
+    def put(self, url, body, etag=None, last_modified=None):
+        """Adds (or replaces) a page in the cache, evicting the least recently used pages if the cache is full.
+
+        Parameters
+        ----------
+        url : str
+            The url of the page
+        body : str
+            The body of the page
+        etag : str
+            The ETag header the server sent with the page (default None)
+        last_modified : str
+            The Last-Modified header the server sent with the page (default None)
+        """
+
+        now = time.time()
+        size = len(body.encode('utf-8'))
+        with self._lock:
+            self._db.execute('INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?, ?)',
+                             (url, body, etag, last_modified, now, now, size))
+
+            # Evict the least recently used pages until the cache fits within its maximum size
+            total_size = self._db.execute('SELECT COALESCE(SUM(size), 0) FROM pages').fetchone()[0]
+            if total_size > self.max_size:
+                lru_pages = self._db.execute('SELECT url, size FROM pages ORDER BY last_access').fetchall()
+                for lru_url, lru_size in lru_pages:
+                    if total_size <= self.max_size:
+                        break
+                    self._db.execute('DELETE FROM pages WHERE url = ?', (lru_url,))
+                    total_size -= lru_size
+            self._db.commit()
+
+    def _refresh(self, url):
+        # Restart the time-to-live of a page that the server confirmed has not changed
+        with self._lock:
+            self._db.execute('UPDATE pages SET fetched_at = ? WHERE url = ?', (time.time(), url))
+            self._db.commit()
+
+    def fetch(self, url, download):
+        """Gets a page through the cache, downloading or revalidating it if needed.
+
+        Parameters
+        ----------
+        url : str
+            The url of the page
+        download : function
+            function(headers) that requests the page with extra request headers and returns a
+            (status, body, response headers) tuple
+
+        Returns
+        -------
+        str
+            The body of the page
+        """
+
+        # If the page is cached and fresh, serve it without contacting the server
+        page = self.get(url)
+        if page is not None and self.is_fresh(page):
+            self._count('hits')
+            return page.body
+
+        # Else, if the page is cached, ask the server to only send it again if it changed
+        headers = {}
+        if page is not None and page.etag:
+            headers['If-None-Match'] = page.etag
+        if page is not None and page.last_modified:
+            headers['If-Modified-Since'] = page.last_modified
+
+        status, body, response_headers = download(headers)
+        if status == 304 and page is not None:
+            self._count('revalidations')
+            self._refresh(url)
+            return page.body
+
+        self._count('misses')
+        self.put(url, body, response_headers.get('ETag'), response_headers.get('Last-Modified'))
+        return body
+
+    def close(self):
+        """Closes the cache's database."""
+
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,307 @@
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from selenium.common.exceptions import TimeoutException
+from urllib3.exceptions import MaxRetryError, TimeoutError as HTTPTimeoutError
+from Metrics import metrics
+
+
+# Lowest rate (in page loads per second) that an adaptive rate limiter backs off to.
+MIN_RATE = 0.1
+# Number of times a page load that found the site overloaded is retried by `RateLimiter.run`.
+OVERLOAD_RETRIES = 3
+# Number of seconds waited before the first retry of a page load by `RateLimiter.run` (doubled for every retry after).
+RETRY_BACKOFF = 0.5
+
+
+def is_overload(error):
+    """Sees whether or not an error means the site is overloaded (or defending itself against the web scraper).
+
+    Parameters
+    ----------
+    error : Exception
+        The error a page load failed with
+
+    Returns
+    -------
+    bool
+        True -- if the page load timed out, or was answered with HTTP 429 (Too Many Requests) or a 5xx status
+        False -- otherwise
+    """
+
+    if isinstance(error, (TimeoutException, HTTPTimeoutError, socket.timeout)):
+        return True
+    # A connection that kept timing out is given up on by urllib3 with the timeout as the reason
+    if isinstance(error, MaxRetryError):
+        return isinstance(error.reason, (HTTPTimeoutError, socket.timeout))
+    status = getattr(error, 'status', None)
+    return status is not None and (status == 429 or status >= 500)
+
+
+class RateLimiter:
+    """
+    Token-bucket rate limiter and concurrency limit shared by every page load of a web scraper
+
+    Every page load takes a token from a bucket that refills at `rate` tokens per second and holds at most `burst`
+    tokens, and takes one of `concurrency` in-flight slots for as long as it runs.
+
+    If the limiter is adaptive, both limits are adjusted AIMD-style (additive increase, multiplicative decrease).
+    Each round of healthy page loads (ones answered within `latency_target` seconds) raises the concurrency by one
+    slot and the rate by a tenth of its initial value, as long as page loads were actually held back by that limit.
+    A page load that times out, is answered with HTTP 429 or 5xx, or is slower than `latency_target` halves both
+    limits instead. Page loads that were already in flight when the limits were halved do not halve them again.
+
+    Attributes
+    ----------
+    rate : float
+        the current number of page loads started per second (None if page loads are not paced)
+    burst : int
+        the maximum number of page loads started at once after an idle period
+    concurrency : float
+        the current maximum number of page loads in flight at once (rounded down)
+    max_concurrency : int
+        the maximum number of page loads in flight at once that the concurrency is raised to
+    max_rate : float
+        the maximum rate that the rate is raised to (None for no maximum)
+    adaptive : bool
+        whether or not the limits are adjusted to the site's latency and errors
+    latency_target : float
+        the number of seconds past which a page load is considered slow
+    requests : int
+        the number of page loads finished
+    failures : int
+        the number of page loads that timed out or were answered with HTTP 429 or 5xx
+    backoffs : int
+        the number of times the limits were halved
+    retry_backoff : float
+        the number of seconds waited before the first retry of an overloaded page load (doubled for every retry after)
+
+    Methods
+    -------
+    acquire()
+        waits for a free in-flight slot and a token
+    release(latency, overloaded=False)
+        frees an in-flight slot, adjusting the limits to how the page load went
+    request()
+        context manager that holds an in-flight slot and a token while its block loads a page
+    run(load, retries=OVERLOAD_RETRIES)
+        loads a page under the rate limiter, retrying it if the site is overloaded
+    throughput()
+        gets the number of page loads finished per second
+    """
+
+    def __init__(self, rate=None, burst=1, max_concurrency=1, adaptive=False, max_rate=None, latency_target=2.0,
+                 retry_backoff=RETRY_BACKOFF):
+        """
+        Parameters
+        ----------
+        rate : float
+            The number of page loads started per second (default None -- not paced). If adaptive, the initial rate.
+        burst : int
+            The maximum number of page loads started at once after an idle period (default 1)
+        max_concurrency : int
+            The maximum number of page loads in flight at once (default 1). If adaptive, the concurrency starts at
+            1 and is raised up to this maximum.
+        adaptive : bool
+            Whether or not the limits are adjusted to the site's latency and errors (default False)
+        max_rate : float
+            The maximum rate that an adaptive rate is raised to (default None -- no maximum)
+        latency_target : float
+            The number of seconds past which a page load is considered slow (default 2 seconds)
+        retry_backoff : float
+            The number of seconds waited before the first retry of an overloaded page load, doubled for every retry
+            after (default 0.5 seconds)
+        """
+
+        self.rate = rate
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+        self.concurrency = 1 if adaptive else max_concurrency
+        self.max_rate = max_rate
+        self.adaptive = adaptive
+        self.latency_target = latency_target
+        self.requests = 0
+        self.failures = 0
+        self.backoffs = 0
+        self.retry_backoff = retry_backoff
+        self._rate_step = rate / 10 if rate else None
+        self._tokens = burst
+        self._refilled_at = time.monotonic()
+        self._in_flight = 0
+        self._waiting = 0
+        self._condition = threading.Condition()
+        # Whether the concurrency/rate held back page loads since they were last raised
+        self._saturated = False
+        self._throttled = False
+        self._healthy = 0
+        self._latency = None
+        self._backed_off_at = float('-inf')
+        self._started_at = None
+        self._finished_at = None
+
+    def __str__(self):
+        rate = 'unlimited' if self.rate is None else '{:.2f}/s'.format(self.rate)
+        return ('Rate limiter: {} page loads at {:.2f}/s, {} failed, {} backoffs, limits now {} rate & {} in flight'
+                .format(self.requests, self.throughput(), self.failures, self.backoffs, rate, int(self.concurrency)))
+
+    def acquire(self):
+        """Waits for a free in-flight slot and a token.
+
+        Returns
+        -------
+        float
+            The time (from `time.monotonic()`) that the page load was allowed to start at
+        """
+
+        with self._condition:
+            if self._started_at is None:
+                self._started_at = time.monotonic()
+
+            # Wait for a free in-flight slot
+            if self._in_flight >= int(self.concurrency):
+                self._saturated = True
+                metrics.increment('rate_limit_queued')
+                self._waiting += 1
+                while self._in_flight >= int(self.concurrency):
+                    self._condition.wait()
+                self._waiting -= 1
+            self._in_flight += 1
+
+            # Take a token, reserving the next one to be refilled if the bucket is empty
+            wait = 0
+            if self.rate is not None:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._refilled_at) * self.rate)
+                self._refilled_at = now
+                self._tokens -= 1
+                if self._tokens < 0:
+                    wait = -self._tokens / self.rate
+                    self._throttled = True
+
+        # Wait for the reserved token outside of the lock, so that other page loads can take their tokens meanwhile
+        if wait:
+            metrics.observe('rate_limit_wait_seconds', wait)
+            time.sleep(wait)
+        return time.monotonic()
+
+    def release(self, latency, overloaded=False):
+        """Frees an in-flight slot, adjusting the limits to how the page load went (if the limiter is adaptive).
+
+        Parameters
+        ----------
+        latency : float
+            The number of seconds the page load took (None if it failed for a reason unrelated to the site's load)
+        overloaded : bool
+            Whether or not the page load timed out or was answered with HTTP 429 or 5xx (default False)
+        """
+
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify()
+            self.requests += 1
+            self._finished_at = time.monotonic()
+            if overloaded:
+                self.failures += 1
+                metrics.increment('rate_limit_failures')
+
+            if not self.adaptive or (latency is None and not overloaded):
+                return
+            if latency is not None:
+                self._latency = latency if self._latency is None else 0.8 * self._latency + 0.2 * latency
+            if overloaded or latency > self.latency_target:
+                self._back_off()
+            else:
+                self._healthy += 1
+                # A round is a full window of page loads (or about a second's worth of them, if paced faster)
+                if self._healthy >= max(1, int(self.concurrency), int(self.rate or 0)):
+                    self._increase()
+
+    def _increase(self):
+        # Raise whichever limits held page loads back this round (or are holding page loads back right now)
+        self._healthy = 0
+        if (self._saturated or self._waiting) and self.concurrency < self.max_concurrency:
+            self.concurrency = min(self.max_concurrency, int(self.concurrency) + 1)
+            self._condition.notify_all()
+        if self._throttled and self.rate is not None:
+            self.rate += self._rate_step
+            if self.max_rate is not None:
+                self.rate = min(self.max_rate, self.rate)
+        self._saturated = False
+        self._throttled = False
+
+    def _back_off(self):
+        # Halve both limits, unless they were just halved (the page loads still in flight then don't count again)
+        now = time.monotonic()
+        self._healthy = 0
+        if now - self._backed_off_at < max(self._latency or 0, 1 / self.rate if self.rate else 0):
+            return
+        self._backed_off_at = now
+        self.backoffs += 1
+        metrics.increment('rate_limit_backoffs')
+        self.concurrency = max(1, self.concurrency / 2)
+        if self.rate is not None:
+            self.rate = max(MIN_RATE, self.rate / 2)
+            # Give up the saved-up burst, so that the site gets a break right away
+            self._tokens = min(self._tokens, 0)
+
+    @contextmanager
+    def request(self):
+        """Context manager that holds an in-flight slot and a token while its block loads a page.
+
+        If the block raises an error, the page load is counted as overloaded if the error is a timeout or an HTTP 429
+        or 5xx status (and as unrelated to the site's load otherwise), and the error is re-raised.
+        """
+
+        begin = self.acquire()
+        try:
+            yield
+        except Exception as e:
+            self.release(None, overloaded=is_overload(e))
+            raise
+        self.release(time.monotonic() - begin)
+
+    def run(self, load, retries=OVERLOAD_RETRIES):
+        """Loads a page under the rate limiter, retrying it if the site is overloaded.
+
+        Each retry first waits `retry_backoff` seconds (doubled for every retry after), so that the site gets a break
+        even if page loads are not paced, and then waits for the rate limiter again, so if the limiter is adaptive, it
+        is retried at the backed off rate and concurrency.
+
+        Parameters
+        ----------
+        load : function
+            function() that loads the page
+        retries : int
+            The number of times the page load is retried if it times out or is answered with HTTP 429 or 5xx
+            (default 3)
+
+        Returns
+        -------
+        object
+            The return value of `load`
+        """
+
+        for attempt in range(retries + 1):
+            try:
+                with self.request():
+                    return load()
+            except Exception as e:
+                if attempt == retries or not is_overload(e):
+                    raise
+                metrics.increment('rate_limit_retries')
+                time.sleep(self.retry_backoff * 2 ** attempt)
+
+    def throughput(self):
+        """Gets the number of page loads finished per second.
+
+        Returns
+        -------
+        float
+            The number of page loads finished per second, from the start of the first one to the end of the last one
+        """
+
+        with self._condition:
+            if not self._started_at or not self._finished_at or self._finished_at <= self._started_at:
+                return 0.0
+            return self.requests / (self._finished_at - self._started_at)
@@ -1,33 +1,106 @@
+from contextlib import nullcontext
 from selenium import webdriver
+from selenium.webdriver.common.desired_capabilities import DesiredCapabilities
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
+from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
+from HTTPBrowser import HTTPBrowser
+from BrowserSession import attach_to_chrome, open_persistent_session
+from Metrics import metrics
+
+
+# Script that waits for an element with a class name to be added to the page, resolving as soon as the page changes
+# instead of polling. Resolves with true once the element exists, or with false after the timeout (in milliseconds).
+WAIT_FOR_CLASS_SCRIPT = '''
+var className = arguments[0], timeout = arguments[1], done = arguments[arguments.length - 1];
+if (document.getElementsByClassName(className).length) {
+    return done(true);
+}
+var timer;
+var observer = new MutationObserver(function () {
+    if (document.getElementsByClassName(className).length) {
+        observer.disconnect();
+        clearTimeout(timer);
+        done(true);
+    }
+});
+timer = setTimeout(function () {
+    observer.disconnect();
+    done(false);
+}, timeout);
+observer.observe(document, {childList: true, subtree: true, attributes: true, attributeFilter: ['class']});
+'''
+
+# URL patterns of the requests blocked for each blockable resource type.
+RESOURCE_TYPE_PATTERNS = {
+    'image': ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico', '*.bmp'],
+    'font': ['*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot'],
+    'stylesheet': ['*.css'],
+    'media': ['*.mp4', '*.webm', '*.ogg', '*.mp3', '*.wav', '*.m4a'],
+}
+# Chrome content settings that block a resource type outright (including resources without a telling extension).
+RESOURCE_TYPE_PREFS = {
+    'image': {'profile.managed_default_content_settings.images': 2},
+}
 
 
 class Scraper:
     """
-    Basic web scraper, running off of Selenium WebDriver
+    Basic web scraper, running off of Selenium WebDriver (or a plain HTTP browser)
 
     Attributes
     ----------
-    browser : WebDriver
-        WebDriver that controls Google Chrome
+    browser : WebDriver or HTTPBrowser
+        WebDriver that controls Google Chrome, or an HTTPBrowser that loads pages without rendering them
+    backend : str
+        the fetch backend used to load pages: `selenium` (Google Chrome) or `http` (plain HTTP, no JavaScript)
     timeout : int
         number of seconds that browser will wait for the page to load before timing out (default 10 seconds)
     num_tabs : int
         number of tabs currently open in browser's Google Chrome session
+    readiness : str
+        how page readiness is waited for: `observer` (a MutationObserver in the page) or `poll` (WebDriverWait)
+    poll_interval : float
+        number of seconds between checks when polling for page readiness
+    blocked_urls : list
+        URL patterns (with `*` wildcards) of the requests Chrome is blocked from making
+    main_tab : str
+        handle of the tab the scraper started in
+    opened_tab : str
+        handle of the tab most recently opened by `open_url` (None until a tab is opened)
+    worker_tab : str
+        handle of the long-lived tab that pages are opened in by `open_in_worker_tab` (None until it is opened)
+    keep_browser : bool
+        whether or not Google Chrome is left running when the scraper quits (an attached or persisted session)
+    session_path : str
+        the file path of the persisted WebDriver session (None if the session is not persisted)
+    rate_limiter : RateLimiter
+        rate limiter that every page load waits for (None if page loads are not rate limited)
 
     Methods
     -------
+    block_requests()
+        blocks the current tab from requesting the blocked URL patterns
+    page_load()
+        context manager that waits for the rate limiter while its block loads a page
     open_url(url, class_name, new_tab=False)
         opens a url
-    close_tab(close_tab_idx=-1, dest_tab_idx=-1)
-        closes a tab
+    open_in_worker_tab(url, class_name)
+        opens a url in the long-lived worker tab, opening the tab if needed
+    switch_to_main_tab()
+        switches back to the tab the scraper started in
+    wait_for_class(class_name, stale_element=None)
+        waits for an element with a class name to be loaded
+    close_tab(handle=None)
+        closes a tab opened by the scraper and switches back to the tab the scraper started in
     quit()
-        quits the WebDriver and closes the Google Chrome session
+        quits the WebDriver and closes the Google Chrome session (or only this scraper's tabs of a warm session)
     """
 
-    def __init__(self, driver_path, headless=True, timeout=10):
+    def __init__(self, driver_path, headless=True, timeout=10, backend='selenium', readiness='observer',
+                 poll_interval=0.05, page_load_strategy='normal', blocked_resources=(), blocked_urls=(),
+                 debugger_address=None, session_path=None, rate_limiter=None):
         """
         Parameters
         ----------
@@ -37,14 +110,98 @@ class Scraper:
             whether or not the ChromeDriver should run headless (w/o GUI) (default True)
         timeout : int
             number of seconds that browser will wait for the page to load before timing out (default 10 seconds)
+        backend : str
+            the fetch backend used to load pages: `selenium` or `http` (default `selenium`)
+        readiness : str
+            how page readiness is waited for: `observer` or `poll` (default `observer`)
+        poll_interval : float
+            number of seconds between checks when polling for page readiness (default 0.05 seconds)
+        page_load_strategy : str
+            when Chrome considers a page loaded: `normal` (the load event), `eager` (DOMContentLoaded), or `none`
+            (as soon as the page starts loading) (default `normal`)
+        blocked_resources : iterable
+            resource types Chrome is blocked from downloading: `image`, `font`, `stylesheet`, `media` (default none)
+        blocked_urls : iterable
+            URL patterns (with `*` wildcards) of other requests Chrome is blocked from making (default none)
+        debugger_address : str
+            the `host:port` of an already running Chrome to attach to, instead of launching one (default None).
+            If no Chrome is listening there, a new one is launched.
+        session_path : str
+            the file path of a persisted WebDriver session to attach to, which is created (and persisted) if it
+            does not exist or no longer responds (default None)
+        rate_limiter : RateLimiter
+            rate limiter that every page load waits for, which may be shared with other scrapers (default None)
         """
 
-        options = webdriver.ChromeOptions()
-        if headless:
-            options.add_argument('headless')
-        self.browser = webdriver.Chrome(driver_path, chrome_options=options)
+        # If the backend is `http`, load pages over pooled keep-alive HTTP connections instead of launching Chrome
+        self.keep_browser = False
+        if backend == 'http':
+            self.browser = HTTPBrowser(timeout=timeout, rate_limiter=rate_limiter)
+        else:
+            options = webdriver.ChromeOptions()
+            if headless:
+                options.add_argument('headless')
+            # Turn off the resource types Chrome has content settings for
+            prefs = {}
+            for resource_type in blocked_resources:
+                prefs.update(RESOURCE_TYPE_PREFS.get(resource_type, {}))
+            if prefs:
+                options.add_experimental_option('prefs', prefs)
+            capabilities = DesiredCapabilities.CHROME.copy()
+            capabilities['pageLoadStrategy'] = page_load_strategy
+            # Attach to a warm Chrome session if one was given, falling back to launching a new Chrome
+            self.browser = None
+            if session_path:
+                self.browser = open_persistent_session(driver_path, session_path, options, capabilities)
+            elif debugger_address:
+                self.browser = attach_to_chrome(driver_path, debugger_address, capabilities)
+            self.keep_browser = self.browser is not None
+            if self.browser is None:
+                self.browser = webdriver.Chrome(driver_path, chrome_options=options,
+                                                desired_capabilities=capabilities)
+            # Give readiness scripts a little longer than the page timeout, so that they time out on their own
+            self.browser.set_script_timeout(timeout + 1)
+        self.backend = backend
         self.timeout = timeout
-        self.num_tabs = 1
+        self.session_path = session_path
+        self.rate_limiter = rate_limiter
+        self.readiness = readiness
+        self.poll_interval = poll_interval
+        self.blocked_urls = [pattern for resource_type in blocked_resources
+                             for pattern in RESOURCE_TYPE_PATTERNS[resource_type]] + list(blocked_urls)
+        self.main_tab = self.browser.current_window_handle
+        self.opened_tab = None
+        self.worker_tab = None
+        # A warm session may have other tabs open, e.g. from an earlier run
+        self.initial_tabs = set(self.browser.window_handles)
+        self.num_tabs = len(self.initial_tabs)
+        self.block_requests()
+
+    def block_requests(self):
+        """Blocks the current tab from requesting the blocked URL patterns (through the Chrome DevTools Protocol).
+
+        The blocked URLs apply to a single tab, so every newly opened tab is blocked as well. ChromeDrivers without
+        DevTools Protocol support only block the resource types that have content settings.
+        """
+
+        if self.backend != 'selenium' or not self.blocked_urls:
+            return
+        try:
+            self.browser.execute_cdp_cmd('Network.enable', {})
+            self.browser.execute_cdp_cmd('Network.setBlockedURLs', {'urls': self.blocked_urls})
+        except WebDriverException:
+            pass
+
+    def page_load(self):
+        """Context manager that waits for the rate limiter while its block loads a page (and waits for it to be ready).
+
+        Pages loaded over plain HTTP are rate limited request by request by the HTTP browser itself, so this only
+        rate limits pages loaded by Chrome.
+        """
+
+        if self.rate_limiter is None or self.backend == 'http':
+            return nullcontext()
+        return self.rate_limiter.request()
 
     def open_url(self, url, class_name, new_tab=False):
         """Opens a url.
@@ -64,45 +221,173 @@ class Scraper:
             If the page takes too long to load or if an element with the class `class_name` cannot be found.
         """
 
-        # If new_tab, open the hyperlink in a new tab, increment num_tabs, and switch to the new tab.
-        if new_tab:
-            self.browser.execute_script("window.open('{}')".format(url))
-            self.num_tabs += 1
-            self.browser.switch_to.window(self.browser.window_handles[-1])
-        # Else, open the hyperlink in this tab.
-        else:
-            self.browser.get(url)
+        # Wait for the rate limiter (if any) while the page loads and becomes ready
+        with self.page_load():
+            self._open_url(url, class_name, new_tab)
+
+    def _open_url(self, url, class_name, new_tab):
+        # Load the url and wait for it to be ready (open_url rate limits this)
+        with metrics.timer('page_load_seconds'):
+            # If new_tab, open the hyperlink in a new tab, increment num_tabs, and switch to the new tab (found by
+            # its handle, since a warm session's other tabs can come after it in the list of handles).
+            if new_tab:
+                known_tabs = set(self.browser.window_handles)
+                if self.backend == 'http':
+                    self.browser.open_tab(url)
+                # If requests are blocked, open a blank tab and block its requests before loading the hyperlink
+                elif self.blocked_urls:
+                    self.browser.execute_script("window.open('about:blank')")
+                else:
+                    self.browser.execute_script("window.open('{}')".format(url))
+                self.num_tabs += 1
+                self.opened_tab = self._wait_for_new_tab(known_tabs)
+                self.browser.switch_to.window(self.opened_tab)
+                if self.backend == 'selenium' and self.blocked_urls:
+                    self.block_requests()
+                    self.browser.get(url)
+            # Else, open the hyperlink in this tab.
+            else:
+                self.browser.get(url)
+        metrics.increment('pages_loaded')
+
+        # Wait for an element with class `class_name` to be loaded.
+        self.wait_for_class(class_name)
+
+    def _wait_for_new_tab(self, known_tabs):
+        # Have the ChromeDriver wait up to timeout seconds for a tab that is not one of the known tabs to be opened,
+        # and get its handle
+        if self.backend == 'http':
+            return self.browser.current_window_handle
+        with metrics.timer('wait_seconds'):
+            new_tabs = WebDriverWait(self.browser, self.timeout, self.poll_interval).until(
+                lambda browser: set(browser.window_handles) - known_tabs)
+        return new_tabs.pop()
+
+    def open_in_worker_tab(self, url, class_name):
+        """Opens a url in the long-lived worker tab, opening the tab if needed.
+
+        Unlike opening every url in a new tab, the worker tab is navigated from page to page and never closed, so the
+        tab the scraper started in keeps its page (e.g. the current list page) in the meantime.
+
+        Parameters
+        ----------
+        url : str
+            A hyperlink for ChromeDriver to open
+        class_name : str
+            The class name of an element that ChromeDriver will wait until it is loaded for the page to be `ready`
 
-        # Have the ChromeDriver wait up to timeout seconds for the page to load.
-        wait = WebDriverWait(self.browser, self.timeout)
+        Raises
+        ------
+        TimeoutError
+            If the page takes too long to load or if an element with the class `class_name` cannot be found.
+        """
+
+        # If the worker tab has not been opened yet (or was closed), open the url in a new worker tab
+        if self.worker_tab not in self.browser.window_handles:
+            self.open_url(url, class_name, new_tab=True)
+            self.worker_tab = self.opened_tab
+            return
+
+        # Else, navigate the worker tab to the url, waiting until the previous page is gone
+        self.browser.switch_to.window(self.worker_tab)
+        previous_page = self.browser.find_element_by_tag_name('html') if self.backend == 'selenium' else None
+        with self.page_load():
+            with metrics.timer('page_load_seconds'):
+                self.browser.get(url)
+            metrics.increment('pages_loaded')
+            self.wait_for_class(class_name, stale_element=previous_page)
 
-        # If opening the hyperlink in a new tab, wait for the
-        # ChromeDriver session to have num_tabs amount of tabs opened.
-        if new_tab:
-            wait.until(EC.number_of_windows_to_be(self.num_tabs))
+    def switch_to_main_tab(self):
+        """Switches back to the tab the scraper started in."""
 
-        # Have the ChromeDriver wait for an element with class `class_name` to be loaded.
-        wait.until(EC.presence_of_element_located((By.CLASS_NAME, class_name)))
+        self.browser.switch_to.window(self.main_tab)
 
-    def close_tab(self, close_tab_idx=-1, dest_tab_idx=-1):
-        """Closes a tab.
+    def wait_for_class(self, class_name, stale_element=None):
+        """Waits for an element with a class name to be loaded.
+
+        With the `observer` readiness, the wait returns as soon as the element is added to the page. With the `poll`
+        readiness, the page is checked every `poll_interval` seconds.
 
         Parameters
         ----------
-        close_tab_idx : int
-            The index of the tab to be closed.
-        dest_tab_idx : int
-            The index of the tab to switch to after a tab is closed.
+        class_name : str
+            The class name of an element that ChromeDriver will wait until it is loaded for the page to be `ready`
+        stale_element : WebElement
+            An element of the page being navigated away from (default None). The wait only starts once this
+            element is gone, so that the previous page cannot satisfy it.
+
+        Raises
+        ------
+        TimeoutException
+            If an element with the class `class_name` is not loaded within timeout seconds.
         """
 
-        # Switch to the tab at close_tab_idx, close the tab, decrement the num_tabs opened,
-        # and switch to the tab at dest_tab_idx.
-        self.browser.switch_to.window(self.browser.window_handles[close_tab_idx])
+        # Pages loaded over plain HTTP are complete as soon as they are downloaded, so there is nothing to wait for.
+        if self.backend == 'http':
+            try:
+                self.browser.find_element(By.CLASS_NAME, class_name)
+            except NoSuchElementException:
+                raise TimeoutException('No element with class `{}` found on {}'
+                                       .format(class_name, self.browser.current_url))
+            return
+
+        wait = WebDriverWait(self.browser, self.timeout, self.poll_interval)
+        with metrics.timer('wait_seconds'):
+            # Wait for the previous page to be unloaded
+            if stale_element is not None:
+                wait.until(EC.staleness_of(stale_element))
+
+            # Wait for the element in the page itself, which resolves as soon as the element is added
+            if self.readiness == 'observer':
+                try:
+                    if self.browser.execute_async_script(WAIT_FOR_CLASS_SCRIPT, class_name, self.timeout * 1000):
+                        return
+                    raise TimeoutException('No element with class `{}` found on {}'
+                                           .format(class_name, self.browser.current_url))
+                except TimeoutException:
+                    raise
+                # If the page navigated while the script was waiting (e.g. a new tab leaving about:blank),
+                # the script is discarded along with the page, so poll for the element instead
+                except WebDriverException:
+                    pass
+
+            # Have the ChromeDriver poll for an element with class `class_name` to be loaded.
+            wait.until(EC.presence_of_element_located((By.CLASS_NAME, class_name)))
+
+    def close_tab(self, handle=None):
+        """Closes a tab opened by the scraper and switches back to the tab the scraper started in.
+
+        Parameters
+        ----------
+        handle : str
+            The handle of the tab to be closed (default None -- the tab most recently opened by `open_url`).
+        """
+
+        # Switch to the tab, close the tab, decrement the num_tabs opened, and switch back to the main tab.
+        handle = handle or self.opened_tab
+        self.browser.switch_to.window(handle)
         self.browser.close()
         self.num_tabs -= 1
-        self.browser.switch_to.window(self.browser.window_handles[dest_tab_idx])
+        if handle == self.opened_tab:
+            self.opened_tab = None
+        self.switch_to_main_tab()
 
     def quit(self):
-        """Quits the WebDriver and closes the Google Chrome session."""
+        """Quits the WebDriver and closes the Google Chrome session.
+
+        A warm (attached or persisted) Google Chrome session is left running for the next run, with only the tabs this
+        scraper opened closed.
+        """
+
+        if not self.keep_browser:
+            self.browser.quit()
+            return
 
-        self.browser.quit()
+        for handle in set(self.browser.window_handles) - self.initial_tabs:
+            self.browser.switch_to.window(handle)
+            self.browser.close()
+        self.browser.switch_to.window(self.main_tab)
+        # Quit a ChromeDriver that was attached to a running Chrome, which leaves Chrome itself running.
+        # A persisted session is kept as is, ChromeDriver included.
+        if not self.session_path:
+            self.browser.quit()
@@ -0,0 +1,161 @@
+import sys
+import json
+import time
+import resource
+from concurrent.futures import ProcessPoolExecutor
+from Configuration import Configuration
+from CalendarServer import CalendarServer
+from UBEventsCalendarScraper import UBEventsCalendarScraper
+from Utility import get_arg_value, validate_backend, validate_concurrency, InvalidArgumentsError, \
+    InvalidConfigFileValueError
+from selenium.common.exceptions import WebDriverException
+
+
+# Usage message that represents the correct command line usage.
+USAGE_STR = '''usage: python ScraperBenchmark.py (--path <driver_path>) (--pages <n>) (--events <n>)
+       (--latency <milliseconds>) (--backends <backend,...>) (--concurrency <n,...>) (--output <report_path>)'''
+
+# Set of allowed command line arguments.
+ALLOWED_FLAGS = {'--path', '--pages', '--events', '--latency', '--backends', '--concurrency', '--output'}
+
+
+def _peak_rss_kib():
+    # Peak resident set size of this process and its (finished) child processes, e.g. chromedriver and Chrome
+    peak = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+               resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    # macOS reports the peak in bytes, Linux in kibibytes
+    return peak / 1024 if sys.platform == 'darwin' else peak
+
+
+def run_scraper(config):
+    """Scrape every page of a calendar and time it (runs in a fresh worker process, so its peak memory is its own).
+
+    Parameters
+    ----------
+    config : Configuration
+        Configuration settings of the web scraper
+
+    Returns
+    -------
+    dict
+        The number of events scraped, the number of seconds scraping took, and the peak RSS (in KiB)
+    """
+
+    begin = time.perf_counter()
+    scraper = UBEventsCalendarScraper(config)
+    try:
+        events = scraper.scrape_events()
+    finally:
+        scraper.quit()
+    elapsed = time.perf_counter() - begin
+    return {'events': len(events), 'seconds': elapsed, 'peak_rss_kib': _peak_rss_kib()}
+
+
+def benchmark(server, driver_path, backend, concurrency):
+    """Benchmark the web scraper against a synthetic calendar with one backend and concurrency setting.
+
+    The calendar is scraped twice: once without deep scraping (to measure list pages) and once with deep scraping.
+
+    Parameters
+    ----------
+    server : CalendarServer
+        The (running) synthetic calendar
+    driver_path : str
+        The file path to the chromedriver
+    backend : str
+        The fetch backend used to load pages
+    concurrency : int
+        Maximum number of event pages deep scraped at once
+
+    Returns
+    -------
+    dict
+        The pages/sec and events/sec of list scraping, the deep scrapes/sec, and the peak RSS (in KiB)
+    """
+
+    result = {'backend': backend, 'concurrency': concurrency}
+    for deep_scrape in (False, True):
+        config = Configuration(driver_path, True, deep_scrape, 0, server.pages, True, False, False, None, None,
+                               False, backend=backend, concurrency=concurrency, base_url=server.url)
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            run = executor.submit(run_scraper, config).result()
+        if deep_scrape:
+            result['deep_scrapes_per_sec'] = run['events'] / run['seconds']
+        else:
+            result['pages_per_sec'] = server.pages / run['seconds']
+            result['events_per_sec'] = run['events'] / run['seconds']
+        result['peak_rss_kib'] = max(result.get('peak_rss_kib', 0), run['peak_rss_kib'])
+    return result
+
+
+def print_results(results):
+    """Print out a table of benchmark results to the command line.
+
+    Parameters
+    ----------
+    results : list
+        The result of each backend and concurrency setting
+    """
+
+    print('{:<10} {:>11} {:>11} {:>12} {:>16} {:>14}'.format('backend', 'concurrency', 'pages/sec', 'events/sec',
+                                                             'deep scrapes/sec', 'peak RSS MiB'))
+    for result in results:
+        if 'error' in result:
+            print('{:<10} {:>11} {}'.format(result['backend'], result['concurrency'], result['error']))
+            continue
+        print('{:<10} {:>11} {:>11,.1f} {:>12,.1f} {:>16,.1f} {:>14,.1f}'.format(
+            result['backend'], result['concurrency'], result['pages_per_sec'], result['events_per_sec'],
+            result['deep_scrapes_per_sec'], result['peak_rss_kib'] / 1024))
+
+
+def main():
+    """Main method to benchmark the web scraper's throughput against a local, synthetic events calendar."""
+
+    # Check if the user used an invalid argument. If so, terminate the program with exit code 1.
+    invalid_args = set(filter(lambda x: x.startswith('--'), sys.argv)) - ALLOWED_FLAGS
+    if invalid_args:
+        print('`{}` is not a valid argument.'.format(next(iter(invalid_args))))
+        print(USAGE_STR)
+        sys.exit(1)
+
+    try:
+        driver_path = get_arg_value(sys.argv, '--path', str, 'chromedriver')
+        pages = get_arg_value(sys.argv, '--pages', int, 10)
+        events_per_page = get_arg_value(sys.argv, '--events', int, 20)
+        latency = get_arg_value(sys.argv, '--latency', float, 0) / 1000
+        backends = get_arg_value(sys.argv, '--backends', lambda s: s.lower().split(','), ['http'])
+        concurrency_settings = get_arg_value(sys.argv, '--concurrency', lambda s: list(map(int, s.split(','))), [1])
+        report_path = get_arg_value(sys.argv, '--output', str, None)
+        for backend in backends:
+            validate_backend(backend)
+    except (InvalidArgumentsError, InvalidConfigFileValueError) as e:
+        print('{}: {}'.format(e.__class__.__name__, str(e)))
+        print(USAGE_STR)
+        sys.exit(1)
+
+    results = []
+    with CalendarServer(pages, events_per_page, latency) as server:
+        print('Benchmarking against {} pages of {} events ({:.0f} ms latency) at {}'
+              .format(pages, events_per_page, latency * 1000, server.url))
+        for backend in backends:
+            for concurrency in concurrency_settings:
+                # Record a setting that cannot run (e.g. no chromedriver for the selenium backend, or concurrency with
+                # a backend that does not support it) and move on
+                try:
+                    validate_concurrency(concurrency, None, backend)
+                    results.append(benchmark(server, driver_path, backend, concurrency))
+                except (WebDriverException, InvalidConfigFileValueError) as e:
+                    results.append({'backend': backend, 'concurrency': concurrency,
+                                    'error': '{}: {}'.format(e.__class__.__name__, str(e).strip())})
+
+    print_results(results)
+
+    # Write the results as a JSON report if a report path was given
+    if report_path:
+        with open(report_path, 'w') as f:
+            json.dump({'pages': pages, 'events_per_page': events_per_page, 'latency': latency, 'results': results},
+                      f, indent=4)
+
+
+if __name__ == '__main__':
+    main()
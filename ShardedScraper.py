@@ -0,0 +1,190 @@
+import copy
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from UBEventsCalendarScraper import UBEventsCalendarScraper
+from Metrics import metrics
+
+
+def split_page_range(start_page, end_page, shards):
+    """Split a range of pages into contiguous, (nearly) equally sized ranges.
+
+    Parameters
+    ----------
+    start_page : int
+        the first page of the range
+    end_page : int
+        the page after the last page of the range
+    shards : int
+        the number of ranges to split the range into
+
+    Returns
+    -------
+    list
+        a list of (start page, end page) tuples in calendar order (empty ranges are left out)
+    """
+
+    num_pages = end_page - start_page
+    size, extra = divmod(num_pages, shards)
+    ranges = []
+    for shard in range(shards):
+        shard_start = start_page + shard * size + min(shard, extra)
+        shard_end = shard_start + size + (1 if shard < extra else 0)
+        if shard_end > shard_start:
+            ranges.append((shard_start, shard_end))
+    return ranges
+
+
+def scrape_shard(config, start_page, end_page):
+    """Scrape a range of pages with a web scraper of its own (runs in a worker process).
+
+    Parameters
+    ----------
+    config : Configuration
+        configuration settings for the web scraper
+    start_page : int
+        the page where the web scraper will begin scraping events
+    end_page : int
+        the page where the web scraper will stop scraping events
+
+    Returns
+    -------
+    tuple (list, bool, dict, str)
+        the events that were scraped, whether or not the calendar has no pages after the range, a snapshot of the
+        worker's metrics for the range, and a summary of the worker's rate limiter (None if it is not rate limited)
+    """
+
+    # Give the worker's scraper its own copy of the configuration settings, limited to the shard's range
+    shard_config = copy.copy(config)
+    shard_config.start_page = start_page
+    shard_config.end_page = end_page
+    shard_config.all_pages = False
+    shard_config.shards = 1
+    # Every worker launches its own browser, since a warm session can only be driven by one scraper at a time
+    shard_config.debugger_address = None
+    shard_config.session_path = None
+    # Shards are handed out dynamically, so a crawl split into shards is not checkpointed
+    shard_config.checkpoint_path = None
+    shard_config.resume = False
+    # Every worker rate limits its own page loads, so split the rate between the workers
+    if config.rate_limit:
+        shard_config.rate_limit = config.rate_limit / config.shards
+    if config.max_rate:
+        shard_config.max_rate = config.max_rate / config.shards
+
+    # Only record the metrics of this range (a forked worker starts with a copy of its parent's metrics)
+    metrics.reset()
+    scraper = UBEventsCalendarScraper(shard_config)
+    try:
+        events = scraper.scrape_events()
+        limiter_summary = str(scraper.rate_limiter) if scraper.rate_limiter else None
+        return events, scraper.reached_last_page, metrics.snapshot(), limiter_summary
+    finally:
+        scraper.quit()
+
+
+def merge_shards(shard_results, duplicates='keep'):
+    """Merge the events of every shard in calendar order, handling repeated listings as a serial scrape would.
+
+    Parameters
+    ----------
+    shard_results : list
+        a list of event lists, in calendar order
+    duplicates : str
+        `keep` to keep every listing of an event, or `collapse` to record the listings of an event in later shards
+        as occurrences of its first listing (default `keep`)
+
+    Returns
+    -------
+    list
+        the merged list of events
+    """
+
+    # If keeping repeated listings, every shard's listings are already complete, so concatenate them in page order
+    if duplicates != 'collapse':
+        return [evt for shard_events in shard_results for evt in shard_events]
+
+    first_listings = {}
+    events = []
+    for shard_events in shard_results:
+        for evt in shard_events:
+            first = first_listings.setdefault(evt.link, evt)
+            if first is evt:
+                events.append(evt)
+                continue
+            # Record every listing of the event in this shard (just its own, if it was listed once in the shard)
+            if first.occurrences is None:
+                first.occurrences = [(first.start, first.end)]
+            first.occurrences.extend(evt.occurrences or [(evt.start, evt.end)])
+    return events
+
+
+def scrape_sharded(config, limiter_summaries=None):
+    """Scrape events with a pool of worker processes, each scraping its own range of pages.
+
+    If the configuration settings scrape a fixed range of pages, the range is split evenly across the workers.
+    If they scrape all pages, the workers are handed consecutive ranges of `shard_pages` pages until one of them
+    reaches the last page of the calendar. Each worker jumps straight to its first page (if list pages can be
+    addressed by url), so the pages before its range are not loaded again.
+
+    Parameters
+    ----------
+    config : Configuration
+        configuration settings for the web scrapers
+    limiter_summaries : list
+        a list that the summary of each worker's rate limiter is appended to, in calendar order (default None)
+
+    Returns
+    -------
+        a list of events that were scraped, in calendar order (with repeated listings kept or collapsed as configured)
+        a list of events that were scraped, in calendar order and without duplicate links
+    """
+
+    with ProcessPoolExecutor(max_workers=config.shards) as executor:
+        # Split the fixed range of pages across the workers
+        if not config.all_pages:
+            futures = [executor.submit(scrape_shard, config, start, end)
+                       for start, end in split_page_range(config.start_page, config.end_page, config.shards)]
+            for future in futures:
+                metrics.merge(future.result()[2])
+            _collect_limiter_summaries([future.result() for future in futures], limiter_summaries)
+            return merge_shards([future.result()[0] for future in futures], config.duplicates)
+
+        # Hand out consecutive ranges of pages, keeping every worker busy, until the last page has been reached
+        results = {}
+        pending = set()
+        next_start = config.start_page
+        last_shard = None
+        while True:
+            while last_shard is None and len(pending) < config.shards:
+                future = executor.submit(scrape_shard, config, next_start, next_start + config.shard_pages)
+                future.shard_start = next_start
+                pending.add(future)
+                next_start += config.shard_pages
+
+            if not pending:
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                events, reached_last_page, shard_metrics, limiter_summary = future.result()
+                results[future.shard_start] = events, limiter_summary
+                metrics.merge(shard_metrics)
+                if reached_last_page and (last_shard is None or future.shard_start < last_shard):
+                    last_shard = future.shard_start
+
+            # Ranges after the last page of the calendar will come back empty, so stop waiting on them
+            if last_shard is not None:
+                for future in [future for future in pending if future.shard_start > last_shard]:
+                    future.cancel()
+                pending = {future for future in pending if future.shard_start < last_shard}
+
+        shard_results = [results[start] for start in sorted(results) if start <= last_shard]
+        _collect_limiter_summaries(shard_results, limiter_summaries)
+        return merge_shards([shard_events for shard_events, _ in shard_results], config.duplicates)
+
+
+def _collect_limiter_summaries(shard_results, limiter_summaries):
+    # Append the summary of each rate limited worker (each one paces its own share of the rate)
+    if limiter_summaries is None:
+        return
+    for result in shard_results:
+        if result[-1]:
+            limiter_summaries.append(result[-1])
@@ -1,13 +1,52 @@
 import re
 from Event import Event
 from Scraper import Scraper
-from Utility import extract_date_time, extract_contact_info
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.by import By
+from AsyncDeepScraper import AsyncDeepScraper
+from WebDriverPool import WebDriverPool
+from PageCache import PageCache
+from EventStore import EventStore
+from Checkpoint import Checkpoint
+from RateLimiter import RateLimiter
+from HTTPBrowser import HTMLDocument, HTTPStatusError
+from Metrics import metrics
+from EventParser import EventParser
+from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.common.exceptions import NoSuchElementException
 
 
+# Script that extracts the title, hyperlink, and raw date & time of every event on a list page in one round trip.
+LIST_EVENTS_SCRIPT = '''
+return Array.prototype.map.call(document.getElementsByClassName('list-event-preview'), function (preview) {
+    var header = preview.querySelector('h3 > a');
+    var dateTime = preview.querySelector('p');
+    return {
+        title: header ? header.innerText.trim() : null,
+        link: header ? header.href : null,
+        date_time: dateTime ? dateTime.innerText.trim() : null
+    };
+});
+'''
+# Script that collects every field scraped from an event's web page in one round trip.
+EVENT_PAGE_SCRIPT = '''
+function textOf(selector) {
+    var elem = document.querySelector(selector);
+    return elem ? elem.innerText.trim() : null;
+}
+function textsOf(selector) {
+    return Array.prototype.map.call(document.querySelectorAll(selector), function (elem) {
+        return elem.innerText.trim();
+    });
+}
+return {
+    description: textOf("div[itemprop='description']"),
+    location: textOf("section[itemprop='location'] > p"),
+    contact: textOf("section[class='event-detail-contact-person'] > p"),
+    labels: textsOf("div[class='custom-field-label']"),
+    values: textsOf("div[class='custom-field-value']")
+};
+'''
+
+
 class UBEventsCalendarScraper(Scraper):
     """
     Web scraper for the University at Buffalo Events Calendar
@@ -18,17 +57,58 @@ class UBEventsCalendarScraper(Scraper):
         configuration settings for the web scraper
     event_list : list
         list of events scraped from the University at Buffalo Events Calendar
+    async_deep_scraper : AsyncDeepScraper
+        deep scrapes events concurrently over plain HTTP on a pool of worker threads (None if the configured
+        concurrency is 1 or the backend is not `http`)
+    worker_pool : WebDriverPool
+        pool of WebDriver sessions that deep scrape events in parallel (None if the configured workers is 1)
+    reached_last_page : bool
+        whether or not the last scrape stopped because the calendar has no more pages
+    page_cache : PageCache
+        on-disk cache that event pages are read through when deep scraping (None if caching is disabled)
+    event_store : EventStore
+        store of previously scraped events used for incremental scraping (None if incremental scraping is disabled)
+    event_parser : EventParser
+        parser of the raw date & time strings (in the calendar's timezone) and contact information of events
+    seen_events : dict
+        the first listing of every event page seen this run, keyed by link
+    checkpoint : Checkpoint
+        on-disk checkpoint of the crawl's progress (None if checkpointing is disabled)
+    checkpoint_page : int
+        the next list page to scrape as of the last fully scraped page (None until a page is scraped)
 
     Methods
     -------
-    deep_scrape(evt)
+    deep_scrape(evt, session=None)
         `deep scrape` a single event -- scrape data from that event's web page
+    deep_scrape_events(events)
+        `deep scrape` a list of events, concurrently if the configuration settings allow it
+    parse_event_page(page, evt)
+        scrape an event's data from its (already loaded) web page
+    extract_list_page()
+        extract the title, hyperlink, and raw date & time of every event on the current list page
+    split_repeated_events(events)
+        split events into the ones whose event page is new to this run, and the repeats of earlier listings
+    restart()
+        goes back to the calendar's first page and forgets the scraped events
     scrape_events()
         scrape events from the University at Buffalo Events Calendar based upon the configuration settings
+    iter_events()
+        scrape events from the University at Buffalo Events Calendar, yielding each event as soon as it is scraped
+    save_checkpoint()
+        checkpoints the progress of the crawl as of the last fully scraped page
+    resume_listings(listings)
+        pick up the listings of a checkpointed crawl, remembering their event pages as seen this run
     next_page_button_exists()
         sees whether or not a next page button exists
+    list_page_url(current_page, page)
+        gets the url of a list page from the hyperlink of the current list page's next page button
+    jump_to_page(page)
+        loads a list page straight from the calendar's first page, if list pages can be addressed by url
     click_next_page_button()
         click on the next page button
+    quit()
+        quits the WebDriver and the worker pool, and closes the concurrent deep scraper, cache, and event store
     """
 
     def __init__(self, config):
@@ -39,48 +119,252 @@ class UBEventsCalendarScraper(Scraper):
             Configuration settings for the web scraper
         """
 
-        Scraper.__init__(self, config.chromedriver_path, config.headless)
-        self.open_url('https://calendar.buffalo.edu/', 'list-event')
+        # If the configuration settings pace page loads or adapt them to the site, share one rate limiter between
+        # every page load (list pages, deep scrapes, and worker sessions alike)
+        rate_limiter = None
+        if config.rate_limit or config.adaptive:
+            rate_limiter = RateLimiter(config.rate_limit, config.rate_burst, max(config.concurrency, config.workers),
+                                       config.adaptive, config.max_rate, config.latency_target)
+
+        Scraper.__init__(self, config.chromedriver_path, config.headless, backend=config.backend,
+                         readiness=config.readiness, poll_interval=config.poll_interval,
+                         page_load_strategy=config.page_load_strategy, blocked_resources=config.blocked_resources,
+                         blocked_urls=config.blocked_urls, debugger_address=config.debugger_address,
+                         session_path=config.session_path, rate_limiter=rate_limiter)
+        self.open_url(config.base_url, 'list-event')
         self.config = config
         self.event_list = []
+        self.reached_last_page = False
+        self.seen_events = {}
+        self.event_parser = EventParser(tz='US/Eastern')
 
-    def deep_scrape(self, evt):
-        """`Deep scrape` a single event -- scrape data from that event's web page.
+        # If the configuration settings provide a cache location, read event pages through an on-disk cache
+        self.page_cache = None
+        if config.cache_path:
+            self.page_cache = PageCache(config.cache_path, config.cache_size * 1024 * 1024, config.cache_ttl)
+
+        # If the configuration settings provide a checkpoint location, checkpoint the crawl's progress as it goes
+        self.checkpoint = None
+        self.checkpoint_page = None
+        if config.checkpoint_path:
+            self.checkpoint = Checkpoint(config.checkpoint_path)
+
+        # If the configuration settings provide an event store, only scrape events that are new or changed
+        self.event_store = None
+        if config.store_path:
+            self.event_store = EventStore(config.store_path)
+
+        # If the configuration settings allow more than one event page in flight, deep scrape concurrently over plain
+        # HTTP (only with the `http` backend, since pages rendered by Chrome can differ from their raw HTML)
+        self.async_deep_scraper = None
+        if config.concurrency > 1 and config.backend == 'http':
+            self.async_deep_scraper = AsyncDeepScraper(self.parse_event_page, config.concurrency,
+                                                       config.per_host_concurrency, self.timeout, self.page_cache,
+                                                       self.rate_limiter)
+
+        # If the configuration settings allow more than one worker, deep scrape in a pool of WebDriver sessions
+        self.worker_pool = None
+        if config.workers > 1:
+            self.worker_pool = WebDriverPool(config.workers, self._create_worker_session,
+                                             config.worker_timeout, config.health_check_interval)
+
+    def _create_worker_session(self):
+        # Create a WebDriver session for a worker thread, with page loads bounded by the worker timeout
+        session = Scraper(self.config.chromedriver_path, self.config.headless, backend=self.config.backend,
+                          readiness=self.config.readiness, poll_interval=self.config.poll_interval,
+                          page_load_strategy=self.config.page_load_strategy,
+                          blocked_resources=self.config.blocked_resources, blocked_urls=self.config.blocked_urls,
+                          rate_limiter=self.rate_limiter)
+        if self.config.backend == 'selenium':
+            session.browser.set_page_load_timeout(self.config.worker_timeout)
+        return session
+
+    @staticmethod
+    def parse_event_page(page, evt):
+        """Scrape an event's data from its (already loaded) web page.
 
         Parameters
         ----------
+        page : WebDriver, HTTPBrowser, or HTMLDocument
+            The event's web page
         evt : Event
             The event that will have its data scraped
         """
 
-        # Open the event's hyperlink in a new tab
-        self.open_url(evt.link, 'accordion-header-link', new_tab=True)
+        # If the page is rendered by Chrome, collect every field in a single script call
+        # instead of making a WebDriver round trip per element
+        if isinstance(page, WebDriver):
+            fields = page.execute_script(EVENT_PAGE_SCRIPT)
+        # Else, collect every field from the parsed page's elements
+        else:
+            fields = {}
+            for field, xpath in [('description', ".//div[@itemprop='description']"),
+                                 ('location', ".//section[@itemprop='location']/p"),
+                                 ('contact', ".//section[@class='event-detail-contact-person']/p")]:
+                elems = page.find_elements_by_xpath(xpath)
+                fields[field] = elems[0].text if elems else None
+            fields['labels'] = [label.text for label
+                                in page.find_elements_by_xpath(".//div[@class='custom-field-label']")]
+            fields['values'] = [value.text for value
+                                in page.find_elements_by_xpath(".//div[@class='custom-field-value']")]
 
         # Scrape the event's description
-        description_elems = self.browser.find_elements_by_xpath(".//div[@itemprop='description']")
-        if description_elems:
-            evt.description = description_elems[0].text
+        if fields['description'] is not None:
+            evt.description = fields['description']
 
         # Scrape the event's location
-        location_elems = self.browser.find_elements_by_xpath(".//section[@itemprop='location']/p")
-        if location_elems:
-            evt.location = location_elems[0].text
+        if fields['location'] is not None:
+            evt.location = fields['location']
 
         # Scrape the event's contact information
-        contact_elems = self.browser.find_elements_by_xpath(".//section[@class='event-detail-contact-person']/p")
-        if contact_elems:
-            evt.contact = extract_contact_info(contact_elems[0].text)
+        if fields['contact'] is not None:
+            evt.contact = EventParser.extract_contact_info(fields['contact'])
 
         # Scrape any additional information about the event
-        additional_info_labels = self.browser.find_elements_by_xpath(".//div[@class='custom-field-label']")
-        additional_info_values = self.browser.find_elements_by_xpath(".//div[@class='custom-field-value']")
-        if additional_info_labels and additional_info_values:
+        if fields['labels'] and fields['values']:
             evt.additional_info = {}
-            for label, value in zip(additional_info_labels, additional_info_values):
-                evt.additional_info[re.sub(':', '', label.text)] = value.text
+            for label, value in zip(fields['labels'], fields['values']):
+                evt.additional_info[re.sub(':', '', label)] = value
+
+    def deep_scrape(self, evt, session=None):
+        """`Deep scrape` a single event -- scrape data from that event's web page.
+
+        Parameters
+        ----------
+        evt : Event
+            The event that will have its data scraped
+        session : Scraper
+            The session to load the event's web page in (default None -- a new tab of this scraper)
+        """
+
+        with metrics.timer('deep_scrape_seconds'):
+            self._deep_scrape(evt, session)
+        metrics.increment('events_deep_scraped')
+
+    def _deep_scrape(self, evt, session):
+        # Load and parse the event's web page (deep_scrape times this)
+        session = session or self
+        new_tab = session is self
+
+        # If event pages are cached, try to scrape the event's data without loading its page in the browser
+        if self.page_cache:
+            # Pages loaded over plain HTTP are read through the cache (revalidating them if they are too old)
+            if session.backend == 'http':
+                page_source = session.browser.fetch(evt.link, cache=self.page_cache)
+                self.parse_event_page(HTMLDocument(page_source, evt.link), evt)
+                return
+            # Pages rendered by Chrome are only served from the cache while they are fresh
+            page_source = self.page_cache.get_fresh(evt.link)
+            if page_source is not None:
+                self.parse_event_page(HTMLDocument(page_source, evt.link), evt)
+                return
 
-        # Close the tab
-        self.close_tab()
+        # Open the event's hyperlink (in a long-lived worker tab if tabs are reused, or else in a new tab,
+        # if it is opened in this scraper's session)
+        if new_tab and self.config.reuse_tabs:
+            session.open_in_worker_tab(evt.link, 'accordion-header-link')
+        else:
+            session.open_url(evt.link, 'accordion-header-link', new_tab=new_tab)
+
+        # Scrape the event's data
+        self.parse_event_page(session.browser, evt)
+
+        # Cache the rendered page
+        if self.page_cache:
+            self.page_cache.put(evt.link, session.browser.page_source)
+
+        # Go back to the list page's tab, keeping the worker tab open for the next event if tabs are reused,
+        # or else close the tab
+        if new_tab and self.config.reuse_tabs:
+            session.switch_to_main_tab()
+        elif new_tab:
+            session.close_tab()
+
+    def deep_scrape_events(self, events):
+        """`Deep scrape` a list of events, concurrently if the configuration settings allow it.
+
+        Parameters
+        ----------
+        events : list
+            The events that will have their data scraped
+
+        Yields
+        ------
+        Event
+            each event, once it has been deep scraped (all at once if deep scraping concurrently)
+        """
+
+        # If a worker pool is enabled, spread the events across the pool's WebDriver sessions
+        if self.worker_pool:
+            self.worker_pool.map(lambda session, evt: self.deep_scrape(evt, session), events)
+            yield from events
+        # Else, if concurrent deep scraping is enabled, fetch all of the event pages at once
+        elif self.async_deep_scraper:
+            self.async_deep_scraper.deep_scrape_events(events)
+            yield from events
+        # Else, deep scrape the events one at a time
+        else:
+            for evt in events:
+                self.deep_scrape(evt)
+                yield evt
+
+    def split_repeated_events(self, events):
+        """Split events into the ones whose event page is new to this run, and the repeats of earlier listings.
+
+        Parameters
+        ----------
+        events : list
+            The events of a list page
+
+        Returns
+        -------
+        tuple (list, list)
+            The events with new event pages, and a (repeat, first listing) tuple for every other event
+        """
+
+        new_events = []
+        repeats = []
+        for evt in events:
+            first = self.seen_events.setdefault(evt.link, evt)
+            if first is evt:
+                new_events.append(evt)
+            else:
+                repeats.append((evt, first))
+        if repeats:
+            metrics.increment('repeated_events', len(repeats))
+        return new_events, repeats
+
+    def extract_list_page(self):
+        """Extract the title, hyperlink, and raw date & time of every event on the current list page.
+
+        Returns
+        -------
+        list
+            a list of (title, hyperlink, raw date & time) tuples, in the order they appear on the page
+        """
+
+        # If the page is rendered by Chrome, extract every event in a single script call
+        # instead of making several WebDriver round trips per event
+        if self.backend == 'selenium':
+            return [(raw['title'], raw['link'], raw['date_time'])
+                    for raw in self.browser.execute_script(LIST_EVENTS_SCRIPT)
+                    if raw['link'] is not None and raw['date_time'] is not None]
+
+        # Else, extract the header, event hyperlink, and date & time of each event from the parsed page
+        raw_events = []
+        for event_elem in self.browser.find_elements_by_class_name('list-event-preview'):
+            header = event_elem.find_element_by_xpath('.//h3/a')
+            date_time = event_elem.find_element_by_xpath('.//p')
+            raw_events.append((header.text, header.get_attribute('href'), date_time.text))
+        return raw_events
+
+    def restart(self):
+        """Goes back to the calendar's first page and forgets the scraped events, so that it can be scraped again."""
+
+        self.open_url(self.config.base_url, 'list-event')
+        self.event_list = []
+        self.reached_last_page = False
+        self.seen_events = {}
 
     def scrape_events(self):
         """Scrape events from the University at Buffalo Events Calendar based upon the configuration settings.
@@ -91,44 +375,177 @@ class UBEventsCalendarScraper(Scraper):
             a list of events that were scraped
         """
 
+        self.event_list.extend(self.iter_events())
+        return self.event_list
+
+    def iter_events(self):
+        """Scrape events from the University at Buffalo Events Calendar, yielding each event as soon as it is scraped.
+
+        If incremental scraping is enabled, only new or changed events are deep scraped and yielded, scraping stops
+        at the first page made up entirely of already stored, unchanged events, and the event store is updated with
+        each page's scraped events.
+
+        Each event page is deep scraped at most once per run. Repeated listings of an event page either share the
+        details of its first listing (duplicates `keep`) or are recorded as occurrences of the first listing instead
+        of being yielded (duplicates `collapse`, in which case an event is complete only once scraping finishes).
+
+        If checkpointing is enabled, the crawl's progress is checkpointed every `checkpoint_interval` pages and the
+        checkpoint is removed once the crawl completes. When resuming, the checkpointed events are yielded first and
+        scraping continues from the checkpointed page. Otherwise, any earlier checkpoint is removed as the crawl
+        starts over.
+
+        Yields
+        ------
+        Event
+            each event that was scraped, once its page (or its deep scrape) has been completed
+        """
+
         current_page = 0
+        start_page = self.config.start_page
+        self.reached_last_page = False
+        self.checkpoint_page = None
+
+        # If resuming a crawl, pick up the checkpointed events and continue from the checkpointed page (else start
+        # the checkpoint over)
+        if self.checkpoint:
+            state = self.checkpoint.load(self.config.base_url) if self.config.resume else None
+            if state:
+                start_page, listings = state
+                self.checkpoint_page = start_page
+                yield from self.resume_listings(listings)
+            else:
+                self.checkpoint.clear()
+
+        # If scraping begins after the first page, jump straight to that page instead of clicking through every page
+        # before it (if list pages can be addressed by url)
+        if 0 < start_page and (start_page < self.config.end_page or self.config.all_pages):
+            try:
+                if self.jump_to_page(start_page):
+                    current_page = start_page
+            # If the calendar has no such page, there are no pages left to scrape
+            except HTTPStatusError as e:
+                if e.status != 404:
+                    raise
+                self.reached_last_page = True
+
         # While the web scraper has not reached the end page or finished looking at all pages, scrape events
-        while current_page < self.config.end_page or self.config.all_pages:
+        while not self.reached_last_page and (current_page < self.config.end_page or self.config.all_pages):
 
             # If the current page is at or after the page to begin scraping, scrape the page
-            if current_page >= self.config.start_page:
-                # Get all events on the current page
-                event_elements = self.browser.find_elements_by_class_name('list-event-preview')
-                for event_elem in event_elements:
-                    # Extract the header, event hyperlink, start time, end time, and initialize a new Event
-                    header = event_elem.find_element_by_xpath('.//h3/a')
-                    date_time = event_elem.find_element_by_xpath('.//p')
-                    start, end = extract_date_time(date_time.text, tz='US/Eastern')
-                    evt = Event(header.text, header.get_attribute('href'), start, end)
-
-                    # If configuration settings enable deep scraping, deep scrape this event
-                    if self.config.deep_scrape:
-                        self.deep_scrape(evt)
-
-                    # Append this scraped event to the event list
-                    self.event_list.append(evt)
+            if current_page >= start_page:
+                # Get all events on the current page, extracting the start and end times of the whole page at once
+                with metrics.timer('list_page_parse_seconds'):
+                    list_page = self.extract_list_page()
+                with metrics.timer('extract_date_time_seconds'):
+                    date_times = self.event_parser.extract_date_times(raw_date_time for _, _, raw_date_time
+                                                                      in list_page)
+                page_events = [Event(title, link, start, end)
+                               for (title, link, _), (start, end) in zip(list_page, date_times)]
+                metrics.increment('pages_scraped')
+                metrics.increment('events_scraped', len(page_events))
+                metrics.observe('events_per_page', len(page_events))
+
+                # If scraping incrementally, only keep the new or changed events on this page, and
+                # stop scraping once a page is made up entirely of stored, unchanged events
+                if self.event_store:
+                    if page_events and all(map(self.event_store.is_unchanged, page_events)):
+                        break
+                    page_events = [evt for evt in page_events if not self.event_store.is_unchanged(evt)]
+
+                # Set aside the events whose page was already listed this run (e.g. other days of a recurring
+                # event), so that each event page is deep scraped at most once
+                new_events, repeats = self.split_repeated_events(page_events)
+
+                # If configuration settings enable deep scraping, deep scrape this page's new events
+                if self.config.deep_scrape:
+                    scraped_events = self.deep_scrape_events(new_events)
+                else:
+                    scraped_events = iter(new_events)
+
+                # If collapsing repeated events, record each repeat as an occurrence of the event's first listing
+                if self.config.duplicates == 'collapse':
+                    yield from scraped_events
+                    for evt, first in repeats:
+                        first.add_occurrence(evt)
+                # Else, if the page has no repeated events, yield its events as soon as they are scraped
+                elif not repeats:
+                    yield from scraped_events
+                # Else, share the first listing's deep scraped details with each repeat, in the page's order
+                else:
+                    for _ in scraped_events:
+                        pass
+                    for evt, first in repeats:
+                        evt.copy_details(first)
+                    yield from page_events
+
+                # If scraping incrementally, save every new and changed listing on this page to the event store,
+                # repeats included (with the details of their first listing), so that each is recognized next time
+                if self.event_store:
+                    if self.config.duplicates == 'collapse':
+                        for evt, first in repeats:
+                            evt.copy_details(first)
+                    self.event_store.upsert(page_events)
+
+                # If checkpointing, log this page's listings, and checkpoint every `checkpoint_interval` pages
+                if self.checkpoint:
+                    self.checkpoint.append(page_events)
+                    self.checkpoint_page = current_page + 1
+                    if (self.checkpoint_page - start_page) % self.config.checkpoint_interval == 0:
+                        self.save_checkpoint()
 
             # If a next page button does not exist, stop scraping
             if not self.next_page_button_exists():
+                self.reached_last_page = True
                 break
 
-            # Click the next page button
-            self.click_next_page_button()
+            # Remember the current page's list of events, so that it cannot be mistaken for the next page's
+            current_list = self.browser.find_element_by_class_name('list-event') if self.backend == 'selenium' else None
 
-            # Have the ChromeDriver wait until an element with class name `list_event` loads
-            wait = WebDriverWait(self.browser, self.timeout)
-            wait.until(EC.presence_of_element_located((By.CLASS_NAME, 'list-event')))
+            # Click the next page button, and wait until the current page is gone and an element with class name
+            # `list_event` loads (waiting for the rate limiter, if any, while the next page loads)
+            with self.page_load():
+                with metrics.timer('next_page_click_seconds'):
+                    self.click_next_page_button()
+                self.wait_for_class('list-event', stale_element=current_list)
 
             # Increment the current page the web scraper is on
             current_page += 1
 
-        # Return the event list
-        return self.event_list
+        # The crawl is complete, so there is nothing left to resume
+        if self.checkpoint:
+            self.checkpoint.clear()
+
+    def save_checkpoint(self):
+        """Checkpoints the progress of the crawl as of the last fully scraped page (if checkpointing is enabled)."""
+
+        if self.checkpoint and self.checkpoint_page is not None:
+            with metrics.timer('checkpoint_seconds'):
+                self.checkpoint.save(self.checkpoint_page, self.config.base_url)
+
+    def resume_listings(self, listings):
+        """Pick up the listings of a checkpointed crawl, remembering their event pages as seen this run.
+
+        Parameters
+        ----------
+        listings : list
+            The checkpointed listings, in the order they were scraped
+
+        Returns
+        -------
+        list
+            The checkpointed events (with the repeats of each event page recorded as occurrences of its first listing,
+            if collapsing repeated events)
+        """
+
+        events = []
+        for evt in listings:
+            # Remember each event page (which was deep scraped, if deep scraping), so that it is not scraped again
+            first = self.seen_events.setdefault(evt.link, evt)
+            if self.config.duplicates == 'collapse' and first is not evt:
+                first.add_occurrence(evt)
+            else:
+                events.append(evt)
+        return events
 
     def next_page_button_exists(self):
         """Sees whether or not a next page button exists.
@@ -146,6 +563,72 @@ class UBEventsCalendarScraper(Scraper):
             return False
         return True
 
+    def list_page_url(self, current_page, page):
+        """Gets the url of a list page from the hyperlink of the current list page's next page button.
+
+        The last number in the hyperlink is taken to be the number of the next page, which is renumbered for the page.
+
+        Parameters
+        ----------
+        current_page : int
+            The current list page (0 is the first page)
+        page : int
+            The list page to get the url of
+
+        Returns
+        -------
+        str
+            The url of the list page, or None if the current page has no next page button with a numbered hyperlink
+        """
+
+        try:
+            button = self.browser.find_element_by_class_name('icon-angle-right').find_element_by_xpath('..')
+        except NoSuchElementException:
+            return None
+        href = button.get_attribute('href')
+        numbers = list(re.finditer(r'\d+', href or ''))
+        if not numbers:
+            return None
+        number = numbers[-1]
+        page_number = int(number.group()) + page - (current_page + 1)
+        return href[:number.start()] + str(page_number) + href[number.end():]
+
+    def jump_to_page(self, page):
+        """Loads a list page straight from the calendar's first page, if list pages can be addressed by url.
+
+        The page's url is made from the hyperlink of the first page's next page button. Once loaded, the page's own
+        next page button must link to the page after it, or else the url is taken to be wrong and the calendar's
+        first page is loaded again.
+
+        Parameters
+        ----------
+        page : int
+            The list page to load
+
+        Returns
+        -------
+        bool
+            True -- if the list page was loaded
+            False -- if list pages cannot be addressed by url (the calendar's first page is left loaded)
+
+        Raises
+        ------
+        HTTPStatusError
+            If the list page is answered with an HTTP error status code (e.g. 404 if the calendar has no such page).
+        """
+
+        url = self.list_page_url(0, page)
+        if url is None:
+            return False
+        next_url = self.list_page_url(0, page + 1)
+        self.open_url(url, 'list-event')
+        actual_next_url = self.list_page_url(page, page + 1)
+        if actual_next_url is not None and actual_next_url != next_url:
+            self.open_url(self.config.base_url, 'list-event')
+            return False
+        metrics.increment('list_page_jumps')
+        return True
+
     def click_next_page_button(self):
         """Click on the next page button."""
 
@@ -153,3 +636,16 @@ class UBEventsCalendarScraper(Scraper):
         button_child = self.browser.find_element_by_class_name('icon-angle-right')
         button = button_child.find_element_by_xpath('..')
         button.click()
+
+    def quit(self):
+        """Quits the WebDriver and the worker pool, and closes the concurrent deep scraper, cache, and event store."""
+
+        Scraper.quit(self)
+        if self.worker_pool:
+            self.worker_pool.quit()
+        if self.async_deep_scraper:
+            self.async_deep_scraper.close()
+        if self.page_cache:
+            self.page_cache.close()
+        if self.event_store:
+            self.event_store.close()
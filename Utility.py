@@ -5,11 +5,11 @@ import json
 # import yaml
 import xml.etree.ElementTree as ET
 from xml.etree.ElementTree import Element
-from xml.dom import minidom
 from configparser import ConfigParser, SectionProxy
-from datetime import datetime, timedelta
-from pytz import timezone
 from Configuration import Configuration
+from EventWriter import (EVENT_WRITERS, JSONEventWriter, NDJSONEventWriter, XMLEventWriter, YAMLEventWriter,
+                         ParquetEventWriter, ArrowEventWriter)
+from EventParser import EventParser
 
 
 # Set of allowed config file types.
@@ -19,23 +19,25 @@ ALLOWED_TRUE_STRINGS = {'true', 't', 'yes', 'y'}
 # Set of allowed `false` string values.
 ALLOWED_FALSE_STRINGS = {'false', 'f', 'no', 'n'}
 # Set of allowed export file types.
-ALLOWED_EXPORT_FILE_TYPES = {'json', 'xml', 'yaml', 'yml'}
-
-# Regex for seeing if a string contains `Start` or `End`
-START_END_REGEX = r'(Starts|Ends):'
-# Regex for seeing if a string contains `All Day`
-ALL_DAY_REGEX = r'All\sDay'
-# Regex for retrieving the date from a string
-DATE_REGEX = r'(0?\d|1[0-2])/(0?\d|[12]\d|3[01])/([12]\d{3})'
-# Regex for retrieving the time from a string
-TIME_REGEX = r'(0?[0-9]|1[0-2]):([0-5][0-9])(:[0-5][0-9])?\s?[AP]\.?M\.?'
-# Regex for retrieving the contact name from a contact info string
-CONTACT_NAME_REGEX = r'^[a-zA-Z ,-]+$'
-# Regex for retrieving the phone number from a contact info string
-PHONE_NUMBER_REGEX = r'\(?\d{3}\)?(\s|-)?\d{3}(\s|-)?\d{4}'
-# Regex for retrieving the email from a contact info string
-EMAIL_REGEX = r'[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9.-]+'
-
+ALLOWED_EXPORT_FILE_TYPES = {'json', 'ndjson', 'jsonl', 'xml', 'yaml', 'yml', 'parquet', 'arrow'}
+# Set of allowed fetch backends.
+ALLOWED_BACKENDS = {'selenium', 'http'}
+# Set of allowed ways of waiting for page readiness.
+ALLOWED_READINESS = {'observer', 'poll'}
+# Set of allowed page load strategies.
+ALLOWED_PAGE_LOAD_STRATEGIES = {'normal', 'eager', 'none'}
+# Set of resource types that can be blocked.
+ALLOWED_BLOCKED_RESOURCES = {'image', 'font', 'stylesheet', 'media'}
+# Set of allowed ways of handling repeated listings of the same event page.
+ALLOWED_DUPLICATES = {'collapse', 'keep'}
+# Set of command line flags that are followed by a value.
+FLAGS_WITH_VALUES = {'--config', '--path', '--export', '--backend', '--concurrency', '--per-host',
+                     '--workers', '--worker-timeout', '--health-check', '--shards', '--shard-pages',
+                     '--cache', '--cache-size', '--cache-ttl', '--incremental', '--base-url',
+                     '--metrics', '--prometheus', '--readiness', '--poll-interval',
+                     '--page-load', '--block', '--block-urls', '--debugger-address', '--session',
+                     '--serve', '--refresh', '--duplicates', '--checkpoint', '--checkpoint-every',
+                     '--rate', '--burst', '--max-rate', '--latency-target'}
 
 class InvalidExportFileTypeError(Exception):
     """An exception that indicates that the export file path has an invalid file type."""
@@ -173,6 +175,393 @@ def get_nested_elem(parser, func_list, key_list, file_ext, cast):
     return cast(elem)
 
 
+def get_optional_nested_elem(parser, func_list, key_list, file_ext, cast, default):
+    """Retrieve the value of an optional nested element from within a config file.
+
+    Parameters
+    ----------
+    parser : ConfigParser (.ini, .config, .cfg), dict (.json, .yaml, .yml), or Element (.xml)
+        The object that will store the structure of elements
+    func_list : list
+        A list of functions that will be called on the structure of elements to get the nested element
+    key_list : list
+        A list of str that is the `path` within the config file to retrieve the nested element
+    file_ext : str
+        File extension for the config file
+    cast : function
+        The data type that the element's text value will be converted into
+    default : object
+        The value to return if the element is not in the config file
+
+    Returns
+    -------
+    type(cast)
+        The converted text value of the nested element, or `default` if the element does not exist
+    """
+
+    try:
+        return get_nested_elem(parser, func_list, key_list, file_ext, cast)
+    # A missing key raises a KeyError (.ini, .json, .yaml) or leaves a None element behind (.xml)
+    except (KeyError, AttributeError, TypeError):
+        return default
+
+
+def split_list(text):
+    """Split a comma-separated config value or command line argument into a list.
+
+    Parameters
+    ----------
+    text : str or list
+        The comma-separated values (e.g. `image, font`), or a list of values (.json, .yaml)
+
+    Returns
+    -------
+    list
+        The stripped, non-empty values
+    """
+
+    values = text if isinstance(text, list) else str(text).split(',')
+    return [str(value).strip() for value in values if str(value).strip()]
+
+
+def get_arg_value(args, flag, cast, default):
+    """Retrieve the value that follows a command line flag.
+
+    Parameters
+    ----------
+    args : list
+        Command line arguments
+    flag : str
+        The command line flag whose value will be retrieved
+    cast : function
+        The data type that the value will be converted into
+    default : object
+        The value to return if the flag was not used
+
+    Returns
+    -------
+    type(cast)
+        The converted value that follows the flag, or `default` if the flag was not used
+
+    Raises
+    ------
+    InvalidArgumentsError
+        if the flag is the final command line argument, or its value cannot be converted
+    """
+
+    if flag not in args:
+        return default
+    if flag == args[-1]:
+        raise InvalidArgumentsError('`{}` cannot be the final argument.'.format(flag))
+    value = args[args.index(flag)+1]
+    try:
+        return cast(value)
+    except ValueError:
+        raise InvalidArgumentsError('`{}` is not a valid value for `{}`.'.format(value, flag))
+
+
+def validate_backend(backend):
+    """Validate the fetch backend of the configuration settings.
+
+    Parameters
+    ----------
+    backend : str
+        the fetch backend used to load pages
+
+    Raises
+    ------
+    InvalidConfigFileValueError
+        if the backend is not one of the allowed fetch backends
+    """
+
+    if backend not in ALLOWED_BACKENDS:
+        raise InvalidConfigFileValueError('`{}` is not a valid backend. Allowed backends are: {}'
+                                          .format(backend, ', '.join(sorted(ALLOWED_BACKENDS))))
+
+
+def validate_concurrency(concurrency, per_host_concurrency, backend='http'):
+    """Validate the deep scraping concurrency limits of the configuration settings.
+
+    Parameters
+    ----------
+    concurrency : int
+        maximum number of event pages deep scraped at once
+    per_host_concurrency : int
+        maximum number of event pages deep scraped at once from the same host (None for no separate limit)
+    backend : str
+        the fetch backend used to load pages (default `http`)
+
+    Raises
+    ------
+    InvalidConfigFileValueError
+        if either limit is less than 1, or if concurrent deep scraping is enabled with a backend other than `http`
+    """
+
+    if concurrency < 1:
+        raise InvalidConfigFileValueError('Concurrency must be at least 1. The number given was `{}`'
+                                          .format(concurrency))
+    if per_host_concurrency is not None and per_host_concurrency < 1:
+        raise InvalidConfigFileValueError('Per-host concurrency must be at least 1. The number given was `{}`'
+                                          .format(per_host_concurrency))
+    # Concurrent deep scraping fetches event pages over plain HTTP, which would silently bypass Chrome's rendering
+    if concurrency > 1 and backend != 'http':
+        raise InvalidConfigFileValueError('Concurrency greater than 1 requires the `http` backend. Use workers to deep '
+                                          'scrape in parallel Chrome sessions.')
+
+
+def validate_workers(workers, worker_timeout, health_check_interval, concurrency):
+    """Validate the WebDriver worker pool settings of the configuration settings.
+
+    Parameters
+    ----------
+    workers : int
+        number of WebDriver sessions that deep scrape events in parallel
+    worker_timeout : int
+        number of seconds a worker may spend deep scraping a single event
+    health_check_interval : int
+        minimum number of seconds between health checks of a worker's WebDriver session
+    concurrency : int
+        maximum number of event pages deep scraped at once over plain HTTP
+
+    Raises
+    ------
+    InvalidConfigFileValueError
+        if any of the settings are out of range, or if both a worker pool and concurrent HTTP deep scraping are enabled
+    """
+
+    if workers < 1:
+        raise InvalidConfigFileValueError('Workers must be at least 1. The number given was `{}`'.format(workers))
+    if worker_timeout < 1:
+        raise InvalidConfigFileValueError('Worker timeout must be at least 1 second. The number given was `{}`'
+                                          .format(worker_timeout))
+    if health_check_interval < 0:
+        raise InvalidConfigFileValueError('Health check interval must be a non-negative number. The number given was '
+                                          '`{}`'.format(health_check_interval))
+    if workers > 1 and concurrency > 1:
+        raise InvalidConfigFileValueError('Workers and concurrency cannot both be greater than 1.')
+
+
+def validate_shards(shards, shard_pages):
+    """Validate the page-range sharding settings of the configuration settings.
+
+    Parameters
+    ----------
+    shards : int
+        number of worker processes that each scrape their own range of pages
+    shard_pages : int
+        number of pages handed to a worker process at a time when scraping all pages
+
+    Raises
+    ------
+    InvalidConfigFileValueError
+        if either setting is less than 1
+    """
+
+    if shards < 1:
+        raise InvalidConfigFileValueError('Shards must be at least 1. The number given was `{}`'.format(shards))
+    if shard_pages < 1:
+        raise InvalidConfigFileValueError('Shard pages must be at least 1. The number given was `{}`'
+                                          .format(shard_pages))
+
+
+def validate_cache(cache_size, cache_ttl):
+    """Validate the page cache settings of the configuration settings.
+
+    Parameters
+    ----------
+    cache_size : int
+        the maximum size of the on-disk cache in megabytes
+    cache_ttl : int
+        the number of seconds a cached event page is used without being revalidated
+
+    Raises
+    ------
+    InvalidConfigFileValueError
+        if the cache size is less than 1 or the time-to-live is negative
+    """
+
+    if cache_size < 1:
+        raise InvalidConfigFileValueError('Cache size must be at least 1 MB. The number given was `{}`'
+                                          .format(cache_size))
+    if cache_ttl < 0:
+        raise InvalidConfigFileValueError('Cache TTL must be a non-negative number. The number given was `{}`'
+                                          .format(cache_ttl))
+
+
+def validate_resource_blocking(page_load_strategy, blocked_resources):
+    """Validate the page load strategy and blocked resource types of the configuration settings.
+
+    Parameters
+    ----------
+    page_load_strategy : str
+        when Chrome considers a page loaded (`normal`, `eager`, or `none`)
+    blocked_resources : list
+        resource types Chrome is blocked from downloading
+
+    Raises
+    ------
+    InvalidConfigFileValueError
+        if the page load strategy or a resource type is not allowed
+    """
+
+    if page_load_strategy not in ALLOWED_PAGE_LOAD_STRATEGIES:
+        raise InvalidConfigFileValueError('`{}` is not a valid page load strategy. Allowed strategies are: {}'
+                                          .format(page_load_strategy, ', '.join(sorted(ALLOWED_PAGE_LOAD_STRATEGIES))))
+    for resource_type in blocked_resources:
+        if resource_type not in ALLOWED_BLOCKED_RESOURCES:
+            raise InvalidConfigFileValueError('`{}` is not a valid resource type. Allowed resource types are: {}'
+                                              .format(resource_type, ', '.join(sorted(ALLOWED_BLOCKED_RESOURCES))))
+
+
+def validate_warm_session(debugger_address, session_path):
+    """Validate the warm browser session settings.
+
+    Parameters
+    ----------
+    debugger_address : str
+        The `host:port` of an already running Google Chrome to attach to
+    session_path : str
+        The file path of a persisted WebDriver session
+
+    Raises
+    ------
+    InvalidConfigFileValueError
+        If both a debugger address and a persisted session are given
+    """
+
+    if debugger_address and session_path:
+        raise InvalidConfigFileValueError('A debugger address and a persisted session cannot both be given.')
+
+
+def validate_service(serve_port, refresh_interval):
+    """Validate the long-running service settings.
+
+    Parameters
+    ----------
+    serve_port : int
+        The local port that the events are served on
+    refresh_interval : int
+        The number of seconds between re-scrapes of the calendar
+
+    Raises
+    ------
+    InvalidConfigFileValueError
+        If the port is not a valid port number or the refresh interval is less than 1 second
+    """
+
+    if serve_port is not None and not 0 <= serve_port <= 65535:
+        raise InvalidConfigFileValueError('Serve port must be between 0 and 65535. The number given was `{}`'
+                                          .format(serve_port))
+    if refresh_interval < 1:
+        raise InvalidConfigFileValueError('Refresh interval must be at least 1 second. The number given was `{}`'
+                                          .format(refresh_interval))
+
+
+def validate_duplicates(duplicates):
+    """Validate how repeated listings of the same event page are handled in the configuration settings.
+
+    Parameters
+    ----------
+    duplicates : str
+        how repeated listings are handled (`collapse` or `keep`)
+
+    Raises
+    ------
+    InvalidConfigFileValueError
+        if the value is not one of the allowed ways of handling repeated listings
+    """
+
+    if duplicates not in ALLOWED_DUPLICATES:
+        raise InvalidConfigFileValueError('`{}` is not a valid duplicates value. Allowed duplicates values are: {}'
+                                          .format(duplicates, ', '.join(sorted(ALLOWED_DUPLICATES))))
+
+
+def validate_checkpoint(checkpoint_path, checkpoint_interval, resume):
+    """Validate the checkpoint settings.
+
+    Parameters
+    ----------
+    checkpoint_path : str
+        the file path of the checkpoint
+    checkpoint_interval : int
+        the number of list pages scraped between checkpoints
+    resume : bool
+        whether or not the crawl resumes from its checkpoint
+
+    Raises
+    ------
+    InvalidConfigFileValueError
+        if the checkpoint interval is less than 1, or resuming without a checkpoint path
+    """
+
+    if checkpoint_interval < 1:
+        raise InvalidConfigFileValueError('Checkpoint interval must be at least 1 page. The number given was `{}`'
+                                          .format(checkpoint_interval))
+    if resume and not checkpoint_path:
+        raise InvalidConfigFileValueError('A checkpoint path must be given to resume a crawl.')
+
+
+def validate_rate_limit(rate_limit, rate_burst, max_rate, latency_target):
+    """Validate the rate limiting settings.
+
+    Parameters
+    ----------
+    rate_limit : float
+        the number of page loads started per second (None if page loads are not paced)
+    rate_burst : int
+        the maximum number of page loads started at once after an idle period
+    max_rate : float
+        the maximum number of page loads per second that an adaptive rate is raised to (None for no maximum)
+    latency_target : float
+        the number of seconds past which a page load is considered slow
+
+    Raises
+    ------
+    InvalidConfigFileValueError
+        if the rate or the latency target is not positive, the burst is less than 1, or the maximum rate is less
+        than the rate
+    """
+
+    if rate_limit is not None and rate_limit <= 0:
+        raise InvalidConfigFileValueError('Rate limit must be a positive number. The number given was `{}`'
+                                          .format(rate_limit))
+    if rate_burst < 1:
+        raise InvalidConfigFileValueError('Rate burst must be at least 1 page load. The number given was `{}`'
+                                          .format(rate_burst))
+    if max_rate is not None and rate_limit is None:
+        raise InvalidConfigFileValueError('A rate limit must be given to set a maximum rate.')
+    if max_rate is not None and max_rate < rate_limit:
+        raise InvalidConfigFileValueError('Maximum rate must be at least the rate limit. The number given was `{}`'
+                                          .format(max_rate))
+    if latency_target <= 0:
+        raise InvalidConfigFileValueError('Latency target must be a positive number. The number given was `{}`'
+                                          .format(latency_target))
+
+
+def validate_readiness(readiness, poll_interval):
+    """Validate how page readiness is waited for in the configuration settings.
+
+    Parameters
+    ----------
+    readiness : str
+        how page readiness is waited for (`observer` or `poll`)
+    poll_interval : float
+        the number of seconds between checks when polling for page readiness
+
+    Raises
+    ------
+    InvalidConfigFileValueError
+        if the readiness is not one of the allowed ways of waiting, or the poll interval is not positive
+    """
+
+    if readiness not in ALLOWED_READINESS:
+        raise InvalidConfigFileValueError('`{}` is not a valid readiness. Allowed readiness values are: {}'
+                                          .format(readiness, ', '.join(sorted(ALLOWED_READINESS))))
+    if poll_interval <= 0:
+        raise InvalidConfigFileValueError('Poll interval must be a positive number. The number given was `{}`'
+                                          .format(poll_interval))
+
+
 def parse_config_file(parser, func_list, file_ext):
     """Parse the configuration file to retrieve all of the configuration settings.
 
@@ -208,10 +597,72 @@ def parse_config_file(parser, func_list, file_ext):
     export_path = get_nested_elem(parser, func_list, ['settings', 'export_path'], file_ext, str)
     export_extension = export_path.rsplit('.', 1)[-1].lower()
     print_evts = get_nested_elem(parser, func_list, ['settings', 'print'], file_ext, eval_config_file_boolean)
+    backend = get_optional_nested_elem(parser, func_list, ['settings', 'backend'], file_ext,
+                                       lambda s: str(s).strip().lower(), 'selenium')
+    concurrency = get_optional_nested_elem(parser, func_list, ['settings', 'concurrency'], file_ext, int, 1)
+    per_host_concurrency = get_optional_nested_elem(parser, func_list, ['settings', 'per_host_concurrency'],
+                                                    file_ext, int, None)
+    workers = get_optional_nested_elem(parser, func_list, ['settings', 'workers'], file_ext, int, 1)
+    worker_timeout = get_optional_nested_elem(parser, func_list, ['settings', 'worker_timeout'], file_ext, int, 60)
+    health_check_interval = get_optional_nested_elem(parser, func_list, ['settings', 'health_check_interval'],
+                                                     file_ext, int, 30)
+    shards = get_optional_nested_elem(parser, func_list, ['settings', 'shards'], file_ext, int, 1)
+    shard_pages = get_optional_nested_elem(parser, func_list, ['settings', 'shard_pages'], file_ext, int, 5)
+    cache_path = get_optional_nested_elem(parser, func_list, ['cache', 'path'], file_ext, str, None)
+    cache_size = get_optional_nested_elem(parser, func_list, ['cache', 'size'], file_ext, int, 100)
+    cache_ttl = get_optional_nested_elem(parser, func_list, ['cache', 'ttl'], file_ext, int, 3600)
+    store_path = get_optional_nested_elem(parser, func_list, ['settings', 'incremental_store'], file_ext, str, None)
+    base_url = get_optional_nested_elem(parser, func_list, ['settings', 'base_url'], file_ext, str,
+                                        'https://calendar.buffalo.edu/')
+    metrics_path = get_optional_nested_elem(parser, func_list, ['metrics', 'report'], file_ext, str, None)
+    prometheus_path = get_optional_nested_elem(parser, func_list, ['metrics', 'prometheus'], file_ext, str, None)
+    readiness = get_optional_nested_elem(parser, func_list, ['settings', 'readiness'], file_ext,
+                                         lambda s: str(s).strip().lower(), 'observer')
+    poll_interval = get_optional_nested_elem(parser, func_list, ['settings', 'poll_interval'], file_ext, float, 0.05)
+    page_load_strategy = get_optional_nested_elem(parser, func_list, ['settings', 'page_load_strategy'], file_ext,
+                                                  lambda s: str(s).strip().lower(), 'normal')
+    blocked_resources = get_optional_nested_elem(parser, func_list, ['settings', 'block_resources'], file_ext,
+                                                 lambda s: [value.lower() for value in split_list(s)], [])
+    blocked_urls = get_optional_nested_elem(parser, func_list, ['settings', 'block_urls'], file_ext, split_list, [])
+    reuse_tabs = get_optional_nested_elem(parser, func_list, ['settings', 'reuse_tabs'], file_ext,
+                                          eval_config_file_boolean, False)
+    debugger_address = get_optional_nested_elem(parser, func_list, ['chromedriver', 'debugger_address'], file_ext,
+                                                str, None)
+    session_path = get_optional_nested_elem(parser, func_list, ['chromedriver', 'session'], file_ext, str, None)
+    serve_port = get_optional_nested_elem(parser, func_list, ['service', 'port'], file_ext, int, None)
+    refresh_interval = get_optional_nested_elem(parser, func_list, ['service', 'refresh_interval'], file_ext, int,
+                                                3600)
+    duplicates = get_optional_nested_elem(parser, func_list, ['settings', 'duplicates'], file_ext,
+                                          lambda s: str(s).strip().lower(), 'keep')
+    checkpoint_path = get_optional_nested_elem(parser, func_list, ['checkpoint', 'path'], file_ext, str, None)
+    checkpoint_interval = get_optional_nested_elem(parser, func_list, ['checkpoint', 'interval'], file_ext, int, 1)
+    resume = get_optional_nested_elem(parser, func_list, ['checkpoint', 'resume'], file_ext, eval_config_file_boolean,
+                                      False)
+    rate_limit = get_optional_nested_elem(parser, func_list, ['rate_limit', 'rate'], file_ext, float, None)
+    rate_burst = get_optional_nested_elem(parser, func_list, ['rate_limit', 'burst'], file_ext, int, 1)
+    adaptive = get_optional_nested_elem(parser, func_list, ['rate_limit', 'adaptive'], file_ext,
+                                        eval_config_file_boolean, False)
+    max_rate = get_optional_nested_elem(parser, func_list, ['rate_limit', 'max_rate'], file_ext, float, None)
+    latency_target = get_optional_nested_elem(parser, func_list, ['rate_limit', 'latency_target'], file_ext, float,
+                                              2.0)
 
     # Validate start and end pages
     validate_start_end_pages(start_page, end_page)
 
+    # Validate the fetch backend, deep scraping concurrency limits, worker pool, sharding, and cache settings
+    validate_backend(backend)
+    validate_concurrency(concurrency, per_host_concurrency, backend)
+    validate_workers(workers, worker_timeout, health_check_interval, concurrency)
+    validate_shards(shards, shard_pages)
+    validate_cache(cache_size, cache_ttl)
+    validate_readiness(readiness, poll_interval)
+    validate_resource_blocking(page_load_strategy, blocked_resources)
+    validate_warm_session(debugger_address, session_path)
+    validate_service(serve_port, refresh_interval)
+    validate_duplicates(duplicates)
+    validate_checkpoint(checkpoint_path, checkpoint_interval, resume)
+    validate_rate_limit(rate_limit, rate_burst, max_rate, latency_target)
+
     # If the configuration setting for exporting data is enabled and
     # the export file path has no file extension, raise an InvalidConfigFileValueError
     if export:
@@ -225,7 +676,18 @@ def parse_config_file(parser, func_list, file_ext):
 
     # Create a new instance of Configuration and return it
     return Configuration(chromedriver_path, headless, deep_scrape, start_page, end_page,
-                         all_pages, export, overwrite, export_path, export_extension, print_evts)
+                         all_pages, export, overwrite, export_path, export_extension, print_evts,
+                         backend=backend, concurrency=concurrency, per_host_concurrency=per_host_concurrency,
+                         workers=workers, worker_timeout=worker_timeout, health_check_interval=health_check_interval,
+                         shards=shards, shard_pages=shard_pages, cache_path=cache_path, cache_size=cache_size,
+                         cache_ttl=cache_ttl, store_path=store_path, base_url=base_url,
+                         metrics_path=metrics_path, prometheus_path=prometheus_path, readiness=readiness,
+                         poll_interval=poll_interval, page_load_strategy=page_load_strategy,
+                         blocked_resources=blocked_resources, blocked_urls=blocked_urls, reuse_tabs=reuse_tabs,
+                         debugger_address=debugger_address, session_path=session_path, serve_port=serve_port,
+                         refresh_interval=refresh_interval, duplicates=duplicates, checkpoint_path=checkpoint_path,
+                         checkpoint_interval=checkpoint_interval, resume=resume, rate_limit=rate_limit,
+                         rate_burst=rate_burst, adaptive=adaptive, max_rate=max_rate, latency_target=latency_target)
 
 
 def read_config_file(config_file_path):
@@ -359,8 +821,8 @@ def read_args(args):
     headless = '--head' not in args
     deep_scrape = '--deep' in args
 
-    # Extract the numbers of the pages that will be scraped
-    pages = list(map(int, filter(lambda arg: arg.isnumeric(), args)))
+    # Extract the numbers of the pages that will be scraped (ignoring the values of flags such as `--concurrency`)
+    pages = [int(arg) for idx, arg in enumerate(args) if arg.isnumeric() and args[idx-1] not in FLAGS_WITH_VALUES]
     start_page, end_page = extract_start_end_pages(pages)
 
     # Validate the start and end pages
@@ -380,6 +842,82 @@ def read_args(args):
     overwrite = '--overwrite' in args
     print_evts = '--print' in args
 
+    # Extract and validate the fetch backend and deep scraping concurrency limits
+    backend = get_arg_value(args, '--backend', lambda s: s.strip().lower(), 'selenium')
+    concurrency = get_arg_value(args, '--concurrency', int, 1)
+    per_host_concurrency = get_arg_value(args, '--per-host', int, None)
+    validate_backend(backend)
+    validate_concurrency(concurrency, per_host_concurrency, backend)
+
+    # Extract and validate the WebDriver worker pool settings
+    workers = get_arg_value(args, '--workers', int, 1)
+    worker_timeout = get_arg_value(args, '--worker-timeout', int, 60)
+    health_check_interval = get_arg_value(args, '--health-check', int, 30)
+    validate_workers(workers, worker_timeout, health_check_interval, concurrency)
+
+    # Extract and validate the page-range sharding settings
+    shards = get_arg_value(args, '--shards', int, 1)
+    shard_pages = get_arg_value(args, '--shard-pages', int, 5)
+    validate_shards(shards, shard_pages)
+
+    # Extract and validate the page cache settings
+    cache_path = get_arg_value(args, '--cache', str, None)
+    cache_size = get_arg_value(args, '--cache-size', int, 100)
+    cache_ttl = get_arg_value(args, '--cache-ttl', int, 3600)
+    validate_cache(cache_size, cache_ttl)
+
+    # Extract the event store used to scrape incrementally
+    store_path = get_arg_value(args, '--incremental', str, None)
+
+    # Extract the url of the events calendar (e.g. a local mirror used for benchmarking)
+    base_url = get_arg_value(args, '--base-url', str, 'https://calendar.buffalo.edu/')
+
+    # Extract where the timing metrics of the run are written
+    metrics_path = get_arg_value(args, '--metrics', str, None)
+    prometheus_path = get_arg_value(args, '--prometheus', str, None)
+
+    # Extract and validate how page readiness is waited for
+    readiness = get_arg_value(args, '--readiness', lambda s: s.lower(), 'observer')
+    poll_interval = get_arg_value(args, '--poll-interval', float, 0.05)
+    validate_readiness(readiness, poll_interval)
+
+    # Extract and validate the page load strategy and the requests Chrome is blocked from making
+    page_load_strategy = get_arg_value(args, '--page-load', lambda s: s.lower(), 'normal')
+    blocked_resources = get_arg_value(args, '--block', lambda s: split_list(s.lower()), [])
+    blocked_urls = get_arg_value(args, '--block-urls', split_list, [])
+    validate_resource_blocking(page_load_strategy, blocked_resources)
+
+    # Extract whether or not event pages are deep scraped in one long-lived tab
+    reuse_tabs = '--reuse-tabs' in args
+
+    # Extract and validate the warm browser session to attach to
+    debugger_address = get_arg_value(args, '--debugger-address', str, None)
+    session_path = get_arg_value(args, '--session', str, None)
+    validate_warm_session(debugger_address, session_path)
+
+    # Extract and validate the long-running service settings
+    serve_port = get_arg_value(args, '--serve', int, None)
+    refresh_interval = get_arg_value(args, '--refresh', int, 3600)
+    validate_service(serve_port, refresh_interval)
+
+    # Extract and validate how repeated listings of the same event page are handled
+    duplicates = get_arg_value(args, '--duplicates', lambda s: s.lower(), 'keep')
+    validate_duplicates(duplicates)
+
+    # Extract and validate where (and how often) the crawl's progress is checkpointed, and whether it is resumed
+    checkpoint_path = get_arg_value(args, '--checkpoint', str, None)
+    checkpoint_interval = get_arg_value(args, '--checkpoint-every', int, 1)
+    resume = '--resume' in args
+    validate_checkpoint(checkpoint_path, checkpoint_interval, resume)
+
+    # Extract and validate how page loads are paced, and whether their rate and concurrency adapt to the site
+    rate_limit = get_arg_value(args, '--rate', float, None)
+    rate_burst = get_arg_value(args, '--burst', int, 1)
+    adaptive = '--adaptive' in args
+    max_rate = get_arg_value(args, '--max-rate', float, None)
+    latency_target = get_arg_value(args, '--latency-target', float, 2.0)
+    validate_rate_limit(rate_limit, rate_burst, max_rate, latency_target)
+
     # If the configuration setting for exporting data is enabled and
     # the export file path has no file extension, raise an InvalidConfigFileValueError
     if export:
@@ -393,7 +931,18 @@ def read_args(args):
 
     # Create a new instance of Configuration and return it
     return Configuration(chromedriver_path, headless, deep_scrape, start_page, end_page,
-                         all_pages, export, overwrite, export_path, export_extension, print_evts)
+                         all_pages, export, overwrite, export_path, export_extension, print_evts,
+                         backend=backend, concurrency=concurrency, per_host_concurrency=per_host_concurrency,
+                         workers=workers, worker_timeout=worker_timeout, health_check_interval=health_check_interval,
+                         shards=shards, shard_pages=shard_pages, cache_path=cache_path, cache_size=cache_size,
+                         cache_ttl=cache_ttl, store_path=store_path, base_url=base_url,
+                         metrics_path=metrics_path, prometheus_path=prometheus_path, readiness=readiness,
+                         poll_interval=poll_interval, page_load_strategy=page_load_strategy,
+                         blocked_resources=blocked_resources, blocked_urls=blocked_urls, reuse_tabs=reuse_tabs,
+                         debugger_address=debugger_address, session_path=session_path, serve_port=serve_port,
+                         refresh_interval=refresh_interval, duplicates=duplicates, checkpoint_path=checkpoint_path,
+                         checkpoint_interval=checkpoint_interval, resume=resume, rate_limit=rate_limit,
+                         rate_burst=rate_burst, adaptive=adaptive, max_rate=max_rate, latency_target=latency_target)
 
 
 def extract_date_time(raw_date_time, tz):
@@ -412,56 +961,7 @@ def extract_date_time(raw_date_time, tz):
         A tuple with the event start datetime and event end datetime, both formatted as: MM/DD/YYYY HH:MM AM/PM UTC-OFFSET
     """
 
-    start_date, end_date, start_time, end_time = None, None, None, None
-
-    # If an event is `All Day`, set the start time to be 12:00 AM and end time to be 11:59 PM
-    if re.search(ALL_DAY_REGEX, raw_date_time):
-        start_time = datetime.strptime('12:00 AM', '%I:%M %p')
-        end_time = datetime.strptime('11:59 PM', '%I:%M %p')
-
-    # Extract the start and end dates of an event
-    pattern = re.compile(DATE_REGEX)
-    for match in re.finditer(pattern, raw_date_time):
-        date = match.group()
-
-        # If the event has distinct start and end dates, extract them
-        if re.search(START_END_REGEX, raw_date_time):
-            if start_date:
-                end_date = datetime.strptime(date, '%m/%d/%Y')
-            else:
-                start_date = datetime.strptime(date, '%m/%d/%Y')
-        # Else, set the start and end dates to the same date
-        else:
-            start_date = datetime.strptime(date, '%m/%d/%Y')
-            end_date = datetime.strptime(date, '%m/%d/%Y')
-
-    # Extract the start and end times of an event
-    pattern = re.compile(TIME_REGEX)
-    for match in re.finditer(pattern, raw_date_time):
-        time = match.group()
-        if start_time:
-            end_time = datetime.strptime(time, '%I:%M %p')
-        else:
-            start_time = datetime.strptime(time, '%I:%M %p')
-
-    # If end_date is None, set it to start_date
-    if not end_date:
-        end_date = start_date
-
-    # If end_time is None, set it to two hours after start_time
-    if not end_time:
-        end_time = start_time + timedelta(hours=2)
-
-    # Combine the start/end dates & start/end times into datetime objects
-    start = datetime.combine(start_date.date(), start_time.time())
-    end = datetime.combine(end_date.date(), end_time.time())
-
-    # Add timezones to the datetime objects
-    start_w_timezone = timezone(tz).localize(start)
-    end_w_timezone = timezone(tz).localize(end)
-
-    # Return the event start datetime and event end datetime, both formatted as: MM/DD/YYYY HH:MM AM/PM UTC-OFFSET
-    return start_w_timezone.strftime('%m/%d/%Y %I:%M %p %Z%z'), end_w_timezone.strftime('%m/%d/%Y %I:%M %p %Z%z')
+    return EventParser(tz).extract_date_time(raw_date_time)
 
 
 def extract_contact_info(raw_contact):
@@ -478,27 +978,7 @@ def extract_contact_info(raw_contact):
         A dictionary containing contact information (name, phone number, email)
     """
 
-    parsed_data = {}
-
-    # Extract the name of the contact
-    contact_names = re.findall(CONTACT_NAME_REGEX, raw_contact, flags=re.MULTILINE)
-    if contact_names:
-        parsed_data['name'] = '\n'.join(contact_names)
-
-    # Extract the email of the contact
-    pattern = re.compile(EMAIL_REGEX)
-    for match in re.finditer(pattern, raw_contact):
-        email = match.group()
-        parsed_data['email'] = email
-
-    # Extract the phone number of the contact
-    pattern = re.compile(PHONE_NUMBER_REGEX)
-    for match in re.finditer(pattern, raw_contact):
-        phone_number = match.group()
-        parsed_data['phone_number'] = phone_number
-
-    # Return the extracted contact info dictionary
-    return parsed_data
+    return EventParser.extract_contact_info(raw_contact)
 
 
 def format_attribute(attr):
@@ -533,26 +1013,32 @@ def print_event(evt):
     for attr in ['location', 'contact', 'description']:
 
         # If the event has this attribute, add to the print string
-        if evt.__dict__[attr]:
+        if getattr(evt, attr):
 
             # If the attribute is contact info, add the contact info's keys and values to the print string
             if attr == 'contact':
                 print_str += 'Contact:\n'
-                for label, value in evt.__dict__[attr].items():
+                for label, value in getattr(evt, attr).items():
                     print_str += '  {:<{fill}} {}\n'.format(format_attribute(label) + ':', value,
                                                             fill=max(map(len, evt.contact.keys())) + 1)
                 else:
                     print_str += '\n'
             # Else, add the attribute and its value to the print string
             else:
-                print_str += '{}:\n{}\n\n'.format(format_attribute(attr), evt.__dict__[attr])
+                print_str += '{}:\n{}\n\n'.format(format_attribute(attr), getattr(evt, attr))
 
     # If the event has additional info, add its keys and values to the print string
-    if evt.__dict__['additional_info']:
+    if evt.additional_info:
         print_str += 'Additional Info:\n'
         for label, value in evt.additional_info.items():
             print_str += '  {:<{fill}} {}\n'.format(label+':', value, fill=max(map(len, evt.additional_info.keys()))+1)
 
+    # If the event was listed more than once, add the start and end of each occurrence to the print string
+    if getattr(evt, 'occurrences', None):
+        print_str += '\nOccurrences:\n'
+        for start, end in evt.occurrences:
+            print_str += '  {} - {}\n'.format(start, end)
+
     # Print the print string
     print(print_str.strip())
 
@@ -586,35 +1072,26 @@ def export_json(events, export_file_path):
     export_file_path : str
         The destination file path of the JSON file to be written/overwritten.
     """
-    with open(export_file_path, 'w') as f:
-        json.dump({'events': events}, f, indent=4)
 
+    with JSONEventWriter(export_file_path) as writer:
+        for evt in events:
+            writer.write_dict(evt)
 
-def convert_dict_to_xml(parent, dictionary):
-    """Convert a dictionary to a set of nested XML elements.
+
+def export_ndjson(events, export_file_path):
+    """Export a list of events to a newline-delimited JSON file.
 
     Parameters
     ----------
-    parent : Element
-        The XML element that this XML element will be nested in.
-    dictionary : dict
-        The dictionary that will be converted to a set of nested XML elements.
+    events : list
+        A list of events to be exported to a newline-delimited JSON file.
+    export_file_path : str
+        The destination file path of the newline-delimited JSON file to be written/overwritten.
     """
 
-    # Loop through all key-value pairs in this dictionary
-    for key, value in dictionary.items():
-        # If this key has no value associated with it, continue to the next key
-        if not value:
-            continue
-        # Create a new XML element with this key and nest it within the parent element
-        element = ET.SubElement(parent, key)
-        # If the value is a dictionary, recursively call this method
-        # and have the converted dictionary be nested within element
-        if isinstance(value, dict):
-            convert_dict_to_xml(element, value)
-        # Otherwise, set value to be this element's text value
-        else:
-            element.text = value
+    with NDJSONEventWriter(export_file_path) as writer:
+        for evt in events:
+            writer.write_dict(evt)
 
 
 def export_xml(events, export_file_path):
@@ -628,20 +1105,9 @@ def export_xml(events, export_file_path):
         The destination file path of the XML file to be written/overwritten.
     """
 
-    # Have an <events> element be the root element
-    root = ET.Element('events')
-
-    # Loop through all events in the event list, convert them into XML elements, and nest them within the root element
-    for evt in events:
-        # Create an XML element called <event>
-        evt_element = ET.SubElement(root, 'event')
-        # Convert the event and its information within <event>
-        convert_dict_to_xml(evt_element, evt)
-
-    # `Prettify` the XML text, with each level deep being indented
-    xml_str = minidom.parseString(ET.tostring(root)).toprettyxml(indent='  ')
-    with open(export_file_path, 'w') as xml_file:
-        xml_file.write(xml_str)
+    with XMLEventWriter(export_file_path) as writer:
+        for evt in events:
+            writer.write_dict(evt)
 
 
 def export_yaml(events, export_file_path):
@@ -655,41 +1121,91 @@ def export_yaml(events, export_file_path):
         The destination file path of the YAML file to be written/overwritten.
     """
 
-    with open(export_file_path, 'w') as yaml_file:
-        yaml.dump({'events': events}, yaml_file, default_flow_style=False)
+    with YAMLEventWriter(export_file_path) as writer:
+        for evt in events:
+            writer.write_dict(evt)
 
 
-def export_events(events, config):
-    """Export a list of events to a file.
+def export_parquet(events, export_file_path):
+    """Export a list of events to a Parquet file.
+
+    Parameters
+    ----------
+    events : list
+        A list of events to be exported to a Parquet file.
+    export_file_path : str
+        The destination file path of the Parquet file to be written/overwritten.
+    """
+
+    with ParquetEventWriter(export_file_path) as writer:
+        for evt in events:
+            writer.write_dict(evt)
+
+
+def export_arrow(events, export_file_path):
+    """Export a list of events to an Arrow IPC file.
 
     Parameters
     ----------
     events : list
-        A list of events to be exported.
+        A list of events to be exported to an Arrow IPC file.
+    export_file_path : str
+        The destination file path of the Arrow IPC file to be written/overwritten.
+    """
+
+    with ArrowEventWriter(export_file_path) as writer:
+        for evt in events:
+            writer.write_dict(evt)
+
+
+def open_event_writer(config):
+    """Open a writer that exports events to a file one at a time, as they are scraped.
+
+    Parameters
+    ----------
     config : Configuration
         Configuration settings for exporting events.
 
+    Returns
+    -------
+    EventWriter
+        A writer for the export file type, writing to the export file path.
+
     Raises
     ------
     OverwriteExistingFileError
-        If the file to export to already exists and configuration settings disabled overwriting.
+        If the file to export to already exists and configuration settings disabled overwriting (unless resuming a
+        crawl, whose export is rewritten starting with the checkpointed events).
     """
 
     # If the program is not allowed to overwrite an existing file, raise an OverwriteExistingFileError
-    if not config.overwrite and os.path.isfile(config.export_path):
+    if not config.overwrite and not config.resume and os.path.isfile(config.export_path):
         raise OverwriteExistingFileError('`{}` already exists.'.format(config.export_path))
 
     # If the directories along the export file path does not exist, create them
-    os.makedirs(os.path.dirname(config.export_path), exist_ok=True)
+    if os.path.dirname(config.export_path):
+        os.makedirs(os.path.dirname(config.export_path), exist_ok=True)
+
+    # Open the writer for the export file extension (.json, .ndjson/.jsonl, .xml, .yaml/.yml, .parquet, .arrow)
+    return EVENT_WRITERS[config.export_extension](config.export_path)
+
 
-    # If the export file extension is .json, export events to a JSON file
-    if config.export_extension == 'json':
-        export_json([evt.__dict__ for evt in events], config.export_path)
+def export_events(events, config):
+    """Export events to a file, writing each event as it arrives.
 
-    # If the export file extension is .xml, export events to an XML file
-    elif config.export_extension == 'xml':
-        export_xml([evt.__dict__ for evt in events], config.export_path)
+    Parameters
+    ----------
+    events : iterable
+        The events to be exported (a list, or a stream of events such as UBEventsCalendarScraper.iter_events()).
+    config : Configuration
+        Configuration settings for exporting events.
+
+    Raises
+    ------
+    OverwriteExistingFileError
+        If the file to export to already exists and configuration settings disabled overwriting.
+    """
 
-    # If the export file extension is .yaml/.yml, export events to a YAML file
-    elif config.export_extension in {'yaml', 'yml'}:
-        export_yaml([evt.__dict__ for evt in events], config.export_path)
+    with open_event_writer(config) as writer:
+        for evt in events:
+            writer.write(evt)
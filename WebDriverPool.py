@@ -0,0 +1,188 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from selenium.common.exceptions import WebDriverException, TimeoutException
+from urllib3.exceptions import HTTPError
+
+
+class WebDriverPool:
+    """
+    A pool of web scraper sessions (each with its own WebDriver) shared by a set of worker threads
+
+    Each worker thread lazily creates its own session and keeps it for the lifetime of the pool. Before a task is
+    run, the worker's session is health checked (at most once every `health_check_interval` seconds) and replaced
+    if it no longer responds.
+
+    Attributes
+    ----------
+    size : int
+        number of worker threads (and sessions)
+    create_session : function
+        function() that creates a new web scraper session
+    worker_timeout : int
+        number of seconds a single task may run before its session is torn down and the task fails
+    health_check_interval : int
+        minimum number of seconds between health checks of a session (0 disables health checks)
+
+    Methods
+    -------
+    map(func, items)
+        run func(session, item) on every item, spread across the worker threads
+    quit()
+        quits every session and stops the worker threads
+    """
+
+    def __init__(self, size, create_session, worker_timeout=60, health_check_interval=30):
+        """
+        Parameters
+        ----------
+        size : int
+            Number of worker threads (and sessions)
+        create_session : function
+            Function() that creates a new web scraper session
+        worker_timeout : int
+            Number of seconds a single task may run before it fails (default 60 seconds)
+        health_check_interval : int
+            Minimum number of seconds between health checks of a session, 0 to disable (default 30 seconds)
+        """
+
+        self.size = size
+        self.create_session = create_session
+        self.worker_timeout = worker_timeout
+        self.health_check_interval = health_check_interval
+        self._executor = ThreadPoolExecutor(max_workers=size, thread_name_prefix='webdriver-worker')
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._sessions = []
+
+    def _new_session(self):
+        # Create a session for the current worker thread and keep track of it so that it can be quit later
+        session = self.create_session()
+        with self._lock:
+            self._sessions.append(session)
+        self._local.session = session
+        self._local.last_checked = time.monotonic()
+        return session
+
+    def _discard_session(self, session):
+        with self._lock:
+            if session in self._sessions:
+                self._sessions.remove(session)
+        try:
+            session.quit()
+        except (WebDriverException, HTTPError, OSError):
+            pass
+
+    @staticmethod
+    def is_healthy(session):
+        """Sees whether or not a session still responds.
+
+        Parameters
+        ----------
+        session : Scraper
+            The session to check
+
+        Returns
+        -------
+        bool
+            True -- if the session's browser responds
+            False -- otherwise
+        """
+
+        try:
+            session.browser.window_handles
+        except (WebDriverException, HTTPError, OSError):
+            return False
+        return True
+
+    def _get_session(self):
+        # If this worker has no session yet, or its session was torn down after timing out, create a new one
+        session = getattr(self._local, 'session', None)
+        with self._lock:
+            discarded = session not in self._sessions
+        if discarded:
+            return self._new_session()
+
+        # If a health check is due and the session no longer responds, replace it
+        if self.health_check_interval and time.monotonic() - self._local.last_checked >= self.health_check_interval:
+            self._local.last_checked = time.monotonic()
+            if not self.is_healthy(session):
+                self._discard_session(session)
+                return self._new_session()
+        return session
+
+    def _run(self, func, item, active):
+        session = self._get_session()
+        # Start the task's clock once it has a session, so that its timeout does not count the wait for a worker
+        active[id(item)] = (session, time.monotonic())
+        try:
+            return func(session, item)
+        except (WebDriverException, HTTPError):
+            # The session may be broken, so have the next task on this worker check it first
+            self._local.last_checked = float('-inf')
+            raise
+        finally:
+            active.pop(id(item), None)
+
+    def map(self, func, items):
+        """Run func(session, item) on every item, spread across the worker threads.
+
+        Parameters
+        ----------
+        func : function
+            Function(session, item) to run on every item
+        items : list
+            The items to run `func` on
+
+        Returns
+        -------
+        list
+            The return values of `func`, in the same order as `items`
+
+        Raises
+        ------
+        TimeoutException
+            If a task takes longer than `worker_timeout` seconds (from when it starts running). The stuck session
+            is torn down, so that its worker starts a new one, and the tasks that have not started are cancelled.
+        """
+
+        active = {}
+        futures = [(item, self._executor.submit(self._run, func, item, active)) for item in items]
+        pending = {future for _, future in futures}
+        while pending:
+            # Wait until a task finishes, or until the earliest deadline of the running tasks
+            now = time.monotonic()
+            deadlines = [started_at + self.worker_timeout for _, started_at in list(active.values())]
+            done, pending = wait(pending, timeout=max(0, min(deadlines, default=now + self.worker_timeout) - now),
+                                 return_when=FIRST_COMPLETED)
+
+            # If a task failed, give up on the tasks that have not started
+            for future in done:
+                if future.exception() is not None:
+                    for other in pending:
+                        other.cancel()
+                    raise future.exception()
+
+            # If a task is past its deadline, tear down its stuck session so its worker is released, then give up
+            now = time.monotonic()
+            for item, future in futures:
+                task = active.get(id(item))
+                if future in pending and task is not None and now - task[1] >= self.worker_timeout:
+                    for other in pending:
+                        other.cancel()
+                    self._discard_session(task[0])
+                    raise TimeoutException('Worker timed out after {} seconds'.format(self.worker_timeout))
+
+        return [future.result() for _, future in futures]
+
+    def quit(self):
+        """Quits every session and stops the worker threads."""
+
+        self._executor.shutdown(wait=False)
+        with self._lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            try:
+                session.quit()
+            except (WebDriverException, HTTPError, OSError):
+                pass
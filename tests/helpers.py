@@ -0,0 +1,115 @@
+import re
+from CalendarServer import CalendarServer
+from Configuration import Configuration
+from Event import Event
+from UBEventsCalendarScraper import UBEventsCalendarScraper
+
+
+# Link of a recurring event, listed once per date
+LINK = 'https://calendar.buffalo.edu/event/recurring'
+DATES = ['03/01/2024', '03/08/2024', '03/15/2024']
+
+
+def listing(date, title='Weekly Yoga Session'):
+    """Make one listing of the recurring event, from 10 to 11 AM on a date."""
+
+    return Event(title, LINK, '{} 10:00 AM EST-0500'.format(date), '{} 11:00 AM EST-0500'.format(date))
+
+
+def make_events(count=5):
+    """Make deep scraped events with distinct links, the fourth of which was listed twice."""
+
+    events = []
+    for i in range(count):
+        evt = Event('Event {}'.format(i), 'https://calendar.buffalo.edu/event/{}'.format(i),
+                    '03/0{}/2019 10:00 AM EST-0500'.format(i + 1), '03/0{}/2019 11:00 AM EST-0500'.format(i + 1))
+        evt.description = 'Description {}'.format(i)
+        evt.location = 'Student Union' if i % 2 else None
+        evt.contact = {'name': 'Contact {}'.format(i), 'email': 'contact{}@buffalo.edu'.format(i)}
+        events.append(evt)
+    if count > 3:
+        events[3].add_occurrence(Event('Event 3', events[3].link, '03/11/2019 10:00 AM EST-0500', None))
+    return events
+
+
+def summarize(events):
+    """Summarize the scraped fields of events, so that two scrapes can be compared."""
+
+    return [(evt.link, evt.start, evt.description, evt.occurrences) for evt in events]
+
+
+class RecurringCalendarServer(CalendarServer):
+    """Synthetic calendar whose events all link to a handful of event pages, as recurring events do."""
+
+    def render_list_page(self, page):
+        html = CalendarServer.render_list_page(self, page)
+        if html is None:
+            return None
+        return re.sub(r'/event/(\d+)', lambda match: '/event/{}'.format(int(match.group(1)) % 7), html)
+
+
+def configure(server, end_page, deep_scrape=False, all_pages=False, **settings):
+    """Configure a web scraper for a synthetic calendar, over the `http` backend."""
+
+    return Configuration('chromedriver', True, deep_scrape, 0, end_page, all_pages, False, False, None, None, False,
+                         backend='http', base_url=server.url, **settings)
+
+
+def scrape(config):
+    """Scrape every event with a web scraper of its own, quitting it afterwards."""
+
+    scraper = UBEventsCalendarScraper(config)
+    try:
+        return scraper.scrape_events()
+    finally:
+        scraper.quit()
+
+
+class FakeChrome:
+    """Stands in for a Chrome session (with one tab), recording the commands sent to it."""
+
+    def __init__(self, driver_path, chrome_options=None, desired_capabilities=None):
+        self.options = chrome_options
+        self.capabilities = desired_capabilities
+        self.current_window_handle = 'main'
+        self.window_handles = ['main']
+        self.current_url = 'about:blank'
+        self.commands = []
+        # What the readiness script resolves with (or raises)
+        self.script_result = True
+
+    def set_script_timeout(self, timeout):
+        self.commands.append(('set_script_timeout', timeout))
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.commands.append((cmd, params))
+
+    def execute_script(self, script):
+        self.commands.append(('execute_script', script))
+        if script.startswith('window.open('):
+            self.window_handles.append('tab-{}'.format(len(self.window_handles)))
+
+    @property
+    def switch_to(self):
+        return self
+
+    def window(self, handle):
+        self.commands.append(('switch_to_window', handle))
+        self.current_window_handle = handle
+
+    def get(self, url):
+        self.commands.append(('get', url))
+        self.current_url = url
+
+    def execute_async_script(self, script, *args):
+        self.commands.append(('execute_async_script',) + args)
+        if isinstance(self.script_result, Exception):
+            raise self.script_result
+        return self.script_result
+
+    def find_element(self, by, value):
+        self.commands.append(('find_element', value))
+        return value
+
+    def quit(self):
+        pass
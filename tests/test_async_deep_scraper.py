@@ -0,0 +1,49 @@
+import threading
+import time
+import pytest
+from AsyncDeepScraper import AsyncDeepScraper
+from CalendarServer import CalendarServer
+from Event import Event
+from helpers import configure, scrape
+
+
+def test_concurrent_deep_scrape_matches_serial_deep_scrape():
+    with CalendarServer(pages=3, events_per_page=6) as server:
+        serial_events = scrape(configure(server, 3, deep_scrape=True))
+        concurrent_events = scrape(configure(server, 3, deep_scrape=True, concurrency=4))
+
+    assert [evt.to_dict() for evt in concurrent_events] == [evt.to_dict() for evt in serial_events]
+    assert all(evt.description for evt in concurrent_events)
+
+
+@pytest.mark.parametrize('per_host_concurrency, expected_peak', [(None, 4), (2, 2)])
+def test_event_pages_in_flight_are_bounded(per_host_concurrency, expected_peak):
+    scraped = []
+    scraper = AsyncDeepScraper(lambda page, evt: scraped.append(evt), concurrency=4,
+                               per_host_concurrency=per_host_concurrency)
+    in_flight = []
+    peak = []
+    lock = threading.Lock()
+    fetch = scraper.browser.fetch
+
+    def slow_fetch(url, cache=None):
+        with lock:
+            in_flight.append(url)
+            peak.append(len(in_flight))
+        time.sleep(0.05)
+        with lock:
+            in_flight.remove(url)
+        return fetch(url, cache)
+
+    scraper.browser.fetch = slow_fetch
+    with CalendarServer(pages=1, events_per_page=8) as server:
+        try:
+            # Deep scrape two list pages' worth of events on the same event loop
+            for page in range(2):
+                scraper.deep_scrape_events([Event('Event', server.url + 'event/{}'.format(page * 4 + i), None, None)
+                                            for i in range(4)])
+        finally:
+            scraper.close()
+
+    assert max(peak) == expected_peak
+    assert len(scraped) == 8
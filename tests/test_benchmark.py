@@ -0,0 +1,39 @@
+import sys
+import pytest
+import Benchmark
+from Benchmark import measure, compare
+
+
+BASELINE = {'extract_date_time': {'ops_per_sec': 1000, 'peak_bytes': 1000}}
+
+
+def run_main(monkeypatch, *args):
+    monkeypatch.setattr(sys, 'argv', ['Benchmark.py', '--events', '20', '--repeat', '1'] + list(args))
+    with pytest.raises(SystemExit) as exit_info:
+        Benchmark.main()
+    return exit_info.value.code
+
+
+def test_setup_runs_untimed_before_every_run():
+    calls = []
+    result = measure(lambda: calls.append('run'), 10, 3, setup=lambda: calls.append('setup'))
+    assert calls == ['setup', 'run'] * 4
+    assert result['ops_per_sec'] > 0
+
+
+@pytest.mark.parametrize('ops_per_sec, peak_bytes, regressed', [(900, 1100, False), (700, 1000, True),
+                                                                 (1000, 1300, True)])
+def test_results_past_the_threshold_are_regressions(ops_per_sec, peak_bytes, regressed):
+    results = {'extract_date_time': {'ops_per_sec': ops_per_sec, 'peak_bytes': peak_bytes},
+               'export_json': {'ops_per_sec': 1, 'peak_bytes': 10 ** 9}}
+    assert bool(compare(results, BASELINE, 0.2)) == regressed
+
+
+def test_gate_fails_without_a_baseline_and_passes_against_a_saved_one(tmp_path, monkeypatch, capsys):
+    baseline_path = str(tmp_path / 'baseline.json')
+    assert run_main(monkeypatch, '--baseline', baseline_path) == 1
+    assert 'No baseline found' in capsys.readouterr().out
+
+    assert run_main(monkeypatch, '--baseline', baseline_path, '--save-baseline') == 0
+    # A generous threshold keeps the check from depending on how busy the machine is
+    assert run_main(monkeypatch, '--baseline', baseline_path, '--threshold', '1000') == 0
@@ -0,0 +1,45 @@
+import os
+import pytest
+from selenium.common.exceptions import TimeoutException
+from UBEventsCalendarScraper import UBEventsCalendarScraper
+from helpers import RecurringCalendarServer, configure, scrape, summarize
+
+
+def configure_crawl(server, checkpoint_path, duplicates, resume=False):
+    return configure(server, 6, deep_scrape=True, all_pages=True, checkpoint_path=checkpoint_path,
+                     duplicates=duplicates, resume=resume)
+
+
+@pytest.mark.parametrize('duplicates', ['keep', 'collapse'])
+def test_interrupted_crawl_resumes_from_its_checkpoint(tmp_path, duplicates):
+    checkpoint_path = str(tmp_path / 'crawl.json')
+    with RecurringCalendarServer(pages=6, events_per_page=5) as server:
+        expected = scrape(configure_crawl(server, None, duplicates))
+
+        # Interrupt the crawl after its fourth page, checkpointing it as Driver does
+        scraper = UBEventsCalendarScraper(configure_crawl(server, checkpoint_path, duplicates))
+        next_page_button_exists = scraper.next_page_button_exists
+        pages = []
+
+        def interrupt_after_fourth_page():
+            pages.append(None)
+            if len(pages) == 4:
+                raise TimeoutException('interrupted')
+            return next_page_button_exists()
+
+        scraper.next_page_button_exists = interrupt_after_fourth_page
+        try:
+            with pytest.raises(TimeoutException):
+                scraper.scrape_events()
+            scraper.save_checkpoint()
+        finally:
+            scraper.quit()
+        # The snapshot only holds the crawl's cursor, and the listings are kept in the event log
+        snapshot_size = os.path.getsize(checkpoint_path)
+        assert snapshot_size < 200
+
+        resumed = scrape(configure_crawl(server, checkpoint_path, duplicates, resume=True))
+
+    assert summarize(resumed) == summarize(expected)
+    assert not os.path.exists(checkpoint_path)
+    assert not os.path.exists(checkpoint_path + '.events')
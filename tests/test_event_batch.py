@@ -0,0 +1,23 @@
+import pytest
+from EventBatch import EventBatch
+from helpers import make_events
+
+
+def test_batch_keeps_occurrences_of_collapsed_events():
+    events = make_events()
+    batch = EventBatch(events)
+
+    assert [evt.to_dict() for evt in batch] == [evt.to_dict() for evt in events]
+    assert batch.column('occurrences') == [evt.occurrences for evt in events]
+
+
+def test_batch_slices_into_a_new_batch():
+    events = make_events()
+    batch = EventBatch(events)
+
+    assert isinstance(batch[1:4], EventBatch)
+    assert [evt.to_dict() for evt in batch[1:4]] == [evt.to_dict() for evt in events[1:4]]
+    assert [evt.link for evt in batch[::-2]] == [evt.link for evt in events[::-2]]
+    assert batch[-1].link == events[-1].link
+    with pytest.raises(IndexError):
+        batch[-6]
@@ -0,0 +1,49 @@
+from Event import parse_timestamp
+from EventIndex import EventIndex
+from helpers import LINK, DATES, listing
+
+
+def day_range(date):
+    start = parse_timestamp('{} 12:00 AM EST-0500'.format(date))[0]
+    return start, start + 86400
+
+
+def test_every_listing_of_a_link_is_indexed():
+    events = [listing(date) for date in DATES]
+    index = EventIndex(events)
+
+    assert len(index) == 3
+    for date, evt in zip(DATES, events):
+        assert index.query(*day_range(date)) == [evt]
+        assert index.query(*day_range(date), keyword='yoga') == [evt]
+    assert index.query(keyword='yoga') == events
+    assert index.query() == events
+
+
+def test_collapsed_occurrences_are_each_indexed():
+    evt = listing(DATES[0])
+    for date in DATES[1:]:
+        evt.add_occurrence(listing(date))
+    index = EventIndex([evt])
+
+    assert len(index) == 1
+    for date in DATES:
+        assert index.query(*day_range(date)) == [evt]
+        assert index.query(*day_range(date), keyword='yoga') == [evt]
+    assert index.query(day_range(DATES[0])[0], day_range(DATES[-1])[1]) == [evt]
+
+
+def test_replacing_only_replaces_the_listing_at_the_same_time():
+    events = [listing(date) for date in DATES]
+    index = EventIndex(events)
+    changed = listing(DATES[1], title='Weekly Pilates Session')
+    index.add_events([changed], replace=True)
+
+    assert len(index) == 3
+    assert index.query(*day_range(DATES[1])) == [changed]
+    assert index.query(keyword='yoga') == [events[0], events[2]]
+    assert index.query(keyword='pilates') == [changed]
+
+    index.remove(LINK)
+    assert len(index) == 0
+    assert index.query() == []
@@ -0,0 +1,50 @@
+from selenium.webdriver.remote.webdriver import WebDriver
+from CalendarServer import CalendarServer
+from Event import Event
+from HTTPBrowser import HTMLDocument
+from UBEventsCalendarScraper import UBEventsCalendarScraper, EVENT_PAGE_SCRIPT
+
+
+class ScriptedDriver(WebDriver):
+    """Stands in for a Chrome session, answering the event page script for a parsed page and counting its calls."""
+
+    def __init__(self, page):
+        self.page = page
+        self.scripts = []
+
+    def execute_script(self, script, *args):
+        self.scripts.append(script)
+
+        def texts(xpath):
+            return [elem.text for elem in self.page.find_elements_by_xpath(xpath)]
+
+        def text(xpath):
+            elems = texts(xpath)
+            return elems[0] if elems else None
+
+        return {'description': text(".//div[@itemprop='description']"),
+                'location': text(".//section[@itemprop='location']/p"),
+                'contact': text(".//section[@class='event-detail-contact-person']/p"),
+                'labels': texts(".//div[@class='custom-field-label']"),
+                'values': texts(".//div[@class='custom-field-value']")}
+
+
+def test_rendered_event_page_fields_are_collected_in_one_script_call():
+    scraped_events = []
+    with CalendarServer(pages=1, events_per_page=10) as server:
+        for event_id in range(10):
+            link = 'https://calendar.buffalo.edu/event/{}'.format(event_id)
+            page = HTMLDocument(server.render_event_page(event_id), link)
+            expected = Event('Event', link, None, None)
+            UBEventsCalendarScraper.parse_event_page(page, expected)
+
+            driver = ScriptedDriver(page)
+            scraped = Event('Event', link, None, None)
+            UBEventsCalendarScraper.parse_event_page(driver, scraped)
+
+            assert driver.scripts == [EVENT_PAGE_SCRIPT]
+            assert scraped.to_dict() == expected.to_dict()
+            scraped_events.append(scraped)
+
+    assert all(evt.description and evt.location and evt.contact for evt in scraped_events)
+    assert any(evt.additional_info for evt in scraped_events)
@@ -0,0 +1,70 @@
+import random
+import re
+from datetime import datetime, timedelta
+from pytz import timezone
+from Benchmark import generate_raw_date_time, generate_raw_contact
+from EventParser import (EventParser, START_END_REGEX, ALL_DAY_REGEX, DATE_REGEX, TIME_REGEX, CONTACT_NAME_REGEX,
+                         PHONE_NUMBER_REGEX, EMAIL_REGEX)
+
+
+# The date & time and contact information parsers as they were before EventParser, which must give the same results
+
+def reference_extract_date_time(raw_date_time, tz):
+    start_date, end_date, start_time, end_time = None, None, None, None
+    if re.search(ALL_DAY_REGEX, raw_date_time):
+        start_time = datetime.strptime('12:00 AM', '%I:%M %p')
+        end_time = datetime.strptime('11:59 PM', '%I:%M %p')
+    for match in re.finditer(re.compile(DATE_REGEX), raw_date_time):
+        date = match.group()
+        if re.search(START_END_REGEX, raw_date_time):
+            if start_date:
+                end_date = datetime.strptime(date, '%m/%d/%Y')
+            else:
+                start_date = datetime.strptime(date, '%m/%d/%Y')
+        else:
+            start_date = datetime.strptime(date, '%m/%d/%Y')
+            end_date = datetime.strptime(date, '%m/%d/%Y')
+    for match in re.finditer(re.compile(TIME_REGEX), raw_date_time):
+        time = match.group()
+        if start_time:
+            end_time = datetime.strptime(time, '%I:%M %p')
+        else:
+            start_time = datetime.strptime(time, '%I:%M %p')
+    if not end_date:
+        end_date = start_date
+    if not end_time:
+        end_time = start_time + timedelta(hours=2)
+    start = timezone(tz).localize(datetime.combine(start_date.date(), start_time.time()))
+    end = timezone(tz).localize(datetime.combine(end_date.date(), end_time.time()))
+    return start.strftime('%m/%d/%Y %I:%M %p %Z%z'), end.strftime('%m/%d/%Y %I:%M %p %Z%z')
+
+
+def reference_extract_contact_info(raw_contact):
+    parsed_data = {}
+    contact_names = re.findall(CONTACT_NAME_REGEX, raw_contact, flags=re.MULTILINE)
+    if contact_names:
+        parsed_data['name'] = '\n'.join(contact_names)
+    for match in re.finditer(re.compile(EMAIL_REGEX), raw_contact):
+        parsed_data['email'] = match.group()
+    for match in re.finditer(re.compile(PHONE_NUMBER_REGEX), raw_contact):
+        parsed_data['phone_number'] = match.group()
+    return parsed_data
+
+
+def test_parser_matches_the_reference_parser():
+    rng = random.Random(0)
+    raw_date_times = [generate_raw_date_time(rng) for _ in range(2000)]
+    # Times around the daylight saving time changes
+    raw_date_times += ['03/10/2024 1:30 AM - 3:30 AM', '11/3/2024 12:00 AM - 11:59 PM', '3/10/2024 All Day']
+    raw_contacts = [generate_raw_contact(rng) for _ in range(2000)]
+
+    for tz in ('US/Eastern', 'UTC'):
+        parser = EventParser(tz)
+        expected = [reference_extract_date_time(raw, tz) for raw in raw_date_times]
+        assert [parser.extract_date_time(raw) for raw in raw_date_times] == expected
+        assert list(parser.extract_date_times(raw_date_times)) == expected
+
+    parser = EventParser()
+    expected = [reference_extract_contact_info(raw) for raw in raw_contacts]
+    assert [parser.extract_contact_info(raw) for raw in raw_contacts] == expected
+    assert list(parser.extract_contact_infos(raw_contacts)) == expected
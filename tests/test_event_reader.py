@@ -0,0 +1,17 @@
+import pytest
+from EventWriter import ParquetEventWriter, ArrowEventWriter
+from EventReader import read_events, read_event_table
+from helpers import make_events
+
+
+@pytest.mark.parametrize('writer_class, extension', [(ParquetEventWriter, 'parquet'), (ArrowEventWriter, 'arrow')])
+def test_columnar_exports_read_back_into_the_same_events(tmp_path, writer_class, extension):
+    path = str(tmp_path / 'events.{}'.format(extension))
+    events = make_events()
+    # Write more than one row group/record batch
+    with writer_class(path, flush_interval=2) as writer:
+        for evt in events:
+            writer.write(evt)
+
+    assert [evt.to_dict() for evt in read_events(path)] == [evt.to_dict() for evt in events]
+    assert read_event_table(path, ['link']).column('link').to_pylist() == [evt.link for evt in events]
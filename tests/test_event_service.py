@@ -0,0 +1,72 @@
+import json
+import threading
+from urllib.request import urlopen
+from CalendarServer import CalendarServer
+from EventService import EventService
+from UBEventsCalendarScraper import UBEventsCalendarScraper
+from helpers import configure
+
+
+# Number of seconds a test waits for the refresh thread before failing
+TIMEOUT = 10
+
+
+def test_failed_refresh_is_reported_and_refreshes_keep_their_schedule(monkeypatch):
+    scrape_events = UBEventsCalendarScraper.scrape_events
+    refresh = EventService.refresh
+    scrapes = []
+    results = []
+    refreshed = threading.Condition()
+    # Each refresh waits for the test to check on it before the next one may start
+    gate = threading.Semaphore(0)
+    ungated = threading.Event()
+
+    def flaky_scrape_events(scraper):
+        scrapes.append(None)
+        # Fail the second refresh the way an unparsable page would
+        if len(scrapes) == 2:
+            raise AttributeError("'NoneType' object has no attribute 'group'")
+        return scrape_events(scraper)
+
+    def gated_refresh(service):
+        result = refresh(service)
+        with refreshed:
+            results.append(result)
+            refreshed.notify_all()
+        if not ungated.is_set():
+            gate.acquire(timeout=TIMEOUT)
+        return result
+
+    def wait_for_refreshes(count):
+        with refreshed:
+            assert refreshed.wait_for(lambda: len(results) >= count, timeout=TIMEOUT)
+
+    def get_status():
+        return json.load(urlopen(service.url + 'status', timeout=TIMEOUT))
+
+    monkeypatch.setattr(UBEventsCalendarScraper, 'scrape_events', flaky_scrape_events)
+    monkeypatch.setattr(EventService, 'refresh', gated_refresh)
+    with CalendarServer(pages=2, events_per_page=5) as server:
+        with EventService(configure(server, 2, all_pages=True), refresh_interval=0.01, port=0) as service:
+            try:
+                wait_for_refreshes(1)
+                gate.release()
+
+                # The failed refresh is reported, and the previous events are still served
+                wait_for_refreshes(2)
+                status = get_status()
+                assert status['last_error'].startswith('AttributeError')
+                assert status['events'] == 10
+                gate.release()
+
+                # The refresh thread survives the failure and the next refresh succeeds
+                wait_for_refreshes(3)
+                status = get_status()
+                assert status['last_error'] is None
+                assert status['events'] == 10
+            finally:
+                # Stop gating the refreshes (letting the one in progress finish), so that the service can stop
+                ungated.set()
+                gate.release()
+
+    assert results[:3] == [True, False, True]
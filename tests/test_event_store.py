@@ -0,0 +1,30 @@
+from Event import Event
+from EventStore import EventStore
+from helpers import LINK, DATES, listing
+
+
+def test_every_listing_of_a_link_stays_unchanged(tmp_path):
+    store = EventStore(str(tmp_path / 'events.db'))
+    store.upsert([listing(date) for date in DATES])
+
+    # Scraping the same (unchanged) calendar twice finds every listing unchanged both times
+    for _ in range(2):
+        listings = [listing(date) for date in DATES]
+        assert all(map(store.is_unchanged, listings))
+        store.upsert(listings)
+
+    assert not store.is_unchanged(listing(DATES[1], title='Weekly Pilates Session'))
+    assert not store.is_unchanged(listing('03/22/2024'))
+    assert len(store.get_all()) == 3
+    assert store.get(LINK).start == listing(DATES[0]).start
+    assert store.get(LINK, listing(DATES[2]).start).start == listing(DATES[2]).start
+    store.close()
+
+
+def test_earliest_listing_is_ordered_by_time(tmp_path):
+    store = EventStore(str(tmp_path / 'events.db'))
+    starts = ['03/01/2024 01:00 PM EST-0500', '03/01/2024 10:00 AM EST-0500', '01/05/2025 10:00 AM EST-0500']
+    store.upsert([Event('Weekly Yoga Session', LINK, start, None) for start in starts])
+
+    assert store.get(LINK).start == starts[1]
+    store.close()
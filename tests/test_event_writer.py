@@ -0,0 +1,55 @@
+import json
+import xml.etree.ElementTree as ET
+from xml.dom import minidom
+import pytest
+import yaml
+from EventWriter import convert_dict_to_xml
+from Utility import export_json, export_ndjson, export_xml, export_yaml
+
+
+def make_event_dicts(count):
+    return [{'title': 'Event {}'.format(i), 'link': 'https://calendar.buffalo.edu/event/{}'.format(i),
+             'start': '03/0{}/2019 10:00 AM EST-0500'.format(i + 1),
+             'end': '03/0{}/2019 11:00 AM EST-0500'.format(i + 1),
+             'description': 'Description & <details> {}'.format(i), 'location': 'Student Union' if i % 2 else None,
+             'contact': {'name': 'Contact {}'.format(i)}, 'additional_info': {}}
+            for i in range(count)]
+
+
+# Each streaming export is written event by event, but must match the whole-file export it replaced
+
+def reference_json(evt_dicts):
+    return json.dumps({'events': evt_dicts}, indent=4)
+
+
+def reference_xml(evt_dicts):
+    root = ET.Element('events')
+    for evt_dict in evt_dicts:
+        convert_dict_to_xml(ET.SubElement(root, 'event'), evt_dict)
+    return minidom.parseString(ET.tostring(root)).toprettyxml(indent='  ')
+
+
+def reference_yaml(evt_dicts):
+    return yaml.dump({'events': evt_dicts}, default_flow_style=False)
+
+
+@pytest.mark.parametrize('count', [0, 1, 3])
+@pytest.mark.parametrize('export, reference, extension', [(export_json, reference_json, 'json'),
+                                                          (export_xml, reference_xml, 'xml'),
+                                                          (export_yaml, reference_yaml, 'yaml')])
+def test_streaming_exports_match_whole_file_exports(tmp_path, count, export, reference, extension):
+    path = str(tmp_path / 'events.{}'.format(extension))
+    evt_dicts = make_event_dicts(count)
+    export(evt_dicts, path)
+
+    with open(path) as f:
+        assert f.read() == reference(evt_dicts)
+
+
+def test_ndjson_export_writes_one_event_per_line(tmp_path):
+    path = str(tmp_path / 'events.ndjson')
+    evt_dicts = make_event_dicts(3)
+    export_ndjson(evt_dicts, path)
+
+    with open(path) as f:
+        assert [json.loads(line) for line in f] == evt_dicts
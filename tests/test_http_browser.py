@@ -0,0 +1,78 @@
+import socket
+import threading
+import pytest
+from urllib3.exceptions import MaxRetryError
+from CalendarServer import CalendarServer
+from HTTPBrowser import HTTPBrowser, HTTPStatusError
+from RateLimiter import RateLimiter, OVERLOAD_RETRIES
+from Utility import read_args
+
+
+class HangingServer:
+    """Accepts connections but never answers them, counting every connection."""
+
+    def __init__(self):
+        self.socket = socket.socket()
+        self.socket.bind(('127.0.0.1', 0))
+        self.socket.listen(32)
+        self.url = 'http://127.0.0.1:{}/'.format(self.socket.getsockname()[1])
+        self.connections = []
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self):
+        while True:
+            try:
+                connection, _ = self.socket.accept()
+            except OSError:
+                return
+            self.connections.append(connection)
+
+    def close(self):
+        self.socket.close()
+        for connection in self.connections:
+            connection.close()
+
+
+def test_rate_limited_requests_are_only_retried_by_the_rate_limiter():
+    server = HangingServer()
+    browser = HTTPBrowser(timeout=0.2, rate_limiter=RateLimiter(retry_backoff=0.01))
+    try:
+        with pytest.raises(MaxRetryError):
+            browser.request(server.url)
+    finally:
+        browser.quit()
+        server.close()
+
+    # Only the rate limiter retries a timed out request (urllib3 would otherwise retry every one of its attempts)
+    assert len(server.connections) == OVERLOAD_RETRIES + 1
+    assert browser.rate_limiter.failures == OVERLOAD_RETRIES + 1
+
+
+def test_pages_are_searched_and_followed_like_a_webdriver():
+    with CalendarServer(pages=2, events_per_page=3) as server:
+        browser = HTTPBrowser()
+        try:
+            browser.get(server.url)
+            links = [header.get_attribute('href') for header in browser.find_elements_by_xpath('.//h3/a')]
+            browser.find_element_by_class_name('icon-angle-right').click()
+            next_page = browser.current_url
+            next_links = [header.get_attribute('href') for header in browser.find_elements_by_xpath('.//h3/a')]
+
+            browser.open_tab(links[0])
+            assert browser.find_elements_by_class_name('accordion-header-link')
+            assert len(browser.window_handles) == 2
+
+            with pytest.raises(HTTPStatusError) as error:
+                browser.get(server.url + 'page/2')
+            assert error.value.status == 404
+        finally:
+            browser.quit()
+
+    assert links == [server.url + 'event/{}'.format(i) for i in range(3)]
+    assert next_page == server.url + 'page/1'
+    assert next_links == [server.url + 'event/{}'.format(i) for i in range(3, 6)]
+
+
+def test_backend_is_selected_from_the_command_line():
+    assert read_args(['Driver.py', '--path', 'chromedriver', '--backend', 'http']).backend == 'http'
+    assert read_args(['Driver.py', '--path', 'chromedriver']).backend == 'selenium'
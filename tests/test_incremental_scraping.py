@@ -0,0 +1,17 @@
+import pytest
+from helpers import RecurringCalendarServer, configure, scrape
+
+
+@pytest.mark.parametrize('duplicates', ['keep', 'collapse'])
+def test_unchanged_calendar_with_repeated_links_is_not_scraped_again(tmp_path, duplicates):
+    store_path = str(tmp_path / 'events.db')
+    with RecurringCalendarServer(pages=3, events_per_page=10) as server:
+        config = configure(server, 3, deep_scrape=True, all_pages=True, store_path=store_path, duplicates=duplicates)
+        first_run = scrape(config)
+        assert len({evt.link for evt in first_run}) == 7
+
+        requests = server.requests
+        assert scrape(config) == []
+        assert scrape(config) == []
+        # Each later run stops at the first (unchanged) list page without deep scraping anything
+        assert server.requests - requests == 2
@@ -0,0 +1,34 @@
+import pytest
+from CalendarServer import CalendarServer
+from UBEventsCalendarScraper import UBEventsCalendarScraper
+from helpers import configure, scrape, summarize
+
+
+@pytest.mark.parametrize('deep_scrape', [False, True])
+def test_streamed_events_match_a_full_scrape_in_order(deep_scrape):
+    with CalendarServer(pages=3, events_per_page=4) as server:
+        expected = scrape(configure(server, 3, deep_scrape=deep_scrape))
+
+        scraper = UBEventsCalendarScraper(configure(server, 3, deep_scrape=deep_scrape))
+        try:
+            streamed = list(scraper.iter_events())
+        finally:
+            scraper.quit()
+
+    assert summarize(streamed) == summarize(expected)
+    assert [evt.title for evt in streamed] == [evt.title for evt in expected]
+
+
+def test_events_are_yielded_before_the_next_page_is_loaded():
+    with CalendarServer(pages=3, events_per_page=4) as server:
+        scraper = UBEventsCalendarScraper(configure(server, 3))
+        try:
+            events = scraper.iter_events()
+            first_page = [next(events) for _ in range(4)]
+
+            # Only the first list page has been requested so far
+            assert server.requests == 1
+            assert len(first_page + list(events)) == 12
+            assert server.requests == 3
+        finally:
+            scraper.quit()
@@ -0,0 +1,60 @@
+from CalendarServer import CalendarServer
+from UBEventsCalendarScraper import UBEventsCalendarScraper, LIST_EVENTS_SCRIPT
+from helpers import configure
+
+
+class ScriptedBrowser:
+    """Stands in for Chrome, answering the list page script with the given results and counting its calls."""
+
+    def __init__(self, results):
+        self.results = results
+        self.scripts = []
+
+    def execute_script(self, script):
+        self.scripts.append(script)
+        return self.results
+
+
+def run_list_page_script(page):
+    # The list page script's results for a parsed list page, as Chrome would return them
+    results = []
+    for preview in page.find_elements_by_class_name('list-event-preview'):
+        header = preview.find_element_by_xpath('.//h3/a')
+        results.append({'title': header.text, 'link': header.get_attribute('href'),
+                        'date_time': preview.find_element_by_xpath('.//p').text})
+    return results
+
+
+def test_rendered_list_page_is_extracted_in_one_script_call():
+    with CalendarServer(pages=1, events_per_page=6) as server:
+        scraper = UBEventsCalendarScraper(configure(server, 1))
+        http_browser = scraper.browser
+        try:
+            expected = scraper.extract_list_page()
+            scraper.backend, scraper.browser = 'selenium', ScriptedBrowser(run_list_page_script(http_browser))
+            extracted = scraper.extract_list_page()
+            scripts = scraper.browser.scripts
+        finally:
+            scraper.backend, scraper.browser = 'http', http_browser
+            scraper.quit()
+
+    assert len(expected) == 6
+    assert extracted == expected
+    assert scripts == [LIST_EVENTS_SCRIPT]
+
+
+def test_previews_without_a_link_or_date_are_skipped():
+    with CalendarServer(pages=1, events_per_page=1) as server:
+        scraper = UBEventsCalendarScraper(configure(server, 1))
+        http_browser = scraper.browser
+        try:
+            scraper.backend, scraper.browser = 'selenium', ScriptedBrowser([
+                {'title': 'Open House', 'link': server.url + 'event/0', 'date_time': 'Friday, March 1, 2024'},
+                {'title': 'Untitled', 'link': None, 'date_time': 'Friday, March 1, 2024'},
+                {'title': 'Undated', 'link': server.url + 'event/1', 'date_time': None}])
+            extracted = scraper.extract_list_page()
+        finally:
+            scraper.backend, scraper.browser = 'http', http_browser
+            scraper.quit()
+
+    assert extracted == [('Open House', server.url + 'event/0', 'Friday, March 1, 2024')]
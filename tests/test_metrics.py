@@ -0,0 +1,49 @@
+import json
+from CalendarServer import CalendarServer
+from Metrics import Metrics, metrics
+from helpers import configure, scrape
+
+
+def test_histograms_keep_a_bounded_reservoir():
+    metrics = Metrics(max_samples=1000)
+    for value in range(100000):
+        metrics.observe('query_seconds', value)
+
+    summary = metrics.report()['histograms']['query_seconds']
+    assert len(metrics.histograms['query_seconds']) == 1000
+    assert (summary['count'], summary['sum'], summary['min'], summary['max']) == (100000, 4999950000, 0, 99999)
+    assert 40000 < summary['p50'] < 60000
+
+
+def test_histograms_are_exact_by_default():
+    metrics = Metrics()
+    for value in range(100):
+        metrics.observe('page_load_seconds', value)
+    shard = Metrics()
+    shard.observe('page_load_seconds', 100)
+    metrics.merge(shard.snapshot())
+
+    summary = metrics.report()['histograms']['page_load_seconds']
+    assert (summary['count'], summary['min'], summary['max'], summary['p50']) == (101, 0, 100, 50)
+
+
+def test_a_scrape_writes_a_run_report_of_each_phase(tmp_path):
+    metrics.reset()
+    with CalendarServer(pages=2, events_per_page=5) as server:
+        scrape(configure(server, 2, deep_scrape=True))
+    metrics.write_json(str(tmp_path / 'report.json'))
+    metrics.write_prometheus(str(tmp_path / 'metrics.prom'))
+
+    with open(str(tmp_path / 'report.json')) as f:
+        report = json.load(f)
+    assert report['counters']['pages_scraped'] == 2
+    assert report['counters']['events_scraped'] == 10
+    assert report['counters']['events_deep_scraped'] == 10
+    for phase in ['list_page_parse_seconds', 'extract_date_time_seconds', 'deep_scrape_seconds']:
+        assert report['histograms'][phase]['count'] > 0
+    assert report['histograms']['events_per_page']['p50'] == 5
+
+    with open(str(tmp_path / 'metrics.prom')) as f:
+        prometheus = f.read().splitlines()
+    assert 'ubcal_pages_scraped_total 2' in prometheus
+    assert 'ubcal_events_per_page_count 2' in prometheus
@@ -0,0 +1,83 @@
+from CalendarServer import CalendarServer
+from PageCache import PageCache
+from helpers import configure, scrape, summarize
+
+
+URL = 'https://calendar.buffalo.edu/event/1'
+
+
+class Server:
+    """Fake server that answers conditional requests with 304 Not Modified while a page has not changed."""
+
+    def __init__(self, body, etag):
+        self.body = body
+        self.etag = etag
+        self.requests = []
+
+    def download(self, headers):
+        self.requests.append(headers)
+        if headers.get('If-None-Match') == self.etag:
+            return 304, '', {}
+        return 200, self.body, {'ETag': self.etag}
+
+
+def test_fresh_pages_are_served_without_contacting_the_server(tmp_path):
+    cache = PageCache(str(tmp_path / 'cache.db'))
+    server = Server('<html>v1</html>', '"v1"')
+    try:
+        assert cache.fetch(URL, server.download) == '<html>v1</html>'
+        assert cache.fetch(URL, server.download) == '<html>v1</html>'
+        assert cache.get_fresh(URL) == '<html>v1</html>'
+    finally:
+        cache.close()
+
+    assert server.requests == [{}]
+    assert (cache.hits, cache.revalidations, cache.misses) == (2, 0, 1)
+
+
+def test_stale_pages_are_revalidated_and_only_downloaded_again_when_changed(tmp_path):
+    cache = PageCache(str(tmp_path / 'cache.db'), ttl=0)
+    server = Server('<html>v1</html>', '"v1"')
+    try:
+        assert cache.fetch(URL, server.download) == '<html>v1</html>'
+        assert cache.get_fresh(URL) is None
+
+        # The page has not changed, so the server only confirms that the cached copy is still good
+        assert cache.fetch(URL, server.download) == '<html>v1</html>'
+
+        server.body, server.etag = '<html>v2</html>', '"v2"'
+        assert cache.fetch(URL, server.download) == '<html>v2</html>'
+        assert cache.get(URL).etag == '"v2"'
+    finally:
+        cache.close()
+
+    assert server.requests == [{}, {'If-None-Match': '"v1"'}, {'If-None-Match': '"v1"'}]
+    assert cache.revalidations == 1
+
+
+def test_least_recently_used_pages_are_evicted_when_the_cache_is_full(tmp_path):
+    cache = PageCache(str(tmp_path / 'cache.db'), max_size=25)
+    try:
+        cache.put(URL + '0', 'x' * 10)
+        cache.put(URL + '1', 'x' * 10)
+        cache.get(URL + '0')
+        cache.put(URL + '2', 'x' * 10)
+
+        assert cache.get(URL + '0') is not None
+        assert cache.get(URL + '1') is None
+        assert cache.get(URL + '2') is not None
+    finally:
+        cache.close()
+
+
+def test_cached_event_pages_are_not_downloaded_again(tmp_path):
+    cache_path = str(tmp_path / 'cache.db')
+    with CalendarServer(pages=2, events_per_page=5) as server:
+        config = configure(server, 2, deep_scrape=True, cache_path=cache_path)
+        first_run = scrape(config)
+        requests = server.requests
+        second_run = scrape(config)
+
+        # Only the list pages are requested again
+        assert server.requests - requests == 2
+    assert summarize(second_run) == summarize(first_run)
@@ -0,0 +1,74 @@
+import threading
+import time
+import pytest
+from HTTPBrowser import HTTPStatusError
+from RateLimiter import RateLimiter
+
+
+def failing_load(failures, status=503):
+    calls = []
+
+    def load():
+        calls.append(time.monotonic())
+        if len(calls) <= failures:
+            raise HTTPStatusError('http://calendar.test/', status)
+        return 'page'
+    return load, calls
+
+
+def test_overloaded_page_loads_are_retried_with_exponential_backoff():
+    # An adaptive limiter without a rate paces nothing, so only the backoff spaces out the retries
+    limiter = RateLimiter(adaptive=True, retry_backoff=0.05)
+    load, calls = failing_load(2)
+
+    assert limiter.run(load) == 'page'
+    assert len(calls) == 3
+    assert calls[1] - calls[0] >= 0.05
+    assert calls[2] - calls[1] >= 0.1
+    assert limiter.failures == 2
+
+
+def test_other_errors_are_not_retried():
+    limiter = RateLimiter(retry_backoff=0.05)
+    load, calls = failing_load(1, status=404)
+
+    with pytest.raises(HTTPStatusError):
+        limiter.run(load)
+    assert len(calls) == 1
+    assert limiter.failures == 0
+
+
+def test_page_loads_are_paced_and_limited_in_flight():
+    limiter = RateLimiter(rate=50, burst=1, max_concurrency=2)
+    in_flight = []
+    peak = []
+    lock = threading.Lock()
+
+    def load():
+        with lock:
+            in_flight.append(None)
+            peak.append(len(in_flight))
+        time.sleep(0.02)
+        with lock:
+            in_flight.pop()
+
+    begin = time.monotonic()
+    threads = [threading.Thread(target=limiter.run, args=(load,)) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+
+    # 10 page loads at 50 per second (with a burst of 1) take at least 9 intervals of 20 ms
+    assert time.monotonic() - begin >= 0.18
+    assert max(peak) <= 2
+    assert limiter.requests == 10
+
+
+def test_adaptive_limiter_backs_off_when_overloaded():
+    limiter = RateLimiter(rate=10, max_concurrency=8, adaptive=True, retry_backoff=0)
+    load, _ = failing_load(1, status=429)
+
+    limiter.run(load)
+    assert limiter.backoffs == 1
+    assert limiter.rate == 5
@@ -0,0 +1,45 @@
+import pytest
+from selenium import webdriver
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException, WebDriverException
+from Scraper import Scraper
+from helpers import FakeChrome
+
+
+class StaleElement:
+    """Element of a page that has already been navigated away from."""
+
+    def is_enabled(self):
+        raise StaleElementReferenceException()
+
+
+@pytest.fixture
+def scraper(monkeypatch):
+    monkeypatch.setattr(webdriver, 'Chrome', FakeChrome)
+    return Scraper('chromedriver', timeout=1, poll_interval=0.01)
+
+
+def test_observer_readiness_waits_in_the_page_without_polling(scraper):
+    scraper.wait_for_class('list-event', stale_element=StaleElement())
+    assert scraper.browser.commands[-1] == ('execute_async_script', 'list-event', 1000)
+    # Scripts are given a little longer than the page timeout, so that the readiness script times out first
+    assert ('set_script_timeout', 2) in scraper.browser.commands
+
+
+def test_observer_readiness_times_out_when_the_element_never_loads(scraper):
+    scraper.browser.script_result = False
+    with pytest.raises(TimeoutException):
+        scraper.wait_for_class('list-event')
+    assert ('find_element', 'list-event') not in scraper.browser.commands
+
+
+def test_observer_readiness_polls_when_the_page_navigates_away_from_its_script(scraper):
+    scraper.browser.script_result = WebDriverException('javascript error: document unloaded while waiting for result')
+    scraper.wait_for_class('list-event')
+    assert scraper.browser.commands[-1] == ('find_element', 'list-event')
+
+
+def test_poll_readiness_only_polls(monkeypatch):
+    monkeypatch.setattr(webdriver, 'Chrome', FakeChrome)
+    scraper = Scraper('chromedriver', timeout=1, readiness='poll', poll_interval=0.01)
+    scraper.wait_for_class('list-event')
+    assert [command[0] for command in scraper.browser.commands] == ['set_script_timeout', 'find_element']
@@ -0,0 +1,42 @@
+from selenium import webdriver
+from Scraper import Scraper, RESOURCE_TYPE_PATTERNS
+from helpers import FakeChrome
+
+
+URL = 'https://calendar.buffalo.edu/event/1'
+
+
+def test_chrome_is_started_with_the_page_load_strategy_and_blocked_resources(monkeypatch):
+    monkeypatch.setattr(webdriver, 'Chrome', FakeChrome)
+    scraper = Scraper('chromedriver', page_load_strategy='eager', blocked_resources=['image', 'font'],
+                      blocked_urls=['*doubleclick.net*'])
+    blocked_urls = RESOURCE_TYPE_PATTERNS['image'] + RESOURCE_TYPE_PATTERNS['font'] + ['*doubleclick.net*']
+
+    assert scraper.browser.capabilities['pageLoadStrategy'] == 'eager'
+    assert scraper.browser.options.experimental_options['prefs'] == {
+        'profile.managed_default_content_settings.images': 2}
+    assert scraper.browser.commands[-2:] == [('Network.enable', {}), ('Network.setBlockedURLs', {'urls': blocked_urls})]
+
+
+def test_new_tabs_are_blocked_before_loading_their_page(monkeypatch):
+    monkeypatch.setattr(webdriver, 'Chrome', FakeChrome)
+    scraper = Scraper('chromedriver', blocked_urls=['*.css'])
+    del scraper.browser.commands[:]
+    scraper.open_url(URL, 'accordion-header-link', new_tab=True)
+
+    assert scraper.browser.commands[:5] == [('execute_script', "window.open('about:blank')"),
+                                            ('switch_to_window', scraper.opened_tab),
+                                            ('Network.enable', {}),
+                                            ('Network.setBlockedURLs', {'urls': ['*.css']}),
+                                            ('get', URL)]
+
+
+def test_nothing_is_blocked_by_default(monkeypatch):
+    monkeypatch.setattr(webdriver, 'Chrome', FakeChrome)
+    scraper = Scraper('chromedriver')
+    scraper.open_url(URL, 'accordion-header-link', new_tab=True)
+
+    assert scraper.browser.capabilities['pageLoadStrategy'] == 'normal'
+    assert 'prefs' not in scraper.browser.options.experimental_options
+    assert ('execute_script', "window.open('{}')".format(URL)) in scraper.browser.commands
+    assert not any(command[0].startswith('Network.') for command in scraper.browser.commands)
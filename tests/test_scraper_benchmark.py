@@ -0,0 +1,42 @@
+import json
+import sys
+from urllib.error import HTTPError
+from urllib.request import urlopen
+import pytest
+import ScraperBenchmark
+from CalendarServer import CalendarServer
+from helpers import configure, scrape
+
+
+def test_synthetic_calendar_serves_every_list_and_event_page():
+    with CalendarServer(pages=3, events_per_page=4) as server:
+        events = scrape(configure(server, 3, deep_scrape=True, all_pages=True))
+
+        with pytest.raises(HTTPError) as error:
+            urlopen(server.url + 'event/12')
+        assert error.value.code == 404
+
+    assert len(events) == 12
+    assert len({evt.link for evt in events}) == 12
+    assert all(evt.start and evt.description and evt.location for evt in events)
+
+
+def test_benchmark_reports_the_throughput_of_each_setting(tmp_path, monkeypatch, capsys):
+    report_path = str(tmp_path / 'report.json')
+    monkeypatch.setattr(sys, 'argv', ['ScraperBenchmark.py', '--path', str(tmp_path / 'chromedriver'),
+                                      '--pages', '2', '--events', '3', '--backends', 'http,selenium',
+                                      '--concurrency', '1', '--output', report_path])
+    ScraperBenchmark.main()
+
+    with open(report_path) as f:
+        report = json.load(f)
+    http_result, selenium_result = report['results']
+    assert (report['pages'], report['events_per_page']) == (2, 3)
+    assert http_result['backend'] == 'http'
+    assert min(http_result['pages_per_sec'], http_result['events_per_sec'], http_result['deep_scrapes_per_sec']) > 0
+    assert http_result['peak_rss_kib'] > 0
+
+    # A setting that cannot run (here, without a chromedriver) is reported instead of stopping the benchmark
+    assert selenium_result['backend'] == 'selenium'
+    assert 'WebDriverException' in selenium_result['error']
+    assert 'selenium' in capsys.readouterr().out
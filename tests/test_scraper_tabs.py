@@ -0,0 +1,44 @@
+from CalendarServer import CalendarServer
+from HTTPBrowser import HTTPBrowser
+from Scraper import Scraper
+
+
+class WarmBrowser(HTTPBrowser):
+    """HTTP browser with a tab of an earlier run open, listing its tabs newest first (Chrome does not order them)."""
+
+    @property
+    def window_handles(self):
+        return list(reversed(list(self._tabs)))
+
+
+def open_warm_scraper():
+    scraper = Scraper('chromedriver', backend='http')
+    scraper.browser.__class__ = WarmBrowser
+    scraper.browser._tabs['earlier-run'] = None
+    scraper.initial_tabs.add('earlier-run')
+    return scraper
+
+
+def test_new_tab_is_closed_by_its_handle():
+    with CalendarServer(pages=1, events_per_page=1) as server:
+        scraper = open_warm_scraper()
+        scraper.open_url(server.url + 'event/0', 'accordion-header-link', new_tab=True)
+        assert scraper.browser.current_window_handle == scraper.opened_tab
+        assert scraper.opened_tab not in scraper.initial_tabs
+
+        scraper.close_tab()
+
+    assert set(scraper.browser.window_handles) == scraper.initial_tabs
+    assert scraper.browser.current_window_handle == scraper.main_tab
+
+
+def test_worker_tab_is_the_tab_it_opened():
+    with CalendarServer(pages=1, events_per_page=2) as server:
+        scraper = open_warm_scraper()
+        for event_id in range(2):
+            scraper.open_in_worker_tab(server.url + 'event/{}'.format(event_id), 'accordion-header-link')
+            scraper.switch_to_main_tab()
+
+    assert scraper.worker_tab not in scraper.initial_tabs
+    assert set(scraper.browser.window_handles) == scraper.initial_tabs | {scraper.worker_tab}
+    assert scraper.browser._tabs['earlier-run'] is None
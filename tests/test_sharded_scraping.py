@@ -0,0 +1,39 @@
+import pytest
+from CalendarServer import CalendarServer
+from ShardedScraper import scrape_sharded
+from helpers import RecurringCalendarServer, configure, scrape, summarize
+
+
+@pytest.mark.parametrize('all_pages', [True, False])
+def test_shards_jump_straight_to_their_pages(all_pages):
+    with CalendarServer(pages=40, events_per_page=5) as server:
+        serial_events = scrape(configure(server, 40, all_pages=all_pages))
+        serial_requests = server.requests
+
+        sharded_events = scrape_sharded(configure(server, 40, all_pages=all_pages, shards=4, shard_pages=5))
+        sharded_requests = server.requests - serial_requests
+
+    assert [evt.link for evt in sharded_events] == [evt.link for evt in serial_events]
+    # Every shard loads the first page to find its own, rather than clicking through every page before its own
+    assert serial_requests == 40
+    assert sharded_requests <= 40 + 2 * 12
+
+
+def test_rate_limited_shards_report_their_rate_limiters():
+    with CalendarServer(pages=8, events_per_page=5) as server:
+        limiter_summaries = []
+        events = scrape_sharded(configure(server, 40, shards=2, rate_limit=1000), limiter_summaries)
+
+    assert len(events) == 40
+    assert len(limiter_summaries) == 2
+    assert all(summary.startswith('Rate limiter: ') for summary in limiter_summaries)
+
+
+@pytest.mark.parametrize('duplicates', ['keep', 'collapse'])
+def test_sharded_scrape_handles_repeated_listings_like_a_serial_scrape(duplicates):
+    with RecurringCalendarServer(pages=6, events_per_page=5) as server:
+        serial_events = scrape(configure(server, 6, deep_scrape=True, duplicates=duplicates))
+        sharded_events = scrape_sharded(configure(server, 6, deep_scrape=True, duplicates=duplicates, shards=3))
+
+    assert len(serial_events) == (30 if duplicates == 'keep' else 7)
+    assert summarize(sharded_events) == summarize(serial_events)
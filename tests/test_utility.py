@@ -0,0 +1,13 @@
+import pytest
+from Utility import get_arg_value, read_args, InvalidArgumentsError
+
+
+def test_flag_values_are_converted():
+    assert get_arg_value(['Driver.py', '--concurrency', '4'], '--concurrency', int, 1) == 4
+    assert get_arg_value(['Driver.py'], '--concurrency', int, 1) == 1
+
+
+@pytest.mark.parametrize('flag, value', [('--concurrency', 'abc'), ('--shards', 'x'), ('--rate', 'fast')])
+def test_invalid_flag_values_name_the_flag(flag, value):
+    with pytest.raises(InvalidArgumentsError, match=flag):
+        read_args(['Driver.py', '--path', 'chromedriver', '--backend', 'http', flag, value])
@@ -0,0 +1,42 @@
+import threading
+import time
+import pytest
+from selenium.common.exceptions import TimeoutException
+from WebDriverPool import WebDriverPool
+
+
+class FakeSession:
+    """Stand-in for a web scraper session whose browser can get stuck until it is quit."""
+
+    def __init__(self):
+        self.window_handles = ['tab-0']
+        self.browser = self
+        self.quit_event = threading.Event()
+
+    def quit(self):
+        self.quit_event.set()
+
+
+def test_task_timeout_is_measured_from_when_the_task_starts():
+    sessions = []
+
+    def create_session():
+        sessions.append(FakeSession())
+        return sessions[-1]
+
+    def load(session, seconds):
+        # A stuck page load only returns once its session is torn down
+        session.quit_event.wait(seconds)
+
+    pool = WebDriverPool(2, create_session, worker_timeout=0.3, health_check_interval=0)
+    begin = time.monotonic()
+    with pytest.raises(TimeoutException):
+        pool.map(load, [0.25, 60, 0.25])
+    # The stuck task started right away, so it times out 0.3 seconds in (not 0.3 seconds after the wait for the
+    # first task), and its session is torn down
+    assert time.monotonic() - begin < 0.45
+    assert any(session.quit_event.is_set() for session in sessions)
+
+    # The stuck session was replaced, so the pool keeps working
+    assert pool.map(load, [0, 0]) == [None, None]
+    pool.quit()
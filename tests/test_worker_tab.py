@@ -0,0 +1,21 @@
+from CalendarServer import CalendarServer
+from UBEventsCalendarScraper import UBEventsCalendarScraper
+from helpers import configure, scrape, summarize
+
+
+def test_deep_scraping_in_a_worker_tab_matches_a_tab_per_event():
+    with CalendarServer(pages=2, events_per_page=4) as server:
+        expected = scrape(configure(server, 2, deep_scrape=True))
+
+        scraper = UBEventsCalendarScraper(configure(server, 2, deep_scrape=True, reuse_tabs=True))
+        try:
+            events = scraper.scrape_events()
+            tabs = list(scraper.browser.window_handles)
+            current_tab = scraper.browser.current_window_handle
+        finally:
+            scraper.quit()
+
+    assert summarize(events) == summarize(expected)
+    # Every event page was loaded in the one worker tab, next to the list page's tab
+    assert tabs == [scraper.main_tab, scraper.worker_tab]
+    assert current_tab == scraper.main_tab